@@ -3,11 +3,27 @@ Celery application configuration for DataForge background task processing.
 """
 import os
 from celery import Celery
+from kombu.serialization import register
 from app.config import get_settings
 
 # Get settings
 settings = get_settings()
 
+# Prefer orjson for task messages and results (large sample payloads); fall back to stdlib json
+try:
+    import orjson
+
+    register(
+        'orjson',
+        orjson.dumps,
+        orjson.loads,
+        content_type='application/x-orjson',
+        content_encoding='utf-8'
+    )
+    SERIALIZER = 'orjson'
+except ImportError:
+    SERIALIZER = 'json'
+
 # Create Celery app
 celery_app = Celery(
     "dataforge",
@@ -19,9 +35,9 @@ celery_app = Celery(
 # Configure Celery
 celery_app.conf.update(
     # Serialization
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer=SERIALIZER,
+    accept_content=['json', SERIALIZER],  # json kept for messages queued before orjson
+    result_serializer=SERIALIZER,
     
     # Timezone
     timezone='UTC',
@@ -35,6 +51,8 @@ celery_app.conf.update(
     task_routes={
         'app.services.celery_tasks.run_generation_task': {'queue': 'generation'},
         'app.services.celery_tasks.run_augmented_generation_task': {'queue': 'augmentation'},
+        'app.services.celery_tasks.run_single_augmentation': {'queue': 'augmentation'},
+        'app.services.celery_tasks.merge_augmentation_results': {'queue': 'augmentation'},
         'app.services.celery_tasks.cleanup_expired_results': {'queue': 'maintenance'},
     },
     
@@ -44,7 +62,16 @@ celery_app.conf.update(
     worker_disable_rate_limits=False,
     worker_max_tasks_per_child=100,  # Restart worker after 100 tasks to prevent memory leaks
     
+    # Broker connection pooling - sized for concurrent job submissions from API handlers
+    broker_pool_limit=50,
+    broker_connection_timeout=5,
+    broker_connection_retry_on_startup=True,
+    
     # Result backend configuration
+    redis_max_connections=settings.redis_max_connections,  # Shared pool for status polling and result writes
+    redis_socket_keepalive=True,  # Keep idle pooled connections from being dropped by NAT/load balancers
+    redis_socket_connect_timeout=5,
+    redis_socket_timeout=5,  # Fail a stalled status poll instead of hanging the request
     result_expires=7200,  # Results expire after 2 hours
     result_persistent=True,  # Persist results across broker restarts
     
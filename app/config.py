@@ -32,6 +32,12 @@ class Settings(BaseSettings):
         7200,
         description="Result expiration time in Redis (seconds)"
     )
+    redis_max_connections: int = Field(
+        100,
+        ge=1,
+        le=1000,
+        description="Size of the per-process Redis connection pool shared by status polling and result writes"
+    )
     
     # Job Processing Configuration
     max_samples_per_request: int = Field(
@@ -90,7 +96,13 @@ class Settings(BaseSettings):
         le=86400,
         description="Time in seconds before task results expire"
     )
-    
+    celery_heartbeat_ttl_seconds: int = Field(
+        30,
+        ge=5,
+        le=600,
+        description="Seconds since the last worker heartbeat before a worker is considered offline"
+    )
+
     # LLM Configuration
     openai_api_key: Optional[str] = Field(
         None, 
@@ -106,6 +118,12 @@ class Settings(BaseSettings):
         le=4000,
         description="Maximum tokens per generation"
     )
+    openai_context_window_tokens: int = Field(
+        128000,
+        ge=1000,
+        le=2000000,
+        description="Context window of the OpenAI model (prompt plus completion tokens)"
+    )
     openai_timeout_seconds: int = Field(
         60,
         ge=5,
@@ -122,6 +140,62 @@ class Settings(BaseSettings):
         description="Override completion token price per 1K tokens (USD)"
     )
     
+    # OpenAI Batch API (large jobs are submitted as one batch instead of per-sample calls)
+    openai_batch_api_enabled: bool = Field(
+        False,
+        description="Use the OpenAI Batch API for generation requests at or above the threshold"
+    )
+    openai_batch_api_threshold: int = Field(
+        50,
+        ge=1,
+        le=1000,
+        description="Minimum sample count for a request to be submitted through the Batch API"
+    )
+    openai_batch_poll_interval_seconds: float = Field(
+        10.0,
+        ge=0.1,
+        le=600.0,
+        description="Seconds between Batch API status polls"
+    )
+    openai_batch_max_wait_seconds: int = Field(
+        3600,
+        ge=60,
+        le=86400,
+        description="Maximum seconds to wait for a batch before cancelling it (also capped by the task's soft time limit)"
+    )
+    
+    # LLM Response Cache Configuration
+    llm_cache_max_entries: int = Field(
+        2048,
+        ge=0,
+        le=100000,
+        description="Maximum LLM responses kept in the semantic cache"
+    )
+    llm_cache_similarity_threshold: float = Field(
+        0.87,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for reusing a cached LLM response"
+    )
+    llm_cache_semantic_scan_limit: int = Field(
+        512,
+        ge=0,
+        le=100000,
+        description="Most recently used cached responses compared per semantic cache lookup"
+    )
+    embedding_model: str = Field(
+        "all-MiniLM-L6-v2",
+        description="sentence-transformers model used for local text embeddings"
+    )
+    
+    # Data Augmentation Configuration
+    augmentation_concurrency_limit: int = Field(
+        4,
+        ge=1,
+        le=64,
+        description="Maximum variants generated concurrently across all augmentation requests of a process"
+    )
+    
     # Rate Limiting Configuration
     openai_requests_per_minute: int = Field(
         60,
@@ -167,6 +241,14 @@ class Settings(BaseSettings):
         "support_request.j2",
         description="Default prompt template file"
     )
+    prompt_bytecode_cache_enabled: bool = Field(
+        True,
+        description="Persist compiled template bytecode so new processes skip parsing templates"
+    )
+    prompt_bytecode_cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for compiled template bytecode (default: per-user temp directory)"
+    )
     
     # Rate Limiting (for future implementation)
     rate_limit_per_minute: int = Field(
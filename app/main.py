@@ -10,9 +10,12 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
+from redis.utils import HIREDIS_AVAILABLE
 from app.config import get_settings, validate_settings
 from app.routers.generation import router as generation_router
 from app.services.job_store import get_job_store
+from app.services.celery_service import get_worker_heartbeat_monitor
+from app.utils.llm_client import close_llm_clients
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +50,14 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Job store stats unavailable: {e}")
         
+        # redis-py picks the C reply parser automatically when hiredis is importable;
+        # without it every status poll decodes backend replies in pure Python
+        if not HIREDIS_AVAILABLE:
+            logger.warning("hiredis is not installed; Redis replies will be parsed in pure Python")
+        
+        # Track worker liveness from heartbeat events instead of broadcast inspection
+        get_worker_heartbeat_monitor().start()
+        
         logger.info("DataForge API startup complete")
         
         yield  # Application runs here
@@ -57,7 +68,8 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup on shutdown
         logger.info("Shutting down DataForge API...")
-        # No legacy job manager to clean up
+        get_worker_heartbeat_monitor().stop()
+        await close_llm_clients()
         logger.info("DataForge API shutdown complete")
 
 
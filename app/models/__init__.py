@@ -3,6 +3,7 @@ Models package for Pydantic schemas and data validation.
 """
 from .schemas import (
     GenerationRequest,
+    AugStrategy,
     GeneratedSample,
     GenerationResponse,
     JobStatusResponse,
@@ -11,6 +12,7 @@ from .schemas import (
 
 __all__ = [
     "GenerationRequest",
+    "AugStrategy",
     "GeneratedSample", 
     "GenerationResponse",
     "JobStatusResponse",
@@ -2,7 +2,10 @@
 Pydantic models for request/response schemas and data validation.
 """
 from datetime import datetime
-from typing import List, Optional, Literal, Dict, Any
+from enum import IntFlag
+from functools import reduce
+from operator import or_
+from typing import Iterable, List, Optional, Literal, Dict, Any
 from pydantic import BaseModel, Field
 from pydantic import field_validator
 from pydantic.config import ConfigDict
@@ -47,6 +50,23 @@ class GenerationRequest(BaseModel):
         return cleaned.strip()
 
 
+class AugStrategy(IntFlag):
+    """Bitmask of augmentation strategies, packed into a single int for task payloads."""
+    
+    CDA = 1
+    ADA = 2
+    CADA = 4
+    
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "AugStrategy":
+        """Pack strategy names (e.g. ['CDA', 'ADA']) into a bitmask."""
+        return reduce(or_, (cls[name] for name in names), cls(0))
+    
+    def names(self) -> List[str]:
+        """Unpack the bitmask into strategy names in canonical order."""
+        return [strategy.name for strategy in AugStrategy if self & strategy]
+
+
 class GeneratedSample(BaseModel):
     """Model for a single generated text sample with metadata."""
     
@@ -3,9 +3,11 @@ FastAPI routes for text generation endpoints.
 """
 import asyncio
 import logging
-from typing import Dict, Any, List
+import orjson
+from contextlib import aclosing
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from app.models.schemas import (
     GenerationRequest, 
     JobStatusResponse, 
@@ -20,6 +22,9 @@ from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on ids per batch status lookup
+MAX_BATCH_STATUS_IDS = 100
+
 # Create router instance
 router = APIRouter(prefix="/api", tags=["generation"])
 
@@ -63,10 +68,8 @@ async def create_generation_job(
         job_store = get_job_store()
         job_id = job_store.create_generation_job(request)
         
-        # Return job status
-        job_status = job_store.get_status(job_id)
-        if not job_status:
-            raise HTTPException(status_code=500, detail="Failed to create job")
+        # Queued jobs have no backend record yet; answer without a status round-trip
+        job_status = job_store.get_pending_status(job_id)
         
         logger.info(f"Created Celery generation job {job_id}")
         return job_status
@@ -78,11 +81,47 @@ async def create_generation_job(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/generate/stream")
+async def stream_generation(request: GenerationRequest) -> StreamingResponse:
+    """
+    Generate samples in the API process and stream them as they complete.
+    
+    Each sample is written as one JSON line (NDJSON), so clients can consume results
+    before the batch finishes and the server never holds the whole batch in memory.
+    Samples are not quality-filtered; use /generate for filtered, tracked jobs.
+    
+    Args:
+        request: Generation parameters including product, count, and version
+        
+    Returns:
+        Streaming NDJSON response of generated samples
+        
+    Raises:
+        HTTPException: On validation errors
+    """
+    generation_service = get_generation_service()
+    validation = await generation_service.validate_generation_request(request)
+    
+    if not validation["valid"]:
+        error_message = "; ".join(validation["errors"])
+        raise HTTPException(status_code=400, detail=f"Invalid request: {error_message}")
+    
+    async def sample_lines():
+        async for sample in generation_service.stream_batch(request):
+            yield orjson.dumps(sample.model_dump(), option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+    
+    return StreamingResponse(sample_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/result/{job_id}", response_model=JobStatusResponse)
-async def get_job_result(job_id: str) -> JobStatusResponse:
+async def get_job_result(job_id: str) -> Response:
     """
     Get job status and results from Celery.
     
+    Completed jobs can carry hundreds of samples plus quality metadata, so the model
+    is serialized straight to JSON bytes by Pydantic's core serializer rather than
+    re-validated and encoded through an intermediate dict.
+    
     Args:
         job_id: Unique job identifier (Celery task ID)
         
@@ -99,7 +138,7 @@ async def get_job_result(job_id: str) -> JobStatusResponse:
         if not job_status:
             raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
         
-        return job_status
+        return Response(content=job_status.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         raise
@@ -108,6 +147,76 @@ async def get_job_result(job_id: str) -> JobStatusResponse:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/results", response_model=Dict[str, Optional[JobStatusResponse]])
+async def get_job_results(
+    job_ids: List[str] = Query(
+        ...,
+        max_length=MAX_BATCH_STATUS_IDS,
+        description="Job ids to look up (repeat the parameter for each id)"
+    )
+) -> Response:
+    """
+    Get the status of several jobs in one request.
+    
+    Dashboards tracking many jobs would otherwise poll /result once per job; all
+    lookups here share a single result-backend round-trip.
+    
+    Args:
+        job_ids: Job identifiers (Celery task IDs)
+        
+    Returns:
+        Mapping of job id to its status with results, or null if not found
+    """
+    try:
+        job_store = get_job_store()
+        statuses = job_store.get_statuses(job_ids)
+        
+        content = b"{" + b",".join(
+            orjson.dumps(job_id) + b":" + (status.model_dump_json().encode() if status else b"null")
+            for job_id, status in statuses.items()
+        ) + b"}"
+        return Response(content=content, media_type="application/json")
+        
+    except Exception as e:
+        logger.error(f"Failed to get job results: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/result/{job_id}/stream")
+async def stream_job_status(job_id: str) -> StreamingResponse:
+    """
+    Stream job status updates as they happen instead of polling /result.
+    
+    The current status is sent first, then one more line for every progress or state
+    change published by the workers; the stream ends once the job completes or fails.
+    Each status is written as one JSON line (NDJSON).
+    
+    Args:
+        job_id: Unique job identifier (Celery task ID)
+        
+    Returns:
+        Streaming NDJSON response of job statuses
+        
+    Raises:
+        HTTPException: If job not found
+    """
+    job_store = get_job_store()
+    updates = job_store.watch_status(job_id)
+    first_status = await anext(updates, None)
+    
+    if first_status is None:
+        await updates.aclose()
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    async def status_lines():
+        async with aclosing(updates):
+            yield first_status.model_dump_json().encode() + b"\n"
+            async for job_status in updates:
+                yield job_status.model_dump_json().encode() + b"\n"
+    
+    return StreamingResponse(status_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
     """
@@ -322,10 +431,8 @@ async def create_enhanced_generation_job(
             min_quality_score=min_quality_score
         )
         
-        # Return job status
-        job_status = job_store.get_status(job_id)
-        if not job_status:
-            raise HTTPException(status_code=500, detail="Failed to create enhanced job")
+        # Queued jobs have no backend record yet; answer without a status round-trip
+        job_status = job_store.get_pending_status(job_id)
         
         logger.info(f"Created enhanced generation job {job_id}")
         return job_status
@@ -397,10 +504,8 @@ async def create_augmented_generation_job(
             augment_ratio
         )
         
-        # Return job status
-        job_status = job_store.get_status(job_id)
-        if not job_status:
-            raise HTTPException(status_code=500, detail="Failed to create job")
+        # Queued jobs have no backend record yet; answer without a status round-trip
+        job_status = job_store.get_pending_status(job_id)
         
         logger.info(f"Created Celery augmented generation job {job_id} with strategies: {augmentation_strategies}")
         return job_status
@@ -526,7 +631,7 @@ async def get_generation_config() -> Dict[str, Any]:
         Available features, templates, and configuration options
     """
     try:
-        from app.services.prompt_service import get_template_service
+        from app.services.prompt_service import SENTIMENT_DESCRIPTIONS, get_template_service
         from app.services.data_augmentation_service import get_augmentation_service
         
         template_service = get_template_service()
@@ -548,13 +653,7 @@ async def get_generation_config() -> Dict[str, Any]:
             },
             "sentiment_intensity": {
                 "scale": "1-5",
-                "descriptions": {
-                    1: "Very Negative - Highly dissatisfied, angry, or frustrated",
-                    2: "Negative - Dissatisfied or disappointed",
-                    3: "Neutral - Balanced or indifferent", 
-                    4: "Positive - Satisfied or pleased",
-                    5: "Very Positive - Extremely satisfied, delighted, or enthusiastic"
-                }
+                "descriptions": dict(SENTIMENT_DESCRIPTIONS)
             },
             "tone_options": [
                 "frustrated", "polite", "urgent", "professional", "casual",
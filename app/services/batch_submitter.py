@@ -0,0 +1,138 @@
+"""
+OpenAI Batch API submission for large generation jobs.
+
+Prompts are uploaded as one JSONL file and processed server-side at reduced cost,
+replacing one HTTP round trip per sample with an upload and a polling loop.
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+import orjson
+from openai import AsyncOpenAI
+
+from app.config import get_settings
+from app.utils.llm_client import LLMException, get_llm_client
+
+logger = logging.getLogger(__name__)
+
+# Batch states after which polling stops
+_FINAL_BATCH_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _build_batch_jsonl(
+    prompts: List[str],
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int]
+) -> bytes:
+    """Serialize prompts as Batch API request lines; custom_id is the prompt index."""
+    lines = []
+    for index, prompt in enumerate(prompts):
+        body = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if max_tokens:
+            body["max_tokens"] = max_tokens
+        lines.append(orjson.dumps({
+            "custom_id": str(index),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }))
+    return b"\n".join(lines)
+
+
+def _parse_batch_output(output: str, count: int) -> List[Optional[str]]:
+    """Map Batch API output lines back to prompt order; failed requests become None."""
+    results: List[Optional[str]] = [None] * count
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+            continue
+        choices = response.get("body", {}).get("choices") or []
+        if choices:
+            content = (choices[0].get("message") or {}).get("content")
+            results[int(record["custom_id"])] = content.strip() if content else None
+    return results
+
+
+async def _cancel_batch(client: AsyncOpenAI, batch_id: str) -> None:
+    """Cancel a batch that will not be waited for; failures are only logged."""
+    try:
+        await client.batches.cancel(batch_id)
+        logger.info(f"Cancelled OpenAI batch {batch_id}")
+    except Exception as e:
+        logger.warning(f"Failed to cancel OpenAI batch {batch_id}: {e}")
+
+
+async def submit_batch(
+    prompts: List[str],
+    model: str,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+    client: Optional[AsyncOpenAI] = None,
+    max_wait_seconds: Optional[float] = None
+) -> List[Optional[str]]:
+    """
+    Run prompts through the OpenAI Batch API and wait for the results.
+
+    Args:
+        prompts: Prompts to complete
+        model: Chat completion model
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens per completion
+        client: OpenAI client (the shared client of the current event loop if omitted)
+        max_wait_seconds: Tighter wait limit than openai_batch_max_wait_seconds, e.g. to
+            finish before the calling task's time limit
+
+    Returns:
+        Completion per prompt, in prompt order; None where a request failed
+
+    Raises:
+        LLMException: If the batch fails, expires, or does not finish in time
+    """
+    settings = get_settings()
+    client = client or get_llm_client("openai").client
+    max_wait = settings.openai_batch_max_wait_seconds
+    if max_wait_seconds is not None:
+        max_wait = min(max_wait, max_wait_seconds)
+
+    batch_file = await client.files.create(
+        file=("batch.jsonl", _build_batch_jsonl(prompts, model, temperature, max_tokens)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} requests")
+
+    deadline = time.monotonic() + max_wait
+    try:
+        while batch.status not in _FINAL_BATCH_STATES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMException(f"OpenAI batch {batch.id} did not complete in time (status: {batch.status})")
+            await asyncio.sleep(min(settings.openai_batch_poll_interval_seconds, remaining))
+            batch = await client.batches.retrieve(batch.id)
+    except BaseException:
+        # An abandoned batch keeps running and is still billed; cancel it on timeout,
+        # task cancellation or a soft time limit
+        if batch.status not in _FINAL_BATCH_STATES:
+            await _cancel_batch(client, batch.id)
+        raise
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise LLMException(f"OpenAI batch {batch.id} ended with status: {batch.status}")
+
+    output = await client.files.content(batch.output_file_id)
+    return _parse_batch_output(output.text, len(prompts))
@@ -5,27 +5,269 @@ This service provides an abstraction layer over Celery tasks, making it easier
 to switch between different task queue implementations and providing a consistent
 API for the rest of the application.
 """
+import asyncio
 import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Optional, List
 
+from celery import Celery
 from celery.result import AsyncResult
 from celery.exceptions import WorkerLostError, Retry
+import redis.asyncio as aioredis
 
 from app.celery_app import celery_app
-from app.models.schemas import JobStatusResponse, GenerationResponse, GenerationRequest
+from app.config import get_settings
+from app.models.schemas import JobStatusResponse, GenerationResponse, GenerationRequest, AugStrategy
 from app.services.celery_tasks import run_generation_task, run_enhanced_generation_task, run_augmented_generation_task
 
 logger = logging.getLogger(__name__)
 
+# Map Celery states to our application states
+STATUS_MAPPING = MappingProxyType({
+    'PENDING': 'pending',
+    'STARTED': 'running',
+    'PROGRESS': 'running',
+    'SUCCESS': 'completed',
+    'FAILURE': 'error',
+    'RETRY': 'running',
+    'REVOKED': 'error'
+})
+
+# Celery states after which a task can no longer be cancelled
+_TERMINAL_STATES = frozenset({'SUCCESS', 'FAILURE', 'REVOKED'})
+_TERMINAL_STATUSES = frozenset(STATUS_MAPPING[state] for state in _TERMINAL_STATES)
+
+# Seconds to wait for a pooled broker producer before failing a submission
+_PRODUCER_ACQUIRE_TIMEOUT = 2
+
+# Finished jobs never change state, so repeated polls are answered from memory
+_TERMINAL_JOB_TTL_SECONDS = 600.0
+_TERMINAL_JOB_CACHE_SIZE = 256
+
+# Queue inspections broadcast together for job stats
+_INSPECT_COMMANDS = ('active', 'scheduled', 'reserved')
+
+# Shared pool for the inspection broadcasts; threads are started on first use and reused
+_inspect_executor = ThreadPoolExecutor(
+    max_workers=len(_INSPECT_COMMANDS), thread_name_prefix='celery-inspect'
+)
+
+# Ids submitted by this process, reported as pending until the backend has a record
+_SUBMITTED_JOB_CACHE_SIZE = 10000
+
+
+def _is_valid_job_id(job_id: str) -> bool:
+    """Check that a job id is a UUID, the format Celery uses for task ids."""
+    try:
+        uuid.UUID(job_id)
+        return True
+    except (ValueError, TypeError, AttributeError):
+        return False
+
+
+def _parse_meta_timestamp(value: Any) -> Optional[datetime]:
+    """Convert a task meta timestamp (epoch millis, or ISO string from older tasks) to a datetime."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return None
+
+
+class WorkerHeartbeatMonitor:
+    """
+    Tracks Celery worker liveness from the event stream.
+
+    Workers publish a heartbeat every few seconds when events are enabled. Listening
+    to those events in a background thread lets health and stats lookups read a local
+    dict instead of broadcasting ``inspect()`` requests and waiting for replies.
+    """
+
+    def __init__(self, app: Celery, ttl_seconds: float = 30.0, retry_delay: float = 5.0):
+        """
+        Initialize the heartbeat monitor.
+
+        Args:
+            app: Celery application whose event stream to consume
+            ttl_seconds: Seconds after the last heartbeat before a worker is considered gone
+            retry_delay: Seconds to wait before reconnecting after a broker error
+        """
+        self.app = app
+        self.ttl_seconds = ttl_seconds
+        self.retry_delay = retry_delay
+        self._workers: Dict[str, Dict[str, Any]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._receiver = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background listener thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start consuming worker events in a daemon thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="celery-heartbeat-monitor",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("Worker heartbeat monitor started")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Signal the listener thread to stop and wait briefly for it to exit."""
+        self._stop_event.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Worker heartbeat monitor stopped")
+
+    def _run(self) -> None:
+        """Capture worker events until stopped, reconnecting on broker errors."""
+        handlers = {
+            'worker-heartbeat': self.on_heartbeat,
+            'worker-online': self.on_heartbeat,
+            'worker-offline': self.on_offline,
+        }
+        while not self._stop_event.is_set():
+            try:
+                with self.app.connection_for_read() as connection:
+                    self._receiver = self.app.events.Receiver(connection, handlers=handlers)
+                    self._receiver.capture(limit=None, timeout=None, wakeup=True)
+            except Exception as e:
+                logger.warning(f"Worker heartbeat monitor disconnected: {e}")
+            finally:
+                self._receiver = None
+            self._stop_event.wait(self.retry_delay)
+
+    def on_heartbeat(self, event: Dict[str, Any]) -> None:
+        """Record a heartbeat (or online) event for a worker."""
+        hostname = event.get('hostname')
+        if not hostname:
+            return
+        # Autoscaled workers get fresh hostnames and may vanish without an offline
+        # event; drop stale entries whenever a new worker appears so the dict stays bounded
+        if hostname not in self._workers:
+            self._prune_stale_workers()
+        self._workers[hostname] = {
+            'last_seen': time.monotonic(),
+            'active': event.get('active', 0),
+            'processed': event.get('processed', 0),
+            'loadavg': event.get('loadavg'),
+            'sw_ident': event.get('sw_ident'),
+        }
+
+    def _prune_stale_workers(self) -> None:
+        """Forget workers whose last heartbeat is older than the TTL."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        for hostname, info in list(self._workers.items()):
+            if info['last_seen'] < cutoff:
+                self._workers.pop(hostname, None)
+
+    def on_offline(self, event: Dict[str, Any]) -> None:
+        """Forget a worker that announced it is shutting down."""
+        self._workers.pop(event.get('hostname'), None)
+
+    def alive_workers(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get workers that sent a heartbeat within the TTL.
+
+        Returns:
+            Mapping of worker hostname to its most recent heartbeat info
+        """
+        cutoff = time.monotonic() - self.ttl_seconds
+        return {
+            hostname: info
+            for hostname, info in list(self._workers.items())
+            if info['last_seen'] >= cutoff
+        }
+
+    def has_alive_worker(self) -> bool:
+        """Check whether any worker sent a heartbeat within the TTL."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        return any(info['last_seen'] >= cutoff for info in list(self._workers.values()))
+
 
 class CeleryJobService:
     """Service for managing Celery-based background jobs."""
-    
+
     def __init__(self):
         """Initialize the Celery job service."""
         self.celery_app = celery_app
-    
+        self.heartbeat_monitor = get_worker_heartbeat_monitor()
+        self._submitted_jobs: "OrderedDict[str, datetime]" = OrderedDict()
+        self._terminal_jobs: "OrderedDict[str, tuple[float, JobStatusResponse]]" = OrderedDict()
+
+    def _cached_terminal_status(self, job_id: str) -> Optional[JobStatusResponse]:
+        """Get the cached status of a finished job, if still within the TTL."""
+        entry = self._terminal_jobs.get(job_id)
+        if entry is None:
+            return None
+        cached_at, response = entry
+        if time.monotonic() - cached_at > _TERMINAL_JOB_TTL_SECONDS:
+            self._terminal_jobs.pop(job_id, None)
+            return None
+        self._terminal_jobs.move_to_end(job_id)
+        return response
+
+    def _remember_terminal(self, job_id: str, response: JobStatusResponse) -> None:
+        """Cache a finished job's status, evicting the least recently used entries when full."""
+        self._terminal_jobs[job_id] = (time.monotonic(), response)
+        self._terminal_jobs.move_to_end(job_id)
+        while len(self._terminal_jobs) > _TERMINAL_JOB_CACHE_SIZE:
+            self._terminal_jobs.popitem(last=False)
+
+    def _submit(self, task, *args) -> AsyncResult:
+        """Publish a task using a producer checked out from the shared broker pool."""
+        with self.celery_app.producer_pool.acquire(
+            block=True, timeout=_PRODUCER_ACQUIRE_TIMEOUT
+        ) as producer:
+            task_result = task.apply_async(args=args, producer=producer)
+        self._remember_submitted(task_result.id)
+        return task_result
+
+    def _remember_submitted(self, job_id: str) -> None:
+        """Record a job this process queued, evicting the oldest entries when full."""
+        self._submitted_jobs[job_id] = datetime.now(timezone.utc)
+        while len(self._submitted_jobs) > _SUBMITTED_JOB_CACHE_SIZE:
+            self._submitted_jobs.popitem(last=False)
+
+    def pending_status(self, job_id: str) -> JobStatusResponse:
+        """
+        Build the status of a job that is queued but not yet picked up by a worker.
+        
+        The result backend holds no record until a worker starts the task, so a freshly
+        created job is answered locally instead of with a backend round-trip.
+        
+        Args:
+            job_id: Task ID of the queued job
+            
+        Returns:
+            Pending job status response
+        """
+        created_at = self._submitted_jobs.get(job_id) or datetime.now(timezone.utc)
+        return JobStatusResponse(
+            job_id=job_id,
+            status='pending',
+            created_at=created_at,
+            updated_at=created_at
+        )
+
     def create_generation_job(self, request: GenerationRequest) -> str:
         """
         Create a new generation job using Celery.
@@ -40,7 +282,7 @@ class CeleryJobService:
             logger.info(f"Creating Celery generation job for product: {request.product}")
             
             # Submit task to Celery
-            task = run_generation_task.delay(request.model_dump())
+            task = self._submit(run_generation_task, request.model_dump())
             
             logger.info(f"Created Celery generation job {task.id}")
             return task.id
@@ -86,7 +328,7 @@ class CeleryJobService:
             }
             
             # Submit enhanced task to Celery
-            task = run_enhanced_generation_task.delay(enhanced_params)
+            task = self._submit(run_enhanced_generation_task, enhanced_params)
             
             logger.info(f"Created enhanced Celery generation job {task.id}")
             return task.id
@@ -118,10 +360,14 @@ class CeleryJobService:
                 f"with strategies: {augmentation_strategies}"
             )
             
+            # Pack strategies into a bitmask to keep the broker payload small
+            strategies_mask = int(AugStrategy.from_names(augmentation_strategies))
+            
             # Submit task to Celery
-            task = run_augmented_generation_task.delay(
+            task = self._submit(
+                run_augmented_generation_task,
                 request.model_dump(),
-                augmentation_strategies,
+                strategies_mask,
                 augment_ratio
             )
             
@@ -142,76 +388,172 @@ class CeleryJobService:
         Returns:
             Job status response or None if not found
         """
+        # Malformed ids can never exist; reject them without a backend round-trip.
+        # Well-formed ids are always looked up, since another API process may have
+        # just created the job
+        if not _is_valid_job_id(job_id):
+            return None
+        
+        cached = self._cached_terminal_status(job_id)
+        if cached is not None:
+            return cached
+        
         try:
-            # Get task result from Celery
-            task = self.celery_app.AsyncResult(job_id)
-            # If Celery has no record beyond a default PENDING with no meta/result, treat as not found
-            if task.state == 'PENDING' and not task.info and not task.result:
-                return None
-            
-            # Map Celery states to our application states
-            status_mapping = {
-                'PENDING': 'pending',
-                'STARTED': 'running',
-                'PROGRESS': 'running', 
-                'SUCCESS': 'completed',
-                'FAILURE': 'error',
-                'RETRY': 'running',
-                'REVOKED': 'error'
-            }
+            # Read the task meta once; AsyncResult's state/info/result properties each
+            # re-fetch it from the backend until the task is ready
+            task_meta = self.celery_app.backend.get_task_meta(job_id)
+            return self._status_from_meta(job_id, task_meta)
             
-            status = status_mapping.get(task.state, 'unknown')
+        except Exception as e:
+            logger.error(f"Failed to get job status for {job_id}: {e}")
+            return None
+    
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, Optional[JobStatusResponse]]:
+        """
+        Get the status of several jobs with a single backend round-trip.
+        
+        Finished jobs are answered from the local cache; the meta of all remaining
+        ids is fetched with one MGET instead of one GET per job.
+        
+        Args:
+            job_ids: Task IDs to check status for
             
-            # Derive timestamps from task meta when available
-            created_at = None
-            updated_at = None
-            try:
-                meta = task.info if isinstance(task.info, dict) else {}
-                started_at = meta.get('started_at') if meta else None
-                completed_at = meta.get('completed_at') if meta else None
-                if started_at:
-                    created_at = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-                if completed_at:
-                    updated_at = datetime.fromisoformat(completed_at.replace('Z', '+00:00'))
-            except Exception:
-                created_at = None
-                updated_at = None
-
-            # Fallbacks if meta not available
-            now = datetime.now(timezone.utc)
-            response = JobStatusResponse(
-                job_id=job_id,
-                status=status,
-                created_at=created_at or now,
-                updated_at=updated_at or now
-            )
+        Returns:
+            Mapping of job id to its status response, or None if not found
+        """
+        statuses: Dict[str, Optional[JobStatusResponse]] = {}
+        to_fetch = []
+        for job_id in dict.fromkeys(job_ids):
+            if not _is_valid_job_id(job_id):
+                statuses[job_id] = None
+                continue
+            cached = self._cached_terminal_status(job_id)
+            statuses[job_id] = cached
+            if cached is None:
+                to_fetch.append(job_id)
+        
+        if not to_fetch:
+            return statuses
+        
+        try:
+            backend = self.celery_app.backend
+            values = backend.mget([backend.get_key_for_task(job_id) for job_id in to_fetch])
+            for job_id, value in zip(to_fetch, values):
+                task_meta = backend.decode_result(value) if value else {'status': 'PENDING', 'result': None}
+                statuses[job_id] = self._status_from_meta(job_id, task_meta)
+        except Exception as e:
+            logger.error(f"Failed to get job statuses for {len(to_fetch)} jobs: {e}")
+        
+        return statuses
+    
+    def _status_from_meta(self, job_id: str, task_meta: Dict[str, Any]) -> Optional[JobStatusResponse]:
+        """
+        Build a job status response from decoded Celery task meta.
+        
+        Args:
+            job_id: Task ID the meta belongs to
+            task_meta: Decoded meta as returned by the result backend
+            
+        Returns:
+            Job status response or None if the backend has no record of the job
+        """
+        state = task_meta.get('status', 'PENDING')
+        info = task_meta.get('result')
+        
+        # If Celery has no record beyond a default PENDING with no meta/result, treat as not found
+        if state == 'PENDING' and not info:
+            if job_id in self._submitted_jobs:
+                return self.pending_status(job_id)
+            return None
+        self._submitted_jobs.pop(job_id, None)
+        
+        status = STATUS_MAPPING.get(state, 'unknown')
+        meta = info if isinstance(info, dict) else {}
+        
+        # Derive timestamps from task meta when available
+        created_at = _parse_meta_timestamp(meta.get('started_at'))
+        updated_at = _parse_meta_timestamp(meta.get('completed_at'))
+
+        # Fallbacks if meta not available
+        now = datetime.now(timezone.utc)
+        response = JobStatusResponse(
+            job_id=job_id,
+            status=status,
+            created_at=created_at or now,
+            updated_at=updated_at or now
+        )
+        
+        # Add progress information if available
+        if state == 'PROGRESS' and info:
+            response.progress = meta.get('current', 0)
             
-            # Add progress information if available
-            if task.state == 'PROGRESS' and task.info:
-                meta = task.info if isinstance(task.info, dict) else {}
-                response.progress = meta.get('current', 0)
+        # Add results if completed successfully
+        elif state == 'SUCCESS' and info:
+            # Tasks store the response as a JSON-ready dict; some older results hold it
+            # as a pre-encoded JSON string instead
+            result_data = meta.get('result')
+            if isinstance(result_data, str):
+                response.result = GenerationResponse.model_validate_json(result_data)
+            elif result_data:
+                response.result = GenerationResponse.model_validate(result_data)
                 
-            # Add results if completed successfully
-            elif task.state == 'SUCCESS' and task.result:
-                result_data = task.result.get('result', {}) if isinstance(task.result, dict) else {}
-                if result_data:
-                    response.result = GenerationResponse(**result_data)
-                    
-            # Add error information if failed
-            elif task.state == 'FAILURE':
-                if task.info:
-                    if isinstance(task.info, dict):
-                        response.error_message = task.info.get('error', str(task.info))
-                    else:
-                        response.error_message = str(task.info)
+        # Add error information if failed
+        elif state == 'FAILURE':
+            if info:
+                if isinstance(info, dict):
+                    response.error_message = info.get('error', str(info))
                 else:
-                    response.error_message = "Task failed with unknown error"
+                    response.error_message = str(info)
+            else:
+                response.error_message = "Task failed with unknown error"
+        
+        if state in _TERMINAL_STATES:
+            self._remember_terminal(job_id, response)
+        return response
+    
+    async def watch_job_status(self, job_id: str) -> AsyncIterator[JobStatusResponse]:
+        """
+        Yield a job's status now and again on every state change until it finishes.
+        
+        The Redis result backend publishes each task meta write on a channel named
+        after the meta key, so subscribers receive progress without polling.
+        
+        Args:
+            job_id: Task ID to follow
             
-            return response
+        Yields:
+            Job status responses; nothing if the job is unknown
+        """
+        if not _is_valid_job_id(job_id):
+            return
+        
+        cached = self._cached_terminal_status(job_id)
+        if cached is not None:
+            yield cached
+            return
+        
+        backend = self.celery_app.backend
+        channel = backend.get_key_for_task(job_id)
+        client = aioredis.from_url(get_settings().redis_url)
+        pubsub = client.pubsub()
+        try:
+            # Subscribe before reading the current state so no transition is missed
+            await pubsub.subscribe(channel)
+            status = await asyncio.to_thread(self.get_job_status, job_id)
+            if status is None:
+                return
+            yield status
             
-        except Exception as e:
-            logger.error(f"Failed to get job status for {job_id}: {e}")
-            return None
+            while status.status not in _TERMINAL_STATUSES:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                if message is None:
+                    continue
+                status = self._status_from_meta(job_id, backend.decode_result(message['data']))
+                if status is not None:
+                    yield status
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
     
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -223,11 +565,15 @@ class CeleryJobService:
         Returns:
             True if cancellation was successful
         """
+        if not _is_valid_job_id(job_id):
+            logger.warning(f"Cannot cancel job {job_id} - invalid job id")
+            return False
+        
         try:
             task = self.celery_app.AsyncResult(job_id)
             
             # Only cancel if not already finished
-            if task.state not in ['SUCCESS', 'FAILURE']:
+            if task.state not in _TERMINAL_STATES:
                 task.revoke(terminate=True)
                 logger.info(f"Cancelled Celery job {job_id}")
                 return True
@@ -250,10 +596,11 @@ class CeleryJobService:
             # Get active tasks from Celery
             inspect = self.celery_app.control.inspect()
             
-            # Get active tasks across all workers
-            active_tasks = inspect.active()
-            scheduled_tasks = inspect.scheduled()
-            reserved_tasks = inspect.reserved()
+            # Broadcast the inspections concurrently; each one waits out the full
+            # reply timeout, so issuing them back-to-back tripled the latency
+            active_tasks, scheduled_tasks, reserved_tasks = _inspect_executor.map(
+                lambda command: getattr(inspect, command)(), _INSPECT_COMMANDS
+            )
             
             # Count total tasks
             total_active = 0
@@ -267,8 +614,11 @@ class CeleryJobService:
             if reserved_tasks:
                 total_reserved = sum(len(tasks) for tasks in reserved_tasks.values())
             
-            # Get worker statistics
-            stats = inspect.stats()
+            # Get worker statistics from cached heartbeats when the monitor is running
+            if self.heartbeat_monitor.is_running:
+                stats = self.heartbeat_monitor.alive_workers()
+            else:
+                stats = inspect.stats()
             active_workers = len(stats) if stats else 0
             
             return {
@@ -299,7 +649,11 @@ class CeleryJobService:
             True if Celery is healthy
         """
         try:
-            # Check if any workers are available
+            # O(1) lookup against cached heartbeats when the monitor is running
+            if self.heartbeat_monitor.is_running:
+                return self.heartbeat_monitor.has_alive_worker()
+
+            # Fall back to a broadcast inspection
             inspect = self.celery_app.control.inspect()
             stats = inspect.stats()
             
@@ -311,6 +665,21 @@ class CeleryJobService:
             return False
 
 
+# Global heartbeat monitor instance
+_worker_heartbeat_monitor: Optional[WorkerHeartbeatMonitor] = None
+
+
+def get_worker_heartbeat_monitor() -> WorkerHeartbeatMonitor:
+    """Get global worker heartbeat monitor instance."""
+    global _worker_heartbeat_monitor
+    if _worker_heartbeat_monitor is None:
+        _worker_heartbeat_monitor = WorkerHeartbeatMonitor(
+            celery_app,
+            ttl_seconds=get_settings().celery_heartbeat_ttl_seconds
+        )
+    return _worker_heartbeat_monitor
+
+
 # Global service instance
 _celery_job_service: Optional[CeleryJobService] = None
 
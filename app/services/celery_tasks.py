@@ -6,21 +6,99 @@ for better scalability, reliability, and monitoring.
 """
 import asyncio
 import logging
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
-from celery import current_task
+from celery import chord, current_task
 from celery.exceptions import Retry
 
 from app.celery_app import celery_app
 from app.config import get_settings
-from app.models.schemas import GenerationRequest, GenerationResponse, GeneratedSample
+from app.models.schemas import GenerationRequest, GenerationResponse, GeneratedSample, AugStrategy
 # Avoid circular import: import GenerationService lazily inside task functions
 from app.utils.llm_client import get_llm_client, LLMException
 
 logger = logging.getLogger(__name__)
 
+# Exceptions that Celery autoretries for the generation tasks
+RETRYABLE_EXCEPTIONS = (LLMException, ConnectionError)
+
+# Seconds kept between a Batch API wait and the task's soft time limit for filtering and storing results
+_BATCH_WAIT_MARGIN_SECONDS = 60
+
+
+def _will_retry(task, exc: Exception) -> bool:
+    """Whether Celery's autoretry will re-run the task for this exception."""
+    max_retries = (getattr(task, 'retry_kwargs', None) or {}).get('max_retries', task.max_retries)
+    return isinstance(exc, RETRYABLE_EXCEPTIONS) and task.request.retries < max_retries
+
+
+def _now_ms() -> int:
+    """Current UTC time as epoch milliseconds, the timestamp format used in task meta."""
+    return time.time_ns() // 1_000_000
+
+
+# One writer thread per worker process keeps progress writes in submission order
+_progress_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="celery-progress")
+
+
+class ProgressReporter:
+    """
+    Fire-and-forget PROGRESS state updates for a running task.
+    
+    Progress writes are informational, so they are handed to a background thread
+    instead of blocking the generation event loop on a result-backend round-trip.
+    flush() must run before the task finishes, otherwise a late progress write could
+    land after (and overwrite) the task's terminal state.
+    
+    Updates are coalesced: one that repeats the last written progress, or arrives
+    within min_interval of the previous write, is dropped unless it completes the total.
+    """
+    
+    def __init__(self, task, min_interval: float = 0.25):
+        self.task = task
+        # Task.request is thread-local, so capture the id for the writer thread
+        self.task_id = task.request.id
+        self.min_interval = min_interval
+        self._pending: Optional[Future] = None
+        self._last_current: Optional[int] = None
+        self._last_reported_at = float('-inf')
+    
+    def report(self, meta: Dict[str, Any]) -> None:
+        """Queue a PROGRESS update with the given meta, unless it is coalesced away."""
+        current = meta.get('current')
+        now = time.monotonic()
+        if current == self._last_current:
+            return
+        if now - self._last_reported_at < self.min_interval and current != meta.get('total'):
+            return
+        self._last_current = current
+        self._last_reported_at = now
+        self._pending = _progress_writer.submit(
+            self.task.update_state, task_id=self.task_id, state='PROGRESS', meta=meta
+        )
+    
+    def flush(self) -> None:
+        """Wait until every queued update has been written."""
+        if self._pending is None:
+            return
+        try:
+            self._pending.result()
+        except Exception as exc:
+            logger.warning("Progress update for task %s failed: %s", self.task_id, exc)
+        finally:
+            self._pending = None
+
+
+def _batch_wait_limit(task) -> Optional[float]:
+    """Longest OpenAI Batch API wait that still lets a task finish before its soft time limit."""
+    if not task.soft_time_limit:
+        return None
+    return max(task.soft_time_limit - _BATCH_WAIT_MARGIN_SECONDS, 0)
+
 
 def run_async_in_sync(coro):
     """Helper to run async functions in sync Celery tasks."""
@@ -30,8 +108,17 @@ def run_async_in_sync(coro):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     
+    task = loop.create_task(coro)
     try:
-        return loop.run_until_complete(coro)
+        return loop.run_until_complete(task)
+    except BaseException:
+        # A soft time limit interrupts the loop itself and leaves the coroutine suspended;
+        # cancel it and let it unwind so its cleanup (e.g. cancelling a pending OpenAI
+        # batch) still runs on this loop
+        if not task.done():
+            task.cancel()
+            loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
     finally:
         # Don't close the loop as it might be reused
         pass
@@ -40,7 +127,7 @@ def run_async_in_sync(coro):
 @celery_app.task(
     bind=True, 
     name='run_generation_task',
-    autoretry_for=(LLMException, ConnectionError),
+    autoretry_for=RETRYABLE_EXCEPTIONS,
     retry_kwargs={'max_retries': 3, 'countdown': 60},
     soft_time_limit=300,  # 5 minutes soft limit
     time_limit=600  # 10 minutes hard limit
@@ -59,8 +146,10 @@ def run_generation_task(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         Retry: If task should be retried
         Exception: If task fails permanently
     """
+    progress_reporter = ProgressReporter(self)
     try:
         logger.info(f"Starting generation task {self.request.id}")
+        started_at = _now_ms()
         
         # Update task state to PROGRESS
         self.update_state(
@@ -69,84 +158,74 @@ def run_generation_task(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
                 'current': 0, 
                 'total': request_data['count'], 
                 'status': 'Initializing generation...',
-                'started_at': datetime.now(timezone.utc).isoformat()
+                'started_at': started_at
             }
         )
         
         # Convert dict back to Pydantic model
         request = GenerationRequest(**request_data)
         
-        # Create generation service (lazy import to avoid circular import)
-        from app.services.generation_service import GenerationService
-        service = GenerationService()
+        # Reuse the per-process generation service (lazy import to avoid circular import)
+        from app.services.generation_service import get_generation_service
+        service = get_generation_service()
+        
+        # Progress callback for Celery state updates; fields that stay the same for
+        # every update are built once
+        progress_meta = {'total': 100, 'started_at': started_at}
         
-        # Progress callback for Celery state updates
-        def progress_callback(progress: int):
+        async def progress_callback(progress: int):
             """Update Celery task progress."""
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current': progress,
-                    'total': 100,
-                    'status': f'Generating samples... {progress}%',
-                    'started_at': datetime.now(timezone.utc).isoformat()
-                }
-            )
+            progress_reporter.report({
+                **progress_meta,
+                'current': progress,
+                'status': f'Generating samples... {progress}%'
+            })
         
         # Run the async generation logic in sync context
         async def run_generation():
-            return await service.generate_batch(request, progress_callback)
+            return await service.generate_batch(
+                request, progress_callback, batch_max_wait_seconds=_batch_wait_limit(self)
+            )
         
         # Execute the generation
         result = run_async_in_sync(run_generation())
-        
-        # Update final state
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 100,
-                'total': 100,
-                'status': 'Generation completed successfully',
-                'started_at': datetime.now(timezone.utc).isoformat(),
-                'completed_at': datetime.now(timezone.utc).isoformat()
-            }
-        )
+        progress_reporter.flush()
         
         logger.info(
             f"Generation task {self.request.id} completed: "
             f"{result.total_samples} samples, ~{result.total_tokens_estimated} tokens"
         )
         
+        # The returned meta is the single terminal write; Celery stores it as SUCCESS
         return {
             'status': 'SUCCESS',
-            'result': result.model_dump(),
+            'result': result.model_dump(mode='json'),
             'task_id': self.request.id,
-            'completed_at': datetime.now(timezone.utc).isoformat()
+            'started_at': started_at,
+            'completed_at': _now_ms()
         }
         
     except Exception as exc:
-        logger.error(f"Generation task {self.request.id} failed: {exc}")
-        logger.error(traceback.format_exc())
+        # Queued progress must land before Celery records the retry or failure
+        progress_reporter.flush()
         
-        # Update state with error information
-        self.update_state(
-            state='FAILURE',
-            meta={
-                'error': str(exc),
-                'error_type': type(exc).__name__,
-                'failed_at': datetime.now(timezone.utc).isoformat(),
-                'traceback': traceback.format_exc()
-            }
-        )
+        # Retryable failures skip traceback formatting; only the final attempt records it
+        if _will_retry(self, exc):
+            logger.warning("Generation task %s retrying: %s", self.request.id, exc)
+            raise exc
         
-        # Re-raise for Celery to handle
+        logger.error(f"Generation task {self.request.id} failed: {exc}")
+        logger.error(''.join(traceback.format_exception(exc)))
+        
+        # Celery stores the FAILURE state with this exception when it propagates, so
+        # a FAILURE update_state here would only be overwritten by a second write
         raise exc
 
 
 @celery_app.task(
     bind=True,
     name='run_enhanced_generation_task',
-    autoretry_for=(LLMException, ConnectionError),
+    autoretry_for=RETRYABLE_EXCEPTIONS,
     retry_kwargs={'max_retries': 3, 'countdown': 60},
     soft_time_limit=300,  # 5 minutes soft limit
     time_limit=600  # 10 minutes hard limit
@@ -167,8 +246,10 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
     Returns:
         Task result dictionary with generation response
     """
+    progress_reporter = ProgressReporter(self)
     try:
         logger.info(f"Starting enhanced generation task {self.request.id}")
+        started_at = _now_ms()
         
         # Extract parameters
         request_data = enhanced_params['request']
@@ -180,36 +261,35 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
         enable_quality_filter = enhanced_params.get('enable_quality_filter', True)
         min_quality_score = enhanced_params.get('min_quality_score', 0.6)
         
-        # Update quality filter config if specified
+        # Update quality filter config if specified (service is only rebuilt when the config changes;
+        # generate_batch resets its duplicate state and statistics for each batch)
         if enable_quality_filter:
             from app.services.quality_service import QualityFilterConfig, get_quality_service
             quality_config = QualityFilterConfig(min_overall_score=min_quality_score)
-            # Reset service to use new config
-            from app.services.quality_service import reset_quality_service
-            reset_quality_service()
             get_quality_service(quality_config)
         
-        # Initialize generation service (lazy import to avoid circular import)
-        from app.services.generation_service import GenerationService
-        service = GenerationService()
+        # Reuse the per-process generation service (lazy import to avoid circular import)
+        from app.services.generation_service import get_generation_service
+        service = get_generation_service()
         
         # Progress callback for updates
+        progress_meta = {
+            'total': 100,
+            'started_at': started_at,
+            'features': {
+                'few_shot_learning': enable_few_shot,
+                'quality_filtering': enable_quality_filter,
+                'sentiment_intensity': sentiment_intensity,
+                'tone': tone
+            }
+        }
+        
         async def progress_callback(progress: int):
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current': progress,
-                    'total': 100,
-                    'status': f'Enhanced generation... {progress}%',
-                    'started_at': datetime.now(timezone.utc).isoformat(),
-                    'features': {
-                        'few_shot_learning': enable_few_shot,
-                        'quality_filtering': enable_quality_filter,
-                        'sentiment_intensity': sentiment_intensity,
-                        'tone': tone
-                    }
-                }
-            )
+            progress_reporter.report({
+                **progress_meta,
+                'current': progress,
+                'status': f'Enhanced generation... {progress}%'
+            })
         
         # Run the enhanced generation logic
         async def run_enhanced_generation():
@@ -219,30 +299,13 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
                 enable_quality_filter=enable_quality_filter,
                 sentiment_intensity=sentiment_intensity,
                 tone=tone,
-                enable_few_shot=enable_few_shot
+                enable_few_shot=enable_few_shot,
+                batch_max_wait_seconds=_batch_wait_limit(self)
             )
         
         # Execute the enhanced generation
         result = run_async_in_sync(run_enhanced_generation())
-        
-        # Update final state with enhanced metadata
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 100,
-                'total': 100,
-                'status': 'Enhanced generation completed successfully',
-                'started_at': datetime.now(timezone.utc).isoformat(),
-                'completed_at': datetime.now(timezone.utc).isoformat(),
-                'features_used': {
-                    'few_shot_learning': enable_few_shot,
-                    'quality_filtering': enable_quality_filter,
-                    'sentiment_intensity': sentiment_intensity,
-                    'tone': tone
-                },
-                'quality_info': result.metadata if hasattr(result, 'metadata') and result.metadata else {}
-            }
-        )
+        progress_reporter.flush()
         
         logger.info(
             f"Enhanced generation task {self.request.id} completed: "
@@ -250,11 +313,13 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
             f"quality_filter={enable_quality_filter}, few_shot={enable_few_shot}"
         )
         
+        # The returned meta is the single terminal write; Celery stores it as SUCCESS
         return {
             'status': 'SUCCESS',
-            'result': result.model_dump(),
+            'result': result.model_dump(mode='json'),
             'task_id': self.request.id,
-            'completed_at': datetime.now(timezone.utc).isoformat(),
+            'started_at': started_at,
+            'completed_at': _now_ms(),
             'enhancement_features': {
                 'few_shot_learning': enable_few_shot,
                 'quality_filtering': enable_quality_filter,
@@ -265,29 +330,26 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
         }
         
     except Exception as exc:
-        logger.error(f"Enhanced generation task {self.request.id} failed: {exc}")
-        logger.error(traceback.format_exc())
+        # Queued progress must land before Celery records the retry or failure
+        progress_reporter.flush()
         
-        # Update state with error information
-        self.update_state(
-            state='FAILURE',
-            meta={
-                'error': str(exc),
-                'error_type': type(exc).__name__,
-                'failed_at': datetime.now(timezone.utc).isoformat(),
-                'traceback': traceback.format_exc(),
-                'enhancement_features': enhanced_params
-            }
-        )
+        # Retryable failures skip traceback formatting; only the final attempt records it
+        if _will_retry(self, exc):
+            logger.warning("Enhanced generation task %s retrying: %s", self.request.id, exc)
+            raise exc
+        
+        logger.error(f"Enhanced generation task {self.request.id} failed: {exc}")
+        logger.error(''.join(traceback.format_exception(exc)))
         
-        # Re-raise for Celery to handle
+        # Celery stores the FAILURE state with this exception when it propagates, so
+        # a FAILURE update_state here would only be overwritten by a second write
         raise exc
 
 
 @celery_app.task(
     bind=True,
     name='run_augmented_generation_task', 
-    autoretry_for=(LLMException, ConnectionError),
+    autoretry_for=RETRYABLE_EXCEPTIONS,
     retry_kwargs={'max_retries': 3, 'countdown': 60},
     soft_time_limit=600,  # 10 minutes soft limit
     time_limit=1200  # 20 minutes hard limit (augmentation takes longer)
@@ -295,26 +357,39 @@ def run_enhanced_generation_task(self, enhanced_params: Dict[str, Any]) -> Dict[
 def run_augmented_generation_task(
     self, 
     request_data: Dict[str, Any],
-    augmentation_strategies: List[str],
+    strategies_mask: int,
     augment_ratio: float
 ) -> Dict[str, Any]:
     """
-    Celery task for augmented text generation.
+    Celery task coordinating augmented text generation.
+    
+    Generates the original samples, then fans out one run_single_augmentation
+    subtask per strategy in a chord whose merge_augmentation_results callback
+    produces the final result under this task's id.
     
     Args:
         request_data: Serialized GenerationRequest data
-        augmentation_strategies: List of strategies to apply ('CDA', 'ADA', 'CADA')
+        strategies_mask: AugStrategy bitmask of strategies to apply (CDA, ADA, CADA)
         augment_ratio: Ratio of augmented to original samples (0.0 to 1.0)
         
     Returns:
         Dictionary containing task results
     """
+    progress_reporter = ProgressReporter(self)
     try:
+        # Accept legacy list payloads still queued from before the bitmask change
+        if isinstance(strategies_mask, list):
+            strategies_mask = AugStrategy.from_names(strategies_mask)
+        mask = AugStrategy(strategies_mask)
+        augmentation_strategies = mask.names()
+        
         logger.info(
             f"Starting augmented generation task {self.request.id} "
             f"with strategies: {augmentation_strategies}"
         )
         
+        started_at = _now_ms()
+        
         # Update task state
         self.update_state(
             state='PROGRESS',
@@ -324,73 +399,214 @@ def run_augmented_generation_task(
                 'status': 'Initializing augmented generation...',
                 'strategies': augmentation_strategies,
                 'augment_ratio': augment_ratio,
-                'started_at': datetime.now(timezone.utc).isoformat()
+                'started_at': started_at
             }
         )
         
         # Convert dict back to Pydantic model
         request = GenerationRequest(**request_data)
         
-        # Create generation service (lazy import to avoid circular import)
-        from app.services.generation_service import GenerationService
-        service = GenerationService()
+        # Reuse the per-process generation service (lazy import to avoid circular import)
+        from app.services.generation_service import get_generation_service
+        service = get_generation_service()
         
         # Progress callback
-        def progress_callback(progress: int):
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current': progress,
-                    'total': 100,
-                    'status': f'Running augmented generation... {progress}%',
-                    'strategies': augmentation_strategies,
-                    'augment_ratio': augment_ratio,
-                    'started_at': datetime.now(timezone.utc).isoformat()
-                }
-            )
+        progress_meta = {
+            'total': 100,
+            'strategies': augmentation_strategies,
+            'augment_ratio': augment_ratio,
+            'started_at': started_at
+        }
         
-        # Run the async augmented generation
-        async def run_augmented_generation():
-            return await service.generate_with_augmentation(
-                request=request,
-                augmentation_strategies=augmentation_strategies,
-                augment_ratio=augment_ratio
+        async def progress_callback(progress: int):
+            progress_reporter.report({
+                **progress_meta,
+                'current': progress,
+                'status': f'Generating base samples... {progress}%'
+            })
+        
+        # Generate the original samples once; augmentation fans out per strategy below
+        async def run_base_generation():
+            return await service.generate_batch(
+                request, progress_callback, batch_max_wait_seconds=_batch_wait_limit(self)
             )
         
-        # Execute the generation
-        result = run_async_in_sync(run_augmented_generation())
+        base_response = run_async_in_sync(run_base_generation())
+        progress_reporter.flush()
+        base_result = base_response.model_dump(mode='json')
         
-        logger.info(
-            f"Augmented generation task {self.request.id} completed: "
-            f"{result.total_samples} total samples"
-        )
+    except Exception as exc:
+        # Queued progress must land before Celery records the retry or failure
+        progress_reporter.flush()
         
-        return {
-            'status': 'SUCCESS',
-            'result': result.model_dump(),
-            'task_id': self.request.id,
-            'strategies_used': augmentation_strategies,
-            'augment_ratio': augment_ratio,
-            'completed_at': datetime.now(timezone.utc).isoformat()
-        }
+        # Retryable failures skip traceback formatting; only the final attempt records it
+        if _will_retry(self, exc):
+            logger.warning("Augmented generation task %s retrying: %s", self.request.id, exc)
+            raise exc
         
-    except Exception as exc:
         logger.error(f"Augmented generation task {self.request.id} failed: {exc}")
-        logger.error(traceback.format_exc())
+        logger.error(''.join(traceback.format_exception(exc)))
         
-        self.update_state(
-            state='FAILURE',
-            meta={
-                'error': str(exc),
-                'error_type': type(exc).__name__,
-                'failed_at': datetime.now(timezone.utc).isoformat(),
-                'traceback': traceback.format_exc()
-            }
+        # Celery stores the FAILURE state with this exception when it propagates, so
+        # a FAILURE update_state here would only be overwritten by a second write
+        raise exc
+    
+    if not augmentation_strategies or augment_ratio <= 0 or not base_response.samples:
+        return _build_augmented_result(
+            self.request.id, base_result, [], augmentation_strategies, augment_ratio
+        )
+    
+    # Fan out one subtask per strategy so they run on separate workers, then merge.
+    # Subtask ids are frozen up front so the merge step can forget their results.
+    header = [
+        run_single_augmentation.s(base_result['samples'], strategy_name, augment_ratio)
+        for strategy_name in augmentation_strategies
+    ]
+    subtask_ids = [signature.freeze().id for signature in header]
+    body = merge_augmentation_results.s(
+        base_result, augmentation_strategies, augment_ratio, subtask_ids=subtask_ids
+    )
+    
+    logger.info(
+        f"Augmented generation task {self.request.id} dispatching "
+        f"{len(header)} strategy subtasks"
+    )
+    
+    # Replacing keeps the chord's merged result under this task's id for status polling
+    return self.replace(chord(header, body))
+
+
+@celery_app.task(
+    bind=True,
+    name='run_single_augmentation',
+    autoretry_for=RETRYABLE_EXCEPTIONS,
+    retry_kwargs={'max_retries': 3, 'countdown': 60},
+    soft_time_limit=600,  # 10 minutes soft limit
+    time_limit=1200  # 20 minutes hard limit (augmentation takes longer)
+)
+def run_single_augmentation(
+    self,
+    samples_data: List[Dict[str, Any]],
+    strategy_name: str,
+    augment_ratio: float
+) -> List[Dict[str, Any]]:
+    """
+    Celery subtask applying a single augmentation strategy to base samples.
+    
+    Args:
+        samples_data: Serialized GeneratedSample data for the original samples
+        strategy_name: Strategy to apply ('CDA', 'ADA', 'CADA')
+        augment_ratio: Ratio of original samples to augment (0.0 to 1.0)
+        
+    Returns:
+        Serialized augmented samples
+    """
+    try:
+        logger.info(f"Starting {strategy_name} augmentation subtask {self.request.id}")
+        
+        samples = [GeneratedSample(**sample_data) for sample_data in samples_data]
+        
+        # Reuse the per-process generation service (lazy import to avoid circular import)
+        from app.services.generation_service import get_generation_service
+        service = get_generation_service()
+        
+        async def run_augmentation():
+            return await service.augment_samples(samples, strategy_name, augment_ratio)
+        
+        augmented = run_async_in_sync(run_augmentation())
+        
+        logger.info(
+            f"{strategy_name} augmentation subtask {self.request.id} completed: "
+            f"{len(augmented)} augmented samples"
         )
         
+        return [sample.model_dump(mode='json') for sample in augmented]
+        
+    except Exception as exc:
+        if _will_retry(self, exc):
+            logger.warning("%s augmentation subtask %s retrying: %s", strategy_name, self.request.id, exc)
+            raise exc
+        
+        logger.error(f"{strategy_name} augmentation subtask {self.request.id} failed: {exc}")
+        logger.error(''.join(traceback.format_exception(exc)))
         raise exc
 
 
+def _build_augmented_result(
+    task_id: Optional[str],
+    base_result: Dict[str, Any],
+    augmented_results: List[List[Dict[str, Any]]],
+    augmentation_strategies: List[str],
+    augment_ratio: float
+) -> Dict[str, Any]:
+    """Combine base samples with per-strategy augmented samples into a task result."""
+    samples = list(base_result['samples'])
+    for strategy_samples in augmented_results:
+        samples.extend(strategy_samples or [])
+    
+    result = GenerationResponse(
+        samples=samples,
+        total_samples=len(samples),
+        total_tokens_estimated=sum(sample['tokens_estimated'] for sample in samples)
+    )
+    
+    logger.info(
+        f"Augmented generation task {task_id} completed: "
+        f"{len(base_result['samples'])} original + "
+        f"{len(samples) - len(base_result['samples'])} augmented = "
+        f"{result.total_samples} total samples"
+    )
+    
+    return {
+        'status': 'SUCCESS',
+        'result': result.model_dump(mode='json'),
+        'task_id': task_id,
+        'strategies_used': augmentation_strategies,
+        'augment_ratio': augment_ratio,
+        'completed_at': _now_ms()
+    }
+
+
+def _forget_results(task_ids: List[str]) -> None:
+    """Delete stored task results through the result backend's public API."""
+    backend = celery_app.backend
+    for task_id in task_ids:
+        backend.forget(task_id)
+
+
+@celery_app.task(bind=True, name='merge_augmentation_results')
+def merge_augmentation_results(
+    self,
+    augmented_results: List[List[Dict[str, Any]]],
+    base_result: Dict[str, Any],
+    augmentation_strategies: List[str],
+    augment_ratio: float,
+    subtask_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Chord callback merging per-strategy augmentation results with the base samples.
+    
+    Args:
+        augmented_results: Serialized augmented samples from each strategy subtask
+        base_result: Serialized GenerationResponse of the original samples
+        augmentation_strategies: Strategies that were applied
+        augment_ratio: Ratio of augmented to original samples
+        subtask_ids: Ids of the strategy subtasks whose stored results can be released
+        
+    Returns:
+        Dictionary containing task results
+    """
+    result = _build_augmented_result(
+        self.request.id, base_result, augmented_results, augmentation_strategies, augment_ratio
+    )
+    
+    # Intermediate results are merged; free them from the result backend
+    if subtask_ids:
+        _forget_results(subtask_ids)
+    
+    return result
+
+
 @celery_app.task(name='cleanup_expired_results')
 def cleanup_expired_results() -> Dict[str, Any]:
     """
@@ -449,8 +665,8 @@ def validate_generation_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         request = GenerationRequest(**request_data)
-        from app.services.generation_service import GenerationService
-        service = GenerationService()
+        from app.services.generation_service import get_generation_service
+        service = get_generation_service()
         
         # Run async validation
         async def run_validation():
@@ -8,18 +8,25 @@ Based on expert research findings from sentiment analysis training data generati
 """
 
 import asyncio
+import functools
 import logging
 import re
 import uuid
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, Any
+from types import MappingProxyType
+from typing import Awaitable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 
 from app.config import get_settings
 from app.models.schemas import GeneratedSample
 from app.utils.llm_client import get_llm_client, LLMException
+from app.utils.embeddings import embed_texts, pairwise_cosine
+from app.utils.llm_cache import get_semantic_llm_cache
+from app.utils.token_utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -56,62 +63,216 @@ class AugmentationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Common aspect keywords for customer service, products, etc.
+_ASPECT_KEYWORDS: FrozenSet[str] = frozenset({
+    # Product aspects
+    'quality', 'price', 'cost', 'value', 'design', 'appearance',
+    'performance', 'speed', 'reliability', 'durability', 'features',
+    'functionality', 'usability', 'interface', 'battery', 'display',
+    'size', 'weight', 'color', 'style', 'brand', 'packaging',
+    
+    # Service aspects  
+    'service', 'support', 'help', 'assistance', 'response', 'delivery',
+    'shipping', 'installation', 'setup', 'training', 'documentation',
+    'warranty', 'guarantee', 'refund', 'return', 'exchange',
+    
+    # Experience aspects
+    'experience', 'satisfaction', 'convenience', 'ease', 'simplicity',
+    'comfort', 'safety', 'security', 'privacy', 'trust', 'confidence'
+})
+
+# Sentiment-bearing words for validation
+_SENTIMENT_WORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'positive': (
+        'excellent', 'amazing', 'great', 'wonderful', 'fantastic',
+        'outstanding', 'superb', 'brilliant', 'perfect', 'love',
+        'like', 'enjoy', 'pleased', 'satisfied', 'happy', 'delighted'
+    ),
+    'negative': (
+        'terrible', 'awful', 'horrible', 'disappointing', 'frustrating',
+        'annoying', 'poor', 'bad', 'worst', 'hate', 'dislike',
+        'unhappy', 'dissatisfied', 'angry', 'upset', 'confused'
+    ),
+    'neutral': (
+        'okay', 'fine', 'average', 'standard', 'normal', 'typical',
+        'regular', 'basic', 'simple', 'plain', 'moderate'
+    )
+})
+
+# Product names and generic product nouns, matched against lowercased text in addition to
+# aspect keywords. The proper-noun pattern has always been applied case-insensitively, so
+# each word is any two or more letters; matching lowercased text skips case folding.
+_PRODUCT_PATTERNS = (
+    re.compile(r'\b[a-z]{2,}(?:\s+[a-z]{2,})*\b'),  # Proper nouns
+    re.compile(r'\b(?:app|software|device|product|service|system|platform)\b'),
+)
+
+
+class _KeywordMatcher:
+    """
+    Finds every keyword occurring as a substring of a text in a single scan.
+    
+    Uses a pyahocorasick automaton when the package is installed, which reports
+    overlapping keywords (including one that is a prefix of another); otherwise each
+    keyword is checked with a substring test.
+    """
+    
+    def __init__(self, keywords: Set[str]):
+        self._empty = not keywords
+        self._keywords = tuple(keywords)
+        try:
+            import ahocorasick  # type: ignore
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        except ImportError:
+            self._automaton = None
+    
+    def find_all(self, text_lower: str) -> List[str]:
+        """Return the distinct keywords found in already-lowercased text."""
+        if self._empty:
+            return []
+        if self._automaton is not None:
+            return list({keyword for _, keyword in self._automaton.iter(text_lower)})
+        return [keyword for keyword in self._keywords if keyword in text_lower]
+
+
+# Aspect alternatives requested per LLM call, and (aspect, product) keys kept per strategy
+_ALTERNATIVES_PER_CALL = 5
+_ALT_CACHE_SIZE = 1024
+
+# Aspects whose alternatives CADA prefetches while paraphrasing
+_PREFETCH_ASPECTS = 3
+
+# Streamed paraphrases must contain every aspect by this multiple of the original's length
+_STREAM_LENGTH_FACTOR = 1.2
+_PARAPHRASE_STREAM_ATTEMPTS = 2
+
+
+@functools.lru_cache(maxsize=1024)
+def _matcher_for(keywords: FrozenSet[str]) -> _KeywordMatcher:
+    """Shared matcher for a set of lowercased keywords (e.g. one request's aspects)."""
+    return _KeywordMatcher(keywords)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_word_boundary(aspect: str) -> re.Pattern:
+    """Case-insensitive whole-word pattern for an aspect term."""
+    return re.compile(r'\b' + re.escape(aspect) + r'\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_aspects_cached(text: str, matcher: _KeywordMatcher) -> Tuple[str, ...]:
+    """Aspect keywords plus product names found in text."""
+    text_lower = text.lower()
+    found_aspects = matcher.find_all(text_lower)
+    
+    # Also look for product names and specific nouns
+    for pattern in _PRODUCT_PATTERNS:
+        found_aspects.extend(pattern.findall(text_lower))
+    
+    return tuple(set(found_aspects))
+
+
+class _VariantSlots:
+    """
+    Bound on variant generations in flight, shared by every strategy of a service.
+    
+    Semaphores belong to the event loop that waits on them, so there is one per loop
+    (the API process's loop and each Celery worker's loop).
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def get(self) -> asyncio.Semaphore:
+        """Get the semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+
+@dataclass(frozen=True)
+class _RequestContext:
+    """Data derived once from a request's original text and shared by every variant."""
+    original_text: str
+    original_lower: str
+    original_tokens: FrozenSet[str]
+    aspects: List[str]
+    aspects_lower: FrozenSet[str]
+    matcher: _KeywordMatcher
+    
+    @classmethod
+    def build(cls, text: str, aspects: List[str]) -> "_RequestContext":
+        original_lower = text.lower()
+        aspects_lower = frozenset(aspect.lower() for aspect in aspects)
+        return cls(
+            original_text=text,
+            original_lower=original_lower,
+            original_tokens=frozenset(original_lower.split()),
+            aspects=aspects,
+            aspects_lower=aspects_lower,
+            matcher=_matcher_for(aspects_lower)
+        )
+
+
 class AugmentationStrategyBase(ABC):
     """Base class for data augmentation strategies."""
     
-    def __init__(self):
+    # Shared, immutable keyword data (built once at import, not per strategy instance)
+    _aspect_keywords = _ASPECT_KEYWORDS
+    _sentiment_words = _SENTIMENT_WORDS
+    
+    def __init__(self, variant_slots: Optional[_VariantSlots] = None):
+        """
+        Args:
+            variant_slots: Concurrency bound to share with other strategies (a new one
+                of augmentation_concurrency_limit if omitted)
+        """
         self.settings = get_settings()
-        self._aspect_keywords = self._load_aspect_keywords()
-        self._sentiment_words = self._load_sentiment_words()
+        self._aspect_matcher = _matcher_for(_ASPECT_KEYWORDS)
+        self._variant_slots = variant_slots or _VariantSlots(self.settings.augmentation_concurrency_limit)
     
     @abstractmethod
     async def augment(self, request: AugmentationRequest) -> AugmentationResult:
         """Generate augmented text variants using this strategy."""
         pass
     
-    @abstractmethod
-    def _extract_aspects(self, text: str) -> List[str]:
-        """Extract aspect terms from text."""
-        pass
-    
-    def _load_aspect_keywords(self) -> Set[str]:
-        """Load common aspect keywords for different domains."""
-        # Common aspect terms for customer service, products, etc.
-        return {
-            # Product aspects
-            'quality', 'price', 'cost', 'value', 'design', 'appearance',
-            'performance', 'speed', 'reliability', 'durability', 'features',
-            'functionality', 'usability', 'interface', 'battery', 'display',
-            'size', 'weight', 'color', 'style', 'brand', 'packaging',
-            
-            # Service aspects  
-            'service', 'support', 'help', 'assistance', 'response', 'delivery',
-            'shipping', 'installation', 'setup', 'training', 'documentation',
-            'warranty', 'guarantee', 'refund', 'return', 'exchange',
-            
-            # Experience aspects
-            'experience', 'satisfaction', 'convenience', 'ease', 'simplicity',
-            'comfort', 'safety', 'security', 'privacy', 'trust', 'confidence'
-        }
+    async def _gather_variants(self, label: str, coros: List[Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent variant coroutines concurrently, bounded by the configured limit.
+        
+        The bound is shared with every strategy using the same slots, so concurrent
+        requests and CADA's nested CDA/ADA runs stay within it together. Returns one
+        result per coroutine in order; failed variants are logged and returned as None.
+        """
+        semaphore = self._variant_slots.get()
+        
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+        
+        results = await asyncio.gather(*(bounded(c) for c in coros), return_exceptions=True)
+        
+        outcomes = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.warning(f"{label} variant {i} generation failed: {result}")
+                result = None
+            outcomes.append(result)
+        return outcomes
     
-    def _load_sentiment_words(self) -> Dict[str, List[str]]:
-        """Load sentiment-bearing words for validation."""
-        return {
-            'positive': [
-                'excellent', 'amazing', 'great', 'wonderful', 'fantastic',
-                'outstanding', 'superb', 'brilliant', 'perfect', 'love',
-                'like', 'enjoy', 'pleased', 'satisfied', 'happy', 'delighted'
-            ],
-            'negative': [
-                'terrible', 'awful', 'horrible', 'disappointing', 'frustrating',
-                'annoying', 'poor', 'bad', 'worst', 'hate', 'dislike',
-                'unhappy', 'dissatisfied', 'angry', 'upset', 'confused'
-            ],
-            'neutral': [
-                'okay', 'fine', 'average', 'standard', 'normal', 'typical',
-                'regular', 'basic', 'simple', 'plain', 'moderate'
-            ]
-        }
+    def _extract_aspects(self, text: str) -> List[str]:
+        """Extract aspect terms from text using keyword matching."""
+        # Memoized: CADA and its sub-strategies extract aspects from the same text repeatedly
+        return list(_extract_aspects_cached(text, self._aspect_matcher))
     
     async def _validate_preservation(self, 
                                    original: str, 
@@ -119,32 +280,104 @@ class AugmentationStrategyBase(ABC):
                                    aspects_to_preserve: List[str]) -> Tuple[bool, float]:
         """Validate that important aspects are preserved in augmented text."""
         try:
-            # Check aspect preservation
-            preserved_aspects = 0
-            for aspect in aspects_to_preserve:
-                if aspect.lower() in augmented.lower():
-                    preserved_aspects += 1
+            aspect_preservation = self._aspect_preservation(augmented, aspects_to_preserve)
             
-            aspect_preservation = preserved_aspects / len(aspects_to_preserve) if aspects_to_preserve else 1.0
+            # Skip the similarity check when even a perfect score could not pass
+            if not self._can_pass_validation(aspect_preservation):
+                return False, aspect_preservation / 2
             
             # Use LLM for semantic similarity check if available
             similarity_score = await self._calculate_semantic_similarity(original, augmented)
             
-            # Combined validation score
-            validation_score = (aspect_preservation + similarity_score) / 2
-            is_valid = validation_score >= 0.8  # Threshold for acceptance
-            
-            return is_valid, validation_score
+            return self._combine_validation_scores(aspect_preservation, similarity_score)
             
         except Exception as e:
             logger.warning(f"Validation failed: {e}")
             return False, 0.0
     
+    async def _validate_preservation_batch(self,
+                                         context: _RequestContext,
+                                         variants: List[str]) -> List[Tuple[bool, float]]:
+        """
+        Validate several variants of one original against all of its aspects,
+        embedding all texts in one forward pass.
+        
+        Variants whose aspect preservation already rules them out are rejected without
+        being embedded. Falls back to per-variant validation when local embeddings are
+        unavailable.
+        """
+        if not variants:
+            return []
+        
+        preservations = [self._aspect_preservation(v, context.aspects, context.matcher) for v in variants]
+        results = [(False, p / 2) for p in preservations]
+        candidates = [i for i, p in enumerate(preservations) if self._can_pass_validation(p)]
+        if not candidates:
+            return results
+        
+        try:
+            embeddings = await asyncio.to_thread(
+                embed_texts, [context.original_text] + [variants[i] for i in candidates]
+            )
+        except Exception as e:
+            logger.warning(f"Batch embedding failed, validating variants individually: {e}")
+            embeddings = None
+        
+        if embeddings is None:
+            return list(await asyncio.gather(
+                *(self._validate_preservation(context.original_text, v, context.aspects) for v in variants)
+            ))
+        
+        similarities = (embeddings[1:] @ embeddings[0]).tolist()
+        for i, similarity in zip(candidates, similarities):
+            results[i] = self._combine_validation_scores(preservations[i], min(max(similarity, 0.0), 1.0))
+        return results
+    
+    def _aspect_preservation(self,
+                             augmented: str,
+                             aspects_to_preserve: List[str],
+                             matcher: Optional[_KeywordMatcher] = None) -> float:
+        """
+        Fraction of aspects that still appear in the augmented text.
+        
+        All aspects are found in a single scan; pass a matcher built once per
+        request to reuse it across variants.
+        """
+        if not aspects_to_preserve:
+            return 1.0
+        
+        if matcher is None:
+            matcher = _matcher_for(frozenset(aspect.lower() for aspect in aspects_to_preserve))
+        preserved_aspects = len(matcher.find_all(augmented.lower()))
+        
+        return preserved_aspects / len(aspects_to_preserve)
+    
+    @classmethod
+    def _can_pass_validation(cls, aspect_preservation: float) -> bool:
+        """Whether a variant with this aspect preservation could pass with a perfect similarity."""
+        return cls._combine_validation_scores(aspect_preservation, 1.0)[0]
+    
+    @staticmethod
+    def _combine_validation_scores(aspect_preservation: float, similarity_score: float) -> Tuple[bool, float]:
+        """Combine aspect preservation and similarity into (is_valid, validation_score)."""
+        validation_score = (aspect_preservation + similarity_score) / 2
+        is_valid = validation_score >= 0.8  # Threshold for acceptance
+        return is_valid, validation_score
+    
     async def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
+        """Calculate semantic similarity between two texts using local embeddings."""
+        try:
+            similarities = await asyncio.to_thread(pairwise_cosine, [text1], [text2])
+            if similarities is not None:
+                return min(max(similarities[0], 0.0), 1.0)
+        except Exception as e:
+            logger.warning(f"Embedding similarity failed, falling back to LLM: {e}")
+        
+        return await self._calculate_llm_similarity(text1, text2)
+    
+    async def _calculate_llm_similarity(self, text1: str, text2: str) -> float:
         """Calculate semantic similarity between two texts using LLM."""
         try:
-            llm_client = get_llm_client()
-            
             prompt = f"""
             Please rate the semantic similarity between these two texts on a scale of 0.0 to 1.0:
             
@@ -159,7 +392,10 @@ class AugmentationStrategyBase(ABC):
             Respond with only a number between 0.0 and 1.0:
             """
             
-            response = await llm_client.generate(prompt, temperature=0.0, max_tokens=10)
+            response = await get_semantic_llm_cache().generate(
+                prompt, temperature=0.0, max_tokens=10,
+                namespace=('similarity', text1), key_text=text2
+            )
             
             # Extract numeric score
             score_match = re.search(r'(\d+\.?\d*)', response.strip())
@@ -190,32 +426,30 @@ class ContextFocusedAugmentation(AugmentationStrategyBase):
         preserved_aspects = aspects.copy()
         changed_elements = []
         
-        for i in range(request.num_variants):
-            try:
-                # Generate paraphrase with aspect preservation
-                variant = await self._generate_context_paraphrase(
-                    request.text, 
-                    aspects, 
-                    request.preserve_sentiment
+        context = _RequestContext.build(request.text, aspects)
+        
+        # Phase 1: generate all candidate paraphrases concurrently
+        paraphrases = await self._gather_variants(
+            "CDA",
+            [
+                self._generate_context_paraphrase(
+                    request.text, aspects, request.preserve_sentiment, variant_index=i
                 )
+                for i in range(request.num_variants)
+            ]
+        )
+        candidates = [v for v in paraphrases if v and v != request.text]
+        
+        # Phase 2: validate every candidate in one batch
+        validations = await self._validate_preservation_batch(context, candidates)
+        
+        for variant, (is_valid, score) in zip(candidates, validations):
+            if is_valid and score >= request.min_similarity:
+                augmented_texts.append(variant)
+                quality_scores.append(score)
                 
-                if variant and variant != request.text:
-                    # Validate preservation
-                    is_valid, score = await self._validate_preservation(
-                        request.text, variant, aspects
-                    )
-                    
-                    if is_valid and score >= request.min_similarity:
-                        augmented_texts.append(variant)
-                        quality_scores.append(score)
-                        
-                        # Track what changed
-                        changes = self._identify_changes(request.text, variant, aspects)
-                        changed_elements.extend(changes)
-                
-            except Exception as e:
-                logger.warning(f"CDA variant {i} generation failed: {e}")
-                continue
+                # Track what changed
+                changed_elements.extend(self._identify_changes(context, variant))
         
         return AugmentationResult(
             original_text=request.text,
@@ -231,34 +465,17 @@ class ContextFocusedAugmentation(AugmentationStrategyBase):
             }
         )
     
-    def _extract_aspects(self, text: str) -> List[str]:
-        """Extract aspect terms from text using keyword matching."""
-        text_lower = text.lower()
-        found_aspects = []
-        
-        for aspect in self._aspect_keywords:
-            if aspect in text_lower:
-                found_aspects.append(aspect)
-        
-        # Also look for product names and specific nouns
-        product_patterns = [
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',  # Proper nouns
-            r'\b(?:app|software|device|product|service|system|platform)\b'
-        ]
-        
-        for pattern in product_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found_aspects.extend([m.lower() for m in matches])
-        
-        return list(set(found_aspects))
-    
     async def _generate_context_paraphrase(self, 
                                          text: str, 
                                          aspects: List[str],
-                                         preserve_sentiment: bool) -> str:
-        """Generate paraphrase that preserves aspects and sentiment."""
-        llm_client = get_llm_client()
+                                         preserve_sentiment: bool,
+                                         variant_index: int = 0) -> str:
+        """
+        Generate paraphrase that preserves aspects and sentiment.
         
+        Responses are cached per variant index so that repeated or near-identical seed
+        texts reuse earlier paraphrases while variants of one text stay distinct.
+        """
         # Create constraint instructions
         aspect_constraint = ""
         if aspects:
@@ -281,24 +498,61 @@ class ContextFocusedAugmentation(AugmentationStrategyBase):
         Paraphrase:
         """
         
-        response = await llm_client.generate(prompt, temperature=0.7, max_tokens=150)
+        response = await get_semantic_llm_cache().generate(
+            prompt, temperature=0.7, max_tokens=150,
+            namespace=('paraphrase', tuple(sorted(aspects)), preserve_sentiment, variant_index),
+            key_text=text,
+            producer=lambda: self._stream_paraphrase(prompt, text, aspects),
+            # Near-identical texts can differ in sentiment ("great" vs "terrible"), so a
+            # paraphrase is only reused for the exact same text
+            semantic=False
+        )
         return response.strip().strip('"')
     
-    def _identify_changes(self, original: str, variant: str, aspects: List[str]) -> List[str]:
+    async def _stream_paraphrase(self, prompt: str, text: str, aspects: List[str]) -> str:
+        """
+        Stream a paraphrase, abandoning it as soon as it is certain to drop an aspect.
+        
+        Once the output is longer than the original by _STREAM_LENGTH_FACTOR every aspect
+        should already have appeared; if one has not, the stream is closed (stopping
+        generation) and the paraphrase retried. Returns "" if every attempt is abandoned.
+        """
+        required = [aspect.lower() for aspect in aspects]
+        length_limit = len(text) * _STREAM_LENGTH_FACTOR
+        
+        for attempt in range(_PARAPHRASE_STREAM_ATTEMPTS):
+            stream = get_llm_client().generate_stream(prompt, temperature=0.7, max_tokens=150)
+            chunks = []
+            length = 0
+            abandoned = False
+            try:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    length += len(chunk)
+                    if length > length_limit and required:
+                        generated = ''.join(chunks).lower()
+                        if not all(aspect in generated for aspect in required):
+                            abandoned = True
+                            break
+            finally:
+                await stream.aclose()
+            
+            if not abandoned:
+                return ''.join(chunks)
+            logger.debug(f"Abandoned paraphrase attempt {attempt} missing required aspects")
+        
+        return ""
+    
+    def _identify_changes(self, context: _RequestContext, variant: str) -> List[str]:
         """Identify what elements changed between original and variant."""
-        original_words = set(original.lower().split())
-        variant_words = set(variant.lower().split())
-        aspect_words = set(aspect.lower() for aspect in aspects)
+        variant_words = frozenset(variant.lower().split())
+        original_words = context.original_tokens
         
         # Words that were changed (not in aspects)
-        added_words = variant_words - original_words - aspect_words
-        removed_words = original_words - variant_words - aspect_words
-        
-        changes = []
-        changes.extend([f"added: {word}" for word in added_words])
-        changes.extend([f"removed: {word}" for word in removed_words])
+        added_words = variant_words - original_words - context.aspects_lower
+        removed_words = original_words - variant_words - context.aspects_lower
         
-        return changes
+        return [f"added: {word}" for word in added_words] + [f"removed: {word}" for word in removed_words]
 
 
 class AspectFocusedAugmentation(AugmentationStrategyBase):
@@ -309,6 +563,13 @@ class AspectFocusedAugmentation(AugmentationStrategyBase):
     Increases diversity of aspect terms and improves model robustness.
     """
     
+    def __init__(self, variant_slots: Optional[_VariantSlots] = None):
+        super().__init__(variant_slots)
+        # (aspect, product) -> [alternatives, next index to hand out]
+        self._alt_cache: "OrderedDict[Tuple[str, Optional[str]], list]" = OrderedDict()
+        # In-flight fetches, so concurrent variants share one LLM call per key
+        self._alt_pending: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+    
     async def augment(self, request: AugmentationRequest) -> AugmentationResult:
         """Generate ADA variants by replacing aspects with alternatives."""
         aspects = self._extract_aspects(request.text)
@@ -328,48 +589,30 @@ class AspectFocusedAugmentation(AugmentationStrategyBase):
                 metadata={'no_aspects_found': True}
             )
         
-        for i in range(request.num_variants):
-            try:
-                # Select aspect to replace
-                aspect_to_replace = aspects[i % len(aspects)]
-                
-                # Generate alternative aspect
-                alternative = await self._generate_aspect_alternative(
-                    aspect_to_replace, 
-                    request.text,
-                    request.product
-                )
-                
-                if alternative and alternative != aspect_to_replace:
-                    # Replace in text
-                    variant = self._replace_aspect_in_text(
-                        request.text, 
-                        aspect_to_replace, 
-                        alternative
-                    )
-                    
-                    if variant != request.text:
-                        # Validate preservation
-                        remaining_aspects = [a for a in aspects if a != aspect_to_replace]
-                        is_valid, score = await self._validate_preservation(
-                            request.text, variant, remaining_aspects
-                        )
-                        
-                        if is_valid and score >= request.min_similarity:
-                            augmented_texts.append(variant)
-                            quality_scores.append(score)
-                            changed_elements.append(f"replaced '{aspect_to_replace}' with '{alternative}'")
-                
-            except Exception as e:
-                logger.warning(f"ADA variant {i} generation failed: {e}")
+        context = _RequestContext.build(request.text, aspects)
+        
+        outcomes = await self._gather_variants(
+            "ADA", [self._generate_variant(request, context, i) for i in range(request.num_variants)]
+        )
+        
+        replaced_aspects = []
+        for outcome in outcomes:
+            if outcome is None:
                 continue
+            variant, score, aspect_to_replace, alternative = outcome
+            augmented_texts.append(variant)
+            quality_scores.append(score)
+            changed_elements.append(f"replaced '{aspect_to_replace}' with '{alternative}'")
+            replaced_aspects.append(aspect_to_replace)
+        
+        replaced_set = frozenset(replaced_aspects)
         
         return AugmentationResult(
             original_text=request.text,
             augmented_texts=augmented_texts,
             strategy_used=AugmentationStrategy.ADA,
             quality_scores=quality_scores,
-            preserved_aspects=[a for a in aspects if a not in [ce.split("'")[1] for ce in changed_elements if "replaced" in ce]],
+            preserved_aspects=[a for a in aspects if a not in replaced_set],
             changed_elements=changed_elements,
             metadata={
                 'original_aspects': aspects,
@@ -377,6 +620,52 @@ class AspectFocusedAugmentation(AugmentationStrategyBase):
             }
         )
     
+    async def _generate_variant(self,
+                                request: AugmentationRequest,
+                                context: _RequestContext,
+                                index: int) -> Optional[Tuple[str, float, str, str]]:
+        """
+        Generate and validate one ADA variant.
+        
+        Returns:
+            (variant, score, replaced aspect, alternative) if accepted, else None
+        """
+        aspects = context.aspects
+        
+        # Select aspect to replace
+        aspect_to_replace = aspects[index % len(aspects)]
+        
+        # Generate alternative aspect
+        alternative = await self._generate_aspect_alternative(
+            aspect_to_replace, 
+            request.text,
+            request.product
+        )
+        
+        if not alternative or alternative == aspect_to_replace:
+            return None
+        
+        # Replace in text
+        variant = self._replace_aspect_in_text(
+            request.text, 
+            aspect_to_replace, 
+            alternative
+        )
+        
+        if variant == request.text:
+            return None
+        
+        # Validate preservation
+        remaining_aspects = [a for a in aspects if a != aspect_to_replace]
+        is_valid, score = await self._validate_preservation(
+            request.text, variant, remaining_aspects
+        )
+        
+        if not (is_valid and score >= request.min_similarity):
+            return None
+        
+        return variant, score, aspect_to_replace, alternative
+    
     def _extract_aspects(self, text: str) -> List[str]:
         """Extract aspect terms with more sophisticated NLP techniques."""
         return super()._extract_aspects(text)
@@ -384,41 +673,105 @@ class AspectFocusedAugmentation(AugmentationStrategyBase):
     async def _generate_aspect_alternative(self, 
                                          aspect: str, 
                                          context: str,
-                                         product: Optional[str] = None) -> str:
-        """Generate semantically suitable alternative for an aspect term."""
-        llm_client = get_llm_client()
+                                         product: Optional[str] = None) -> Optional[str]:
+        """
+        Get a semantically suitable alternative for an aspect term.
+        
+        Alternatives barely depend on the context sentence, so the LLM is asked for
+        several at once per (aspect, product) and later calls rotate through them.
+        """
+        entry = await self._cached_alternatives(aspect, context, product)
+        if entry is None:
+            return None
+        
+        alternatives, next_index = entry
+        entry[1] = next_index + 1
+        return alternatives[next_index % len(alternatives)]
+    
+    def has_alternatives(self, aspect: str, product: Optional[str] = None) -> bool:
+        """Whether alternatives for (aspect, product) are cached or already being fetched."""
+        key = (aspect.lower(), product)
+        return key in self._alt_cache or key in self._alt_pending
+    
+    async def prefetch_alternatives(self,
+                                    aspects: List[str],
+                                    context: str,
+                                    product: Optional[str] = None) -> None:
+        """Warm the alternative cache for several aspects concurrently; failures are ignored."""
+        await asyncio.gather(
+            *(self._cached_alternatives(aspect, context, product) for aspect in aspects),
+            return_exceptions=True
+        )
+    
+    async def _cached_alternatives(self,
+                                   aspect: str,
+                                   context: str,
+                                   product: Optional[str] = None) -> Optional[list]:
+        """Cache entry for (aspect, product), fetching it at most once even for concurrent callers."""
+        key = (aspect.lower(), product)
+        entry = self._alt_cache.get(key)
+        if entry is not None:
+            self._alt_cache.move_to_end(key)
+            return entry
         
+        task = self._alt_pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_alternatives(key, aspect, context, product))
+            self._alt_pending[key] = task
+        await task
+        return self._alt_cache.get(key)
+    
+    async def _load_alternatives(self,
+                                 key: Tuple[str, Optional[str]],
+                                 aspect: str,
+                                 context: str,
+                                 product: Optional[str]) -> None:
+        """Fetch alternatives into the cache, evicting the least recently used keys when full."""
+        try:
+            alternatives = await self._fetch_aspect_alternatives(aspect, context, product)
+            if alternatives:
+                self._alt_cache[key] = [alternatives, 0]
+                while len(self._alt_cache) > _ALT_CACHE_SIZE:
+                    self._alt_cache.popitem(last=False)
+        finally:
+            self._alt_pending.pop(key, None)
+    
+    async def _fetch_aspect_alternatives(self,
+                                         aspect: str,
+                                         context: str,
+                                         product: Optional[str] = None) -> List[str]:
+        """Ask the LLM for several alternatives to an aspect term in one call."""
         product_context = f" in the context of {product}" if product else ""
         
         prompt = f"""
-        Generate a semantically similar alternative for the aspect term "{aspect}"{product_context}.
+        Generate {_ALTERNATIVES_PER_CALL} semantically similar alternatives for the aspect term "{aspect}"{product_context}.
         
         Context sentence: "{context}"
         
         Requirements:
-        1. The alternative should be semantically related but different
-        2. It should fit naturally in the context
+        1. The alternatives should be semantically related but different
+        2. They should fit naturally in the context
         3. Maintain the same domain and meaning category
-        4. Ensure it's a valid substitute
+        4. Ensure each is a valid substitute
         
-        Provide only the alternative term, no explanation:
+        Provide only the alternative terms as a comma-separated list, no explanation:
         """
         
-        response = await llm_client.generate(prompt, temperature=0.8, max_tokens=20)
-        alternative = response.strip().strip('"').lower()
+        response = await get_llm_client().generate(prompt, temperature=0.8, max_tokens=60)
         
-        # Verify it's actually different
-        if alternative == aspect.lower():
-            return None
+        alternatives = []
+        for candidate in re.split(r'[,\n]', response):
+            alternative = candidate.strip().strip('"').strip().lower()
+            # Verify it's actually different
+            if alternative and alternative != aspect.lower() and alternative not in alternatives:
+                alternatives.append(alternative)
         
-        return alternative
+        return alternatives[:_ALTERNATIVES_PER_CALL]
     
     def _replace_aspect_in_text(self, text: str, old_aspect: str, new_aspect: str) -> str:
         """Replace aspect term in text while preserving context."""
-        # Case-sensitive replacement with word boundaries
-        pattern = r'\b' + re.escape(old_aspect) + r'\b'
-        result = re.sub(pattern, new_aspect, text, flags=re.IGNORECASE)
-        return result
+        # Case-insensitive replacement with word boundaries; the alternative is inserted literally
+        return _compile_word_boundary(old_aspect).sub(lambda _: new_aspect, text)
 
 
 class ContextAspectAugmentation(AugmentationStrategyBase):
@@ -429,14 +782,25 @@ class ContextAspectAugmentation(AugmentationStrategyBase):
     Achieves best performance with diversification of both sentence structure and aspect terms.
     """
     
-    def __init__(self):
-        super().__init__()
-        self.cda_strategy = ContextFocusedAugmentation()
-        self.ada_strategy = AspectFocusedAugmentation()
+    def __init__(self,
+                 cda: Optional[ContextFocusedAugmentation] = None,
+                 ada: Optional[AspectFocusedAugmentation] = None):
+        """
+        Args:
+            cda: CDA strategy to reuse (e.g. the service's own instance)
+            ada: ADA strategy to reuse, sharing its aspect-alternative cache
+        
+        The combined variants share the concurrency bound of the reused strategies.
+        """
+        shared = cda or ada
+        super().__init__(shared._variant_slots if shared else None)
+        self.cda_strategy = cda or ContextFocusedAugmentation(self._variant_slots)
+        self.ada_strategy = ada or AspectFocusedAugmentation(self._variant_slots)
     
     async def augment(self, request: AugmentationRequest) -> AugmentationResult:
         """Generate CADA variants by combining CDA and ADA strategies."""
         aspects = self._extract_aspects(request.text)
+        context = _RequestContext.build(request.text, aspects)
         augmented_texts = []
         quality_scores = []
         changed_elements = []
@@ -457,11 +821,6 @@ class ContextAspectAugmentation(AugmentationStrategyBase):
             product=request.product
         )
         
-        cda_result = await self.cda_strategy.augment(cda_request)
-        augmented_texts.extend(cda_result.augmented_texts)
-        quality_scores.extend(cda_result.quality_scores)
-        changed_elements.extend([f"CDA: {change}" for change in cda_result.changed_elements])
-        
         # Generate ADA variants
         ada_request = AugmentationRequest(
             text=request.text,
@@ -473,49 +832,45 @@ class ContextAspectAugmentation(AugmentationStrategyBase):
             product=request.product
         )
         
-        ada_result = await self.ada_strategy.augment(ada_request)
+        # Generate combined variants (apply both strategies sequentially)
+        combined_variants = min(2, request.num_variants // 3) if request.num_variants > 3 else 0
+        
+        # The CDA, ADA and combined variants are independent, so run them concurrently
+        awaitables = [
+            self.cda_strategy.augment(cda_request),
+            self.ada_strategy.augment(ada_request),
+            self._gather_variants(
+                "CADA combined",
+                [
+                    self._generate_combined_variant(request, context, cda_variants, i)
+                    for i in range(combined_variants)
+                ]
+            ),
+        ]
+        if combined_variants:
+            # Speculatively fetch alternatives for aspects likely to survive the paraphrase,
+            # overlapping that LLM call with the paraphrase instead of following it
+            likely_aspects = [a for a in context.aspects if a in _ASPECT_KEYWORDS][:_PREFETCH_ASPECTS]
+            awaitables.append(
+                self.ada_strategy.prefetch_alternatives(likely_aspects, request.text, request.product)
+            )
+        cda_result, ada_result, combined_outcomes = (await asyncio.gather(*awaitables))[:3]
+        
+        augmented_texts.extend(cda_result.augmented_texts)
+        quality_scores.extend(cda_result.quality_scores)
+        changed_elements.extend([f"CDA: {change}" for change in cda_result.changed_elements])
+        
         augmented_texts.extend(ada_result.augmented_texts)
         quality_scores.extend(ada_result.quality_scores)
         changed_elements.extend([f"ADA: {change}" for change in ada_result.changed_elements])
         
-        # Generate combined variants (apply both strategies sequentially)
-        combined_variants = min(2, request.num_variants // 3) if request.num_variants > 3 else 0
-        
-        for i in range(combined_variants):
-            try:
-                # First apply CDA
-                cda_intermediate = await self.cda_strategy._generate_context_paraphrase(
-                    request.text, aspects, request.preserve_sentiment
-                )
-                
-                if cda_intermediate and cda_intermediate != request.text:
-                    # Then apply ADA to the CDA result
-                    cda_aspects = self.ada_strategy._extract_aspects(cda_intermediate)
-                    if cda_aspects:
-                        aspect_to_replace = cda_aspects[0]
-                        alternative = await self.ada_strategy._generate_aspect_alternative(
-                            aspect_to_replace, cda_intermediate, request.product
-                        )
-                        
-                        if alternative:
-                            combined_variant = self.ada_strategy._replace_aspect_in_text(
-                                cda_intermediate, aspect_to_replace, alternative
-                            )
-                            
-                            # Validate combined variant
-                            remaining_aspects = [a for a in aspects if a != aspect_to_replace]
-                            is_valid, score = await self._validate_preservation(
-                                request.text, combined_variant, remaining_aspects
-                            )
-                            
-                            if is_valid and score >= request.min_similarity:
-                                augmented_texts.append(combined_variant)
-                                quality_scores.append(score)
-                                changed_elements.append(f"CADA: context + aspect replacement")
-            
-            except Exception as e:
-                logger.warning(f"CADA combined variant {i} generation failed: {e}")
+        for outcome in combined_outcomes:
+            if outcome is None:
                 continue
+            combined_variant, score = outcome
+            augmented_texts.append(combined_variant)
+            quality_scores.append(score)
+            changed_elements.append(f"CADA: context + aspect replacement")
         
         return AugmentationResult(
             original_text=request.text,
@@ -533,6 +888,53 @@ class ContextAspectAugmentation(AugmentationStrategyBase):
             }
         )
     
+    async def _generate_combined_variant(self,
+                                         request: AugmentationRequest,
+                                         context: _RequestContext,
+                                         cda_variants: int,
+                                         index: int) -> Optional[Tuple[str, float]]:
+        """Paraphrase the text then replace an aspect, returning (variant, score) if accepted."""
+        # First apply CDA, offset past the CDA variants so cached paraphrases are not reused
+        cda_intermediate = await self.cda_strategy._generate_context_paraphrase(
+            request.text, context.aspects, request.preserve_sentiment,
+            variant_index=cda_variants + index
+        )
+        
+        if not cda_intermediate or cda_intermediate == request.text:
+            return None
+        
+        # Then apply ADA to the CDA result
+        cda_aspects = self.ada_strategy._extract_aspects(cda_intermediate)
+        if not cda_aspects:
+            return None
+        
+        # Prefer an aspect whose alternatives were prefetched; otherwise fetch sequentially
+        aspect_to_replace = next(
+            (a for a in cda_aspects if self.ada_strategy.has_alternatives(a, request.product)),
+            cda_aspects[0]
+        )
+        alternative = await self.ada_strategy._generate_aspect_alternative(
+            aspect_to_replace, cda_intermediate, request.product
+        )
+        
+        if not alternative:
+            return None
+        
+        combined_variant = self.ada_strategy._replace_aspect_in_text(
+            cda_intermediate, aspect_to_replace, alternative
+        )
+        
+        # Validate combined variant
+        remaining_aspects = [a for a in context.aspects if a != aspect_to_replace]
+        is_valid, score = await self._validate_preservation(
+            request.text, combined_variant, remaining_aspects
+        )
+        
+        if not (is_valid and score >= request.min_similarity):
+            return None
+        
+        return combined_variant, score
+    
     def _extract_aspects(self, text: str) -> List[str]:
         """Use the more comprehensive aspect extraction."""
         return self.cda_strategy._extract_aspects(text)
@@ -548,10 +950,15 @@ class DataAugmentationService:
     
     def __init__(self):
         self.settings = get_settings()
+        # CADA reuses the CDA and ADA instances rather than holding its own copies, and
+        # all strategies share one bound on variants in flight
+        variant_slots = _VariantSlots(self.settings.augmentation_concurrency_limit)
+        cda = ContextFocusedAugmentation(variant_slots)
+        ada = AspectFocusedAugmentation(variant_slots)
         self.strategies = {
-            AugmentationStrategy.CDA: ContextFocusedAugmentation(),
-            AugmentationStrategy.ADA: AspectFocusedAugmentation(),
-            AugmentationStrategy.CADA: ContextAspectAugmentation()
+            AugmentationStrategy.CDA: cda,
+            AugmentationStrategy.ADA: ada,
+            AugmentationStrategy.CADA: ContextAspectAugmentation(cda, ada)
         }
     
     async def augment_text(self, request: AugmentationRequest) -> AugmentationResult:
@@ -579,33 +986,41 @@ class DataAugmentationService:
                           texts: List[str], 
                           strategy: AugmentationStrategy,
                           **kwargs) -> List[AugmentationResult]:
-        """Augment a batch of texts using the same strategy."""
-        results = []
+        """
+        Augment a batch of texts using the same strategy.
         
-        for text in texts:
-            request = AugmentationRequest(
-                text=text,
-                strategy=strategy,
-                **kwargs
-            )
-            
-            try:
-                result = await self.augment_text(request)
-                results.append(result)
-            except Exception as e:
-                logger.warning(f"Failed to augment text '{text[:50]}...': {e}")
-                # Add empty result to maintain batch consistency
-                results.append(AugmentationResult(
-                    original_text=text,
-                    augmented_texts=[],
-                    strategy_used=strategy,
-                    quality_scores=[],
-                    preserved_aspects=[],
-                    changed_elements=[],
-                    metadata={'error': str(e)}
-                ))
+        Texts are augmented concurrently, so the batch takes about as long as its
+        slowest text rather than the sum of all of them.
+        """
+        return list(await asyncio.gather(
+            *(self._augment_batch_item(text, strategy, kwargs) for text in texts)
+        ))
+    
+    async def _augment_batch_item(self,
+                                text: str,
+                                strategy: AugmentationStrategy,
+                                options: Dict[str, Any]) -> AugmentationResult:
+        """Augment one text of a batch, returning an empty result on failure."""
+        request = AugmentationRequest(
+            text=text,
+            strategy=strategy,
+            **options
+        )
         
-        return results
+        try:
+            return await self.augment_text(request)
+        except Exception as e:
+            logger.warning(f"Failed to augment text '{text[:50]}...': {e}")
+            # Add empty result to maintain batch consistency
+            return AugmentationResult(
+                original_text=text,
+                augmented_texts=[],
+                strategy_used=strategy,
+                quality_scores=[],
+                preserved_aspects=[],
+                changed_elements=[],
+                metadata={'error': str(e)}
+            )
     
     async def create_augmented_samples(self, 
                                      original_sample: GeneratedSample,
@@ -621,15 +1036,20 @@ class DataAugmentationService:
         
         result = await self.augment_text(request)
         
+        # Shared by every variant of this sample; variant ids are the batch id plus index
+        batch_id = uuid.uuid4().hex
+        generated_at = datetime.now(timezone.utc)
+        prompt_version = f"{original_sample.prompt_version}_aug_{strategy.value}"
+        
         augmented_samples = []
         for i, (text, quality_score) in enumerate(zip(result.augmented_texts, result.quality_scores)):
             augmented_sample = GeneratedSample(
-                id=str(uuid.uuid4()),
+                id=f"{batch_id}-{i}",
                 product=original_sample.product,
-                prompt_version=f"{original_sample.prompt_version}_aug_{strategy.value}",
-                generated_at=datetime.now(timezone.utc),
+                prompt_version=prompt_version,
+                generated_at=generated_at,
                 text=text,
-                tokens_estimated=len(text.split()) * 1.3,  # Rough approximation
+                tokens_estimated=estimate_tokens(text, self.settings.openai_model),
                 temperature=original_sample.temperature,
                 # Add augmentation metadata
                 metadata={
@@ -2,20 +2,110 @@
 LLM-powered text generation service with async batching and metadata collection.
 """
 import asyncio
+import contextvars
 import logging
 import uuid
+from contextlib import aclosing
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from os import urandom
+from statistics import fmean
+from typing import Any, AsyncIterator, Dict, List, Optional
 from app.config import get_settings
 from app.models.schemas import GenerationRequest, GeneratedSample, GenerationResponse
-from app.utils.llm_client import get_llm_client, LLMException
+from app.utils.llm_client import get_llm_client, LLMClientInterface, LLMException
 from app.services.prompt_service import render_enhanced_prompt, get_default_template_context
-from app.services.quality_service import get_quality_service, QualityFilterConfig, QualityMetrics
+from app.services.quality_service import get_quality_service, QualityFilterService, QualityFilterConfig, QualityMetrics
 from app.services.job_store import get_job_store
-from app.utils.token_utils import estimate_request_cost
+from app.utils.concurrency import AdaptiveConcurrency, is_overload_status
+from app.utils.token_utils import estimate_completion_cost, estimate_tokens, tokens_within_limit
 
 logger = logging.getLogger(__name__)
 
+# LLM client resolved once per batch and visible to that batch's sample tasks
+_batch_llm_client: contextvars.ContextVar[Optional[LLMClientInterface]] = contextvars.ContextVar(
+    "batch_llm_client", default=None
+)
+
+# Attempts per sample when the provider answers 429/5xx
+_OVERLOAD_ATTEMPTS = 3
+
+# Quality scores reported per sample in response metadata
+_QUALITY_METRIC_FIELDS = ('overall_score', 'coherence_score', 'relevance_score', 'uniqueness_score')
+
+
+def _new_sample_id() -> str:
+    """
+    Random UUID4 in canonical dashed form.
+    
+    Sets the version and variant bits on raw random bytes directly, skipping the
+    validation and integer conversion done by uuid.UUID for every sample.
+    """
+    b = bytearray(urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@lru_cache(maxsize=512)
+def _render_generation_prompt(
+    template_name: str,
+    product: str,
+    sentiment_intensity: Optional[int],
+    tone: Optional[str],
+    enable_few_shot: bool
+) -> str:
+    """
+    Render the enhanced generation prompt for one variant.
+    
+    Rendering is deterministic in these arguments, so samples of a batch (and repeat
+    requests for the same product) reuse the rendered prompt instead of re-running
+    Jinja and few-shot formatting per sample.
+    """
+    return render_enhanced_prompt(
+        template_name=template_name,
+        context=get_default_template_context(product),
+        sentiment_intensity=sentiment_intensity,
+        tone=tone,
+        enable_few_shot=enable_few_shot,
+        domain_constraints=["Include realistic details", "Be specific and actionable"],
+        min_length=50,
+        max_length=200
+    )
+
+
+@lru_cache(maxsize=256)
+def _count_validation_prompt_tokens(
+    product: str,
+    template_name: str,
+    model: str,
+    limit: int
+) -> Optional[int]:
+    """
+    Token count of a representative prompt used for request validation.
+    
+    Cached so repeated validation of the same product (e.g. a UI polling for cost
+    estimates) skips rendering and tokenizing. Counting stops as soon as the prompt
+    exceeds the limit.
+    
+    Returns:
+        Prompt token count, or None if it exceeds the limit
+    """
+    prompt = render_enhanced_prompt(
+        template_name=template_name,
+        context=get_default_template_context(product),
+        sentiment_intensity=None,
+        tone=None,
+        enable_few_shot=False,
+        domain_constraints=[],
+        min_length=50,
+        max_length=200
+    )
+    return tokens_within_limit(prompt, limit, model)
+
 
 class GenerationService:
     """Service for generating synthetic text data using LLMs."""
@@ -23,7 +113,11 @@ class GenerationService:
     def __init__(self):
         """Initialize generation service."""
         self.settings = get_settings()
-        self.quality_service = get_quality_service()
+    
+    @property
+    def quality_service(self) -> QualityFilterService:
+        """Current global quality service (rebuilt when a task requests a different config)."""
+        return get_quality_service()
         
     async def generate_single_sample(
         self,
@@ -31,7 +125,9 @@ class GenerationService:
         sample_index: int = 0,
         sentiment_intensity: int = None,
         tone: str = None,
-        enable_few_shot: bool = True
+        enable_few_shot: bool = True,
+        generated_at: Optional[datetime] = None,
+        prompt: Optional[str] = None
     ) -> GeneratedSample:
         """
         Generate a single text sample.
@@ -39,6 +135,8 @@ class GenerationService:
         Args:
             request: Generation request parameters
             sample_index: Index of this sample in the batch
+            generated_at: Timestamp shared by the batch (defaults to now)
+            prompt: Prompt rendered by the batch (rendered here if omitted)
             
         Returns:
             Generated sample with metadata
@@ -47,24 +145,11 @@ class GenerationService:
             LLMException: On generation failure
         """
         try:
-            # Get LLM client (reused per batch when available)
-            llm_client = getattr(self, "_llm_client", None) or get_llm_client()
-            
-            # Prepare template context
-            context = get_default_template_context(request.product)
-            
-            # Render enhanced prompt template with few-shot learning
-            template_name = self.settings.default_prompt_template
-            prompt = render_enhanced_prompt(
-                template_name=template_name,
-                context=context,
-                sentiment_intensity=sentiment_intensity,
-                tone=tone,
-                enable_few_shot=enable_few_shot,
-                domain_constraints=["Include realistic details", "Be specific and actionable"],
-                min_length=50,
-                max_length=200
-            )
+            # Client resolved once by the enclosing batch, if any
+            llm_client = _batch_llm_client.get() or get_llm_client()
+            
+            if prompt is None:
+                prompt = self._render_prompt(request, sentiment_intensity, tone, enable_few_shot)
             
             # Generate text
             generated_text = await llm_client.generate(
@@ -73,26 +158,98 @@ class GenerationService:
                 max_tokens=self.settings.openai_max_tokens
             )
             
-            # Estimate token count (rough approximation)
-            tokens_estimated = len(generated_text.split()) * 1.3  # ~1.3 tokens per word
-            
-            # Create sample with metadata
-            sample = GeneratedSample(
-                id=str(uuid.uuid4()),
-                product=request.product,
-                prompt_version=request.version,
-                generated_at=datetime.now(timezone.utc),
-                text=generated_text,
-                tokens_estimated=int(tokens_estimated),
-                temperature=request.temperature
-            )
+            sample = self._build_sample(request, generated_text, generated_at)
             
-            logger.debug(f"Generated sample {sample_index + 1} for product: {request.product}")
+            logger.debug("Generated sample %d for product: %s", sample_index + 1, request.product)
             return sample
             
         except Exception as e:
-            logger.error(f"Failed to generate sample {sample_index}: {e}")
-            raise LLMException(f"Generation failed: {e}")
+            logger.error("Failed to generate sample %d: %s", sample_index, e)
+            raise LLMException(f"Generation failed: {e}", status_code=getattr(e, "status_code", None))
+    
+    def _render_prompt(
+        self,
+        request: GenerationRequest,
+        sentiment_intensity: int = None,
+        tone: str = None,
+        enable_few_shot: bool = True
+    ) -> str:
+        """Render the enhanced generation prompt for a request (memoized per distinct variant)."""
+        return _render_generation_prompt(
+            self.settings.default_prompt_template,
+            request.product,
+            sentiment_intensity,
+            tone,
+            enable_few_shot
+        )
+    
+    def _build_sample(
+        self,
+        request: GenerationRequest,
+        generated_text: str,
+        generated_at: Optional[datetime] = None
+    ) -> GeneratedSample:
+        """Wrap generated text in a sample with metadata."""
+        # Count tokens with the model's BPE tokenizer (heuristic fallback without tiktoken)
+        tokens_estimated = estimate_tokens(generated_text, self.settings.openai_model)
+        
+        return GeneratedSample(
+            id=_new_sample_id(),
+            product=request.product,
+            prompt_version=request.version,
+            generated_at=generated_at or datetime.now(timezone.utc),
+            text=generated_text,
+            tokens_estimated=tokens_estimated,
+            temperature=request.temperature
+        )
+    
+    def _use_batch_api(self, request: GenerationRequest) -> bool:
+        """Whether a request is large enough to go through the OpenAI Batch API."""
+        return (
+            self.settings.openai_batch_api_enabled
+            and self.settings.default_llm_provider == "openai"
+            and bool(self.settings.openai_api_key)
+            and request.count >= self.settings.openai_batch_api_threshold
+        )
+    
+    async def _generate_via_batch_api(
+        self,
+        request: GenerationRequest,
+        sentiment_intensity: int = None,
+        tone: str = None,
+        enable_few_shot: bool = True,
+        max_wait_seconds: Optional[float] = None
+    ) -> List[GeneratedSample]:
+        """
+        Generate all samples of a request in one OpenAI Batch API submission.
+        
+        Requests that fail inside the batch are skipped rather than failing the job,
+        since the rest of the batch has already been paid for. The batch is cancelled
+        if it does not finish within max_wait_seconds.
+        
+        Raises:
+            LLMException: If the batch fails or produces no samples
+        """
+        from app.services.batch_submitter import submit_batch
+        
+        # Every sample of a request shares one prompt
+        prompt = self._render_prompt(request, sentiment_intensity, tone, enable_few_shot)
+        prompts = [prompt] * request.count
+        texts = await submit_batch(
+            prompts,
+            model=self.settings.openai_model,
+            temperature=request.temperature,
+            max_tokens=self.settings.openai_max_tokens,
+            max_wait_seconds=max_wait_seconds
+        )
+        
+        generated_at = datetime.now(timezone.utc)
+        samples = [self._build_sample(request, text, generated_at) for text in texts if text]
+        if not samples:
+            raise LLMException("Batch generation produced no samples")
+        if len(samples) < request.count:
+            logger.warning("Batch API returned %d/%d samples", len(samples), request.count)
+        return samples
     
     async def generate_batch(
         self,
@@ -101,7 +258,8 @@ class GenerationService:
         enable_quality_filter: bool = True,
         sentiment_intensity: int = None,
         tone: str = None,
-        enable_few_shot: bool = True
+        enable_few_shot: bool = True,
+        batch_max_wait_seconds: Optional[float] = None
     ) -> GenerationResponse:
         """
         Generate a batch of text samples concurrently.
@@ -109,6 +267,8 @@ class GenerationService:
         Args:
             request: Generation request parameters
             progress_callback: Optional callback for progress updates
+            batch_max_wait_seconds: Wait limit for an OpenAI Batch API submission, e.g.
+                to stay within the calling task's time limit
             
         Returns:
             Generation response with all samples
@@ -116,74 +276,83 @@ class GenerationService:
         Raises:
             LLMException: On generation failure
         """
-        logger.info(f"Starting batch generation: {request.count} samples for '{request.product}'")
+        logger.info("Starting batch generation: %d samples for '%s'", request.count, request.product)
         
         try:
-            # Create or reuse a single LLM client for the whole batch to reduce overhead
-            self._llm_client = get_llm_client()
-
-            # Create generation tasks with enhanced features
-            tasks = [
-                self.generate_single_sample(
-                    request, i, sentiment_intensity, tone, enable_few_shot
-                )
-                for i in range(request.count)
-            ]
-            
-            # Execute tasks concurrently with progress tracking
-            samples = []
-            completed = 0
-            
-            # Process in smaller chunks to provide progress updates
-            chunk_size = min(5, request.count)  # Process max 5 at a time
-            
-            for i in range(0, len(tasks), chunk_size):
-                chunk_tasks = tasks[i:i + chunk_size]
-                
-                # Execute chunk
-                chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-                
-                # Process results
-                for result in chunk_results:
-                    if isinstance(result, Exception):
-                        logger.error(f"Sample generation failed: {result}")
-                        raise result
-                    samples.append(result)
-                    completed += 1
-                
-                # Report progress
-                if progress_callback:
-                    progress = int((completed / request.count) * 100)
-                    await progress_callback(progress)
-            
-            # Apply quality filtering if enabled
-            filtered_samples = samples
+            # The quality service is shared by the process, so duplicates and statistics
+            # are reset per batch rather than carried over from earlier jobs
+            quality_service = self.quality_service
+            if enable_quality_filter:
+                quality_service.reset()
+            quality_context = {
+                'template_type': self.settings.default_prompt_template,
+                'product': request.product
+            }
+            
+            # Samples are quality-filtered in chunks as they arrive, overlapping the filter
+            # with generation requests still in flight; each chunk's coherence is rated in
+            # one LLM call, and the chunks share one bound on concurrent calls
+            chunk_size = max(quality_service.config.coherence_batch_size, 1)
+            scoring_slots = asyncio.Semaphore(quality_service.config.max_scoring_concurrency)
+            filter_tasks: List[asyncio.Task] = []
+            unfiltered: List[GeneratedSample] = []
+            filtered_samples = []
             quality_metrics = []
-            filter_stats = {}
+            total_tokens = 0
+            
+            def flush_unfiltered() -> None:
+                if unfiltered:
+                    filter_tasks.append(asyncio.create_task(
+                        quality_service.filter_samples(unfiltered.copy(), quality_context, scoring_slots)
+                    ))
+                    unfiltered.clear()
+            
+            def accept_sample(sample: GeneratedSample) -> None:
+                nonlocal total_tokens
+                if not enable_quality_filter:
+                    filtered_samples.append(sample)
+                    total_tokens += sample.tokens_estimated
+                    return
+                unfiltered.append(sample)
+                if len(unfiltered) >= chunk_size:
+                    flush_unfiltered()
+            
+            generated_count = 0
+            try:
+                if self._use_batch_api(request):
+                    batch_samples = await self._generate_via_batch_api(
+                        request, sentiment_intensity, tone, enable_few_shot, batch_max_wait_seconds
+                    )
+                    generated_count = len(batch_samples)
+                    for sample in batch_samples:
+                        accept_sample(sample)
+                    if progress_callback:
+                        await progress_callback(100)
+                else:
+                    stream = self.stream_batch(
+                        request, sentiment_intensity, tone, enable_few_shot, progress_callback
+                    )
+                    async with aclosing(stream):
+                        async for sample in stream:
+                            generated_count += 1
+                            accept_sample(sample)
+                flush_unfiltered()
+                for chunk_samples, chunk_metrics in await asyncio.gather(*filter_tasks):
+                    filtered_samples.extend(chunk_samples)
+                    quality_metrics.extend(chunk_metrics)
+                    total_tokens += sum(sample.tokens_estimated for sample in chunk_samples)
+            finally:
+                for task in filter_tasks:
+                    task.cancel()
             
-            if enable_quality_filter and samples:
-                logger.info(f"Applying quality filtering to {len(samples)} samples")
-                
-                # Filter samples based on quality
-                context = {
-                    'template_type': self.settings.default_prompt_template,
-                    'product': request.product
-                }
-                
-                filtered_samples, quality_metrics = await self.quality_service.filter_batch(
-                    samples, context
-                )
-                
-                filter_stats = self.quality_service.get_filter_stats()
-                
+            filter_stats = {}
+            if enable_quality_filter and generated_count:
+                filter_stats = quality_service.get_filter_stats()
                 logger.info(
-                    f"Quality filtering completed: {len(filtered_samples)}/{len(samples)} samples passed "
-                    f"(pass rate: {filter_stats.get('pass_rate', 0.0):.1%})"
+                    "Quality filtering completed: %d/%d samples passed (pass rate: %.1f%%)",
+                    len(filtered_samples), generated_count, filter_stats.get('pass_rate', 0.0) * 100
                 )
             
-            # Calculate total tokens for filtered samples
-            total_tokens = sum(sample.tokens_estimated for sample in filtered_samples)
-            
             # Create response with quality information
             response = GenerationResponse(
                 samples=filtered_samples,
@@ -193,35 +362,114 @@ class GenerationService:
             
             # Add quality metadata to response
             if quality_metrics:
-                avg_quality = sum(m.overall_score for m in quality_metrics) / len(quality_metrics)
+                # Per-sample metrics are only included for small batches to limit metadata size
+                per_sample_metrics = []
+                if len(quality_metrics) <= 10:
+                    get_scores = attrgetter(*_QUALITY_METRIC_FIELDS)
+                    per_sample_metrics = [
+                        {'sample_id': sample.id, **dict(zip(_QUALITY_METRIC_FIELDS, get_scores(metric)))}
+                        for sample, metric in zip(filtered_samples, quality_metrics)
+                    ]
+                
                 response.metadata = {
                     'quality_filter_enabled': enable_quality_filter,
-                    'original_sample_count': len(samples),
+                    'original_sample_count': generated_count,
                     'filtered_sample_count': len(filtered_samples),
                     'filter_stats': filter_stats,
-                    'average_quality_score': avg_quality,
-                    'quality_metrics': [
-                        {
-                            'sample_id': sample.id,
-                            'overall_score': metric.overall_score,
-                            'coherence_score': metric.coherence_score,
-                            'relevance_score': metric.relevance_score,
-                            'uniqueness_score': metric.uniqueness_score
-                        }
-                        for sample, metric in zip(filtered_samples, quality_metrics)
-                    ] if len(quality_metrics) <= 10 else []  # Limit metadata size
+                    'average_quality_score': fmean(m.overall_score for m in quality_metrics),
+                    'quality_metrics': per_sample_metrics
                 }
             
-            logger.info(f"Batch generation completed: {len(filtered_samples)} samples, ~{total_tokens} tokens")
+            logger.info("Batch generation completed: %d samples, ~%d tokens", len(filtered_samples), total_tokens)
             return response
             
         except Exception as e:
-            logger.error(f"Batch generation failed: {e}")
+            logger.error("Batch generation failed: %s", e)
             raise
+    
+    async def stream_batch(
+        self,
+        request: GenerationRequest,
+        sentiment_intensity: int = None,
+        tone: str = None,
+        enable_few_shot: bool = True,
+        progress_callback=None
+    ) -> AsyncIterator[GeneratedSample]:
+        """
+        Generate samples with one LLM call each, yielding them as they complete.
+        
+        Only samples still in flight are held in memory. Closing the iterator early
+        cancels the remaining generations.
+        
+        Args:
+            request: Generation request parameters
+            progress_callback: Optional callback for progress updates
+            
+        Yields:
+            Generated samples in completion order
+            
+        Raises:
+            LLMException: On generation failure
+        """
+        # A new sample starts as soon as any finishes. The number in flight adapts to the
+        # provider: it starts at half the configured maximum, creeps up while requests
+        # succeed and halves on 429/5xx responses
+        max_concurrency = min(self.settings.openai_max_concurrent_requests, request.count)
+        controller = AdaptiveConcurrency(
+            initial_limit=max(1, max_concurrency // 2),
+            max_limit=max_concurrency
+        )
+        # One timestamp for the batch rather than a clock read per sample
+        generated_at = datetime.now(timezone.utc)
+        # All samples share one prompt variant; render it before scheduling any task
+        prompt = self._render_prompt(request, sentiment_intensity, tone, enable_few_shot)
+        
+        async def generate_guarded(index: int) -> GeneratedSample:
+            for attempt in range(_OVERLOAD_ATTEMPTS):
+                async with controller:
+                    try:
+                        sample = await self.generate_single_sample(
+                            request, index, generated_at=generated_at, prompt=prompt
+                        )
+                    except LLMException as e:
+                        await controller.report(False, e.status_code)
+                        # Overloaded requests are retried at the reduced concurrency
+                        if not is_overload_status(e.status_code) or attempt == _OVERLOAD_ATTEMPTS - 1:
+                            raise
+                        continue
+                    await controller.report(True)
+                    return sample
+        
+        # Resolve the client once and scope it to this batch's tasks; a copied context
+        # keeps overlapping batches on the shared service from seeing each other's client
+        batch_context = contextvars.copy_context()
+        batch_context.run(_batch_llm_client.set, get_llm_client())
+        tasks = [
+            asyncio.create_task(generate_guarded(i), context=batch_context)
+            for i in range(request.count)
+        ]
+        
+        completed = 0
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    sample = await future
+                except Exception as e:
+                    logger.error("Sample generation failed: %s", e)
+                    raise
+                completed += 1
+                
+                # Report progress
+                if progress_callback:
+                    progress = int((completed / request.count) * 100)
+                    await progress_callback(progress)
+                
+                yield sample
         finally:
-            # Ensure per-batch client is released
-            if hasattr(self, "_llm_client"):
-                delattr(self, "_llm_client")
+            # Cancel whatever is still running on failure or when the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     async def generate_with_job_tracking(
         self,
@@ -289,27 +537,25 @@ class GenerationService:
             
             # Estimate cost using tokenizer/pricing map if using OpenAI
             if self.settings.default_llm_provider == "openai":
-                # Build a representative prompt to estimate prompt tokens
-                context = get_default_template_context(request.product)
-                template_name = self.settings.default_prompt_template
-                prompt = render_enhanced_prompt(
-                    template_name=template_name,
-                    context=context,
-                    sentiment_intensity=None,
-                    tone=None,
-                    enable_few_shot=False,
-                    domain_constraints=[],
-                    min_length=50,
-                    max_length=200
-                )
                 expected_completion_tokens = min(self.settings.openai_max_tokens, 200)
-                _, est_cost = estimate_request_cost(prompt, expected_completion_tokens)
-                # Total cost roughly scales with count (upper bound)
-                results["estimated_cost"] = round(est_cost * request.count, 4)
+                model = self.settings.openai_model
+                prompt_limit = self.settings.openai_context_window_tokens - self.settings.openai_max_tokens
+                prompt_tokens = _count_validation_prompt_tokens(
+                    request.product, self.settings.default_prompt_template, model, prompt_limit
+                )
+                if prompt_tokens is None:
+                    results["errors"].append(
+                        f"Prompt exceeds context window: more than {prompt_limit} prompt tokens"
+                    )
+                    results["valid"] = False
+                else:
+                    est_cost = estimate_completion_cost(prompt_tokens, expected_completion_tokens, model)
+                    # Total cost roughly scales with count (upper bound)
+                    results["estimated_cost"] = round(est_cost * request.count, 4)
             
             # Estimate duration (rough approximation)
             # Assume ~2 seconds per sample with concurrent execution
-            estimated_duration = (request.count / 5) * 2  # 5 concurrent requests
+            estimated_duration = (request.count / self.settings.openai_max_concurrent_requests) * 2
             results["estimated_duration"] = round(estimated_duration, 1)
             
             # Check if count exceeds limits
@@ -327,12 +573,67 @@ class GenerationService:
                 results["warnings"].append(f"Estimated cost: ${results['estimated_cost']:.2f}")
             
         except Exception as e:
-            logger.error(f"Validation failed: {e}")
+            logger.error("Validation failed: %s", e)
             results["errors"].append(f"Validation error: {e}")
             results["valid"] = False
         
         return results
     
+    async def augment_samples(self,
+                              samples: List[GeneratedSample],
+                              strategy_name: str,
+                              augment_ratio: float = 0.5) -> List[GeneratedSample]:
+        """
+        Augment a leading fraction of samples with a single strategy.
+        
+        Args:
+            samples: Original samples to draw augmentation sources from
+            strategy_name: Strategy to apply ('CDA', 'ADA', 'CADA')
+            augment_ratio: Ratio of original samples to augment (0.0 to 1.0)
+            
+        Returns:
+            Newly created augmented samples (originals are not included)
+        """
+        from app.services.data_augmentation_service import (
+            get_augmentation_service, AugmentationStrategy
+        )
+        
+        strategy_map = {
+            'CDA': AugmentationStrategy.CDA,
+            'ADA': AugmentationStrategy.ADA, 
+            'CADA': AugmentationStrategy.CADA
+        }
+        
+        if strategy_name not in strategy_map:
+            logger.warning("Unknown augmentation strategy: %s", strategy_name)
+            return []
+        
+        if not samples or augment_ratio <= 0:
+            return []
+        
+        strategy = strategy_map[strategy_name]
+        augmentation_service = get_augmentation_service()
+        
+        # Calculate how many samples to augment
+        num_original = len(samples)
+        num_to_augment = min(num_original, max(1, int(num_original * augment_ratio)))
+        
+        async def augment_one(index: int) -> List[GeneratedSample]:
+            try:
+                return await augmentation_service.create_augmented_samples(
+                    original_sample=samples[index],
+                    strategy=strategy,
+                    num_variants=2  # Generate 2 variants per strategy
+                )
+            except Exception as e:
+                logger.warning("Augmentation failed for sample %d with %s: %s", index, strategy_name, e)
+                return []
+        
+        # Augment samples concurrently
+        augmented = await asyncio.gather(*(augment_one(i) for i in range(num_to_augment)))
+        
+        return list(chain.from_iterable(augmented))
+    
     async def generate_with_augmentation(self,
                                        request: GenerationRequest,
                                        augmentation_strategies: List[str] = None,
@@ -349,71 +650,39 @@ class GenerationService:
             Generation response with original and augmented samples
         """
         try:
-            from app.services.data_augmentation_service import (
-                get_augmentation_service, AugmentationStrategy, AugmentationRequest
-            )
-            
             # Generate original samples
             base_response = await self.generate_batch(request)
-            samples = base_response.samples.copy()
             
-            # Apply augmentation if requested
+            # Apply augmentation if requested, all strategies concurrently
+            augmented_per_strategy = []
             if augmentation_strategies and augment_ratio > 0:
-                augmentation_service = get_augmentation_service()
-                
-                # Calculate how many samples to augment
-                num_original = len(samples)
-                num_to_augment = min(num_original, max(1, int(num_original * augment_ratio)))
-                
-                # Select strategies
-                strategy_map = {
-                    'CDA': AugmentationStrategy.CDA,
-                    'ADA': AugmentationStrategy.ADA, 
-                    'CADA': AugmentationStrategy.CADA
-                }
-                
-                for strategy_name in augmentation_strategies:
-                    if strategy_name not in strategy_map:
-                        logger.warning(f"Unknown augmentation strategy: {strategy_name}")
-                        continue
-                    
-                    strategy = strategy_map[strategy_name]
-                    
-                    # Apply to selected samples
-                    for i in range(num_to_augment):
-                        if i < len(samples):
-                            original_sample = samples[i]
-                            
-                            try:
-                                augmented_samples = await augmentation_service.create_augmented_samples(
-                                    original_sample=original_sample,
-                                    strategy=strategy,
-                                    num_variants=2  # Generate 2 variants per strategy
-                                )
-                                
-                                samples.extend(augmented_samples)
-                                
-                            except Exception as e:
-                                logger.warning(f"Augmentation failed for sample {i} with {strategy_name}: {e}")
-                                continue
+                augmented_per_strategy = await asyncio.gather(*(
+                    self.augment_samples(base_response.samples, strategy_name, augment_ratio)
+                    for strategy_name in augmentation_strategies
+                ))
+            samples = list(chain(base_response.samples, *augmented_per_strategy))
             
             # Create enhanced response
-            enhanced_response = GenerationResponse(samples=samples)
-            
-            logger.info(
-                f"Generation with augmentation completed: "
-                f"{len(base_response.samples)} original + "
-                f"{len(samples) - len(base_response.samples)} augmented = "
-                f"{len(samples)} total samples"
+            enhanced_response = GenerationResponse(
+                samples=samples,
+                total_samples=len(samples),
+                total_tokens_estimated=sum(sample.tokens_estimated for sample in samples)
             )
             
+            if logger.isEnabledFor(logging.INFO):
+                num_original = len(base_response.samples)
+                logger.info(
+                    "Generation with augmentation completed: %d original + %d augmented = %d total samples",
+                    num_original, len(samples) - num_original, len(samples)
+                )
+            
             return enhanced_response
             
         except ImportError:
             logger.warning("Data augmentation service not available, returning base generation")
             return await self.generate_batch(request)
         except Exception as e:
-            logger.error(f"Enhanced generation failed: {e}")
+            logger.error("Enhanced generation failed: %s", e)
             # Fall back to basic generation
             return await self.generate_batch(request)
 
@@ -441,13 +710,13 @@ async def run_generation_job(request: GenerationRequest, job_id: str) -> None:
     service = get_generation_service()
     
     try:
-        logger.info(f"Starting generation job {job_id}")
+        logger.info("Starting generation job %s", job_id)
         
         # Run generation with job tracking
         await service.generate_with_job_tracking(request, job_id)
         
-        logger.info(f"Generation job {job_id} completed successfully")
+        logger.info("Generation job %s completed successfully", job_id)
         
     except Exception as e:
-        logger.error(f"Generation job {job_id} failed: {e}")
+        logger.error("Generation job %s failed: %s", job_id, e)
         # Error handling is done in generate_with_job_tracking
\ No newline at end of file
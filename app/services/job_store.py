@@ -1,7 +1,7 @@
 """
 Unified job store abstraction over Celery (and optionally legacy backends).
 """
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any, List
 from app.models.schemas import JobStatusResponse, GenerationRequest
 from app.services.celery_service import get_celery_job_service
 
@@ -13,6 +13,18 @@ class JobStore:
         service = get_celery_job_service()
         return service.get_job_status(job_id)
 
+    def get_statuses(self, job_ids: List[str]) -> Dict[str, Optional[JobStatusResponse]]:
+        service = get_celery_job_service()
+        return service.get_job_statuses(job_ids)
+
+    def watch_status(self, job_id: str) -> AsyncIterator[JobStatusResponse]:
+        service = get_celery_job_service()
+        return service.watch_job_status(job_id)
+
+    def get_pending_status(self, job_id: str) -> JobStatusResponse:
+        service = get_celery_job_service()
+        return service.pending_status(job_id)
+
     def cancel(self, job_id: str) -> bool:
         service = get_celery_job_service()
         return service.cancel_job(job_id)
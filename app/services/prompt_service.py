@@ -2,9 +2,12 @@
 Prompt templating service using Jinja2 templates with few-shot learning support.
 """
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateNotFound, meta
 from dataclasses import dataclass
 from app.config import get_settings
 
@@ -32,6 +35,160 @@ class PromptConfig:
     min_length: Optional[int] = None
 
 
+# Descriptions for the 1-5 sentiment intensity scale
+SENTIMENT_DESCRIPTIONS = MappingProxyType({
+    1: "Very Negative - Highly dissatisfied, angry, or frustrated",
+    2: "Negative - Dissatisfied or disappointed",
+    3: "Neutral - Balanced or indifferent",
+    4: "Positive - Satisfied or pleased",
+    5: "Very Positive - Extremely satisfied, delighted, or enthusiastic"
+})
+
+
+# Default few-shot examples as (context value, output template, description); each
+# output has a {product} placeholder filled in by _default_few_shot_examples
+_SUPPORT_REQUEST_EXAMPLES = (
+    (
+        "frustrated",
+        "I've been trying to use {product} for the past week, but I keep running into sync issues that are really impacting my workflow. The data doesn't update properly between devices, and I've already tried restarting the app multiple times. Could you please help me resolve this? I need this working for an important project deadline next week.",
+        "Frustrated but professional tone with specific issue details"
+    ),
+    (
+        "polite",
+        "Hi there! I'm having a small issue with {product} where the notifications seem to be delayed by several hours. It's not urgent, but I wanted to report it in case others are experiencing the same thing. The app works great otherwise! Could you let me know if there's a setting I might have missed or if this is a known issue? Thanks for your help!",
+        "Polite and helpful tone with minor issue"
+    ),
+    (
+        "urgent",
+        "URGENT: {product} completely crashed during our live demo with clients this morning and we lost all our presentation data. This is extremely embarrassing and unprofessional. We need immediate assistance to recover the data and ensure this doesn't happen again. Our reputation is on the line here. Please escalate this to your technical team immediately.",
+        "Urgent tone with business impact emphasis"
+    ),
+)
+
+_PRODUCT_REVIEW_EXAMPLES = (
+    (
+        "positive",
+        "I've been using {product} for about three months now and I'm really impressed. The interface is intuitive and the features work exactly as advertised. Customer support responded quickly when I had questions during setup. The price point is reasonable for what you get. My only minor complaint is that the mobile app could be a bit faster, but overall this is a solid product that I'd recommend to colleagues.",
+        "Balanced positive review with minor criticism"
+    ),
+    (
+        "negative",
+        "Unfortunately, {product} hasn't lived up to my expectations. The setup process was confusing and took much longer than promised. I've encountered several bugs that customer service says are 'known issues' but no timeline for fixes. For the price, I expected better reliability and support. The core functionality works sometimes, but the inconsistency makes it hard to rely on for important tasks.",
+        "Constructive negative review with specific issues"
+    ),
+    (
+        "neutral",
+        "{product} does what it's supposed to do, nothing more, nothing less. The features are basic but functional. Setup was straightforward. Price seems fair for a standard solution. It's not exciting or innovative, but it gets the job done reliably. If you need something simple and don't require advanced features, this could work for you.",
+        "Neutral review focusing on functionality"
+    ),
+)
+
+_FEATURE_REQUEST_EXAMPLES = (
+    (
+        "high",
+        "I'd love to see {product} add bulk export functionality. Currently, I have to export files one by one, which takes hours for large projects. A bulk export feature would save enormous amounts of time for users like me who work with lots of data. This would significantly improve workflow efficiency and reduce the tedious manual work. Many competitors already offer this feature, so it would help {product} stay competitive.",
+        "High-value feature request with business justification"
+    ),
+    (
+        "medium",
+        "It would be great if {product} could add dark mode support. I often work in low-light environments and the current bright interface can be straining. This is becoming a standard feature in most modern apps, and it would improve the user experience for many of us who prefer darker themes. Not critical, but would definitely be appreciated!",
+        "User experience improvement request"
+    ),
+)
+
+_CHATBOT_EXAMPLES = (
+    (
+        "new_user",
+        "User: Hi, I just signed up for {product} and I'm not sure where to start.\nBot: Welcome to {product}! I'd be happy to help you get started. Let me walk you through the basics. First, have you completed your profile setup? That's usually the best place to begin.\nUser: No, I haven't done that yet. How do I access it?\nBot: Great question! You can find your profile settings by clicking the gear icon in the top right corner, then selecting 'Profile.' Would you like me to guide you through the key sections to fill out?",
+        "Helpful onboarding conversation for new users"
+    ),
+)
+
+# Few-shot examples per template: (context key varied across examples, example templates)
+_FEW_SHOT_EXAMPLE_TEMPLATES = MappingProxyType({
+    "support_request.j2": ("tone", _SUPPORT_REQUEST_EXAMPLES),
+    "product_review.j2": ("sentiment", _PRODUCT_REVIEW_EXAMPLES),
+    "feature_request.j2": ("urgency", _FEATURE_REQUEST_EXAMPLES),
+    "chatbot_conversation.j2": ("user_type", _CHATBOT_EXAMPLES),
+})
+
+
+# Default few-shot examples are pure functions of the template and product, so they are
+# built once per pair and shared; callers must not mutate the returned examples
+@lru_cache(maxsize=512)
+def _default_few_shot_examples(template_name: str, product: str) -> Tuple[FewShotExample, ...]:
+    """Build the default few-shot examples for a known template."""
+    context_key, examples = _FEW_SHOT_EXAMPLE_TEMPLATES[template_name]
+    return tuple(
+        FewShotExample(
+            input_context={"product": product, context_key: value},
+            expected_output=output.format(product=product),
+            description=description
+        )
+        for value, output, description in examples
+    )
+
+
+# Rendered prompts kept per service instance
+_RENDER_CACHE_SIZE = 512
+
+# Values every template can see without threading them through the render context;
+# a context key of the same name still takes precedence
+_TEMPLATE_GLOBALS = MappingProxyType({
+    "version": "v1",
+    "timestamp": "now",  # Can be enhanced with actual timestamps
+})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a context value to a hashable equivalent for use in cache keys.
+    
+    Every frozen value is tagged with its type: True, 1 and 1.0 (or a list, a tuple and
+    a dict's items) compare equal but render differently.
+    """
+    if isinstance(value, dict):
+        return (type(value), tuple(sorted((_freeze(key), _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    if isinstance(value, float):
+        # 0.0 == -0.0 but they render differently
+        return (float, repr(value))
+    return (type(value), value)
+
+
+def _render_cache_key(template_name: str, context: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+    """Build the render cache key, or None if the context holds unhashable values."""
+    try:
+        key = (template_name, _freeze(context))
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
+def _create_bytecode_cache(settings) -> Optional[FileSystemBytecodeCache]:
+    """
+    Create the on-disk cache for compiled templates, shared by every worker process.
+    
+    Jinja stores each template's compiled code keyed by name and source checksum, so
+    a restarted API or Celery worker skips lexing, parsing and compiling.
+    """
+    if not settings.prompt_bytecode_cache_enabled:
+        return None
+    try:
+        if settings.prompt_bytecode_cache_dir:
+            cache_dir = Path(settings.prompt_bytecode_cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            return FileSystemBytecodeCache(str(cache_dir))
+        return FileSystemBytecodeCache()
+    except Exception as e:
+        logger.warning(f"Template bytecode cache unavailable, compiling templates in memory: {e}")
+        return None
+
+
 class PromptTemplateService:
     """Service for managing and rendering Jinja2 prompt templates."""
     
@@ -48,11 +205,45 @@ class PromptTemplateService:
             loader=FileSystemLoader(self.template_dir),
             trim_blocks=True,
             lstrip_blocks=True,
-            autoescape=False  # We don't need HTML escaping for prompts
+            autoescape=False,  # We don't need HTML escaping for prompts
+            auto_reload=settings.debug,  # Templates only change in development; skip the per-load mtime stat
+            bytecode_cache=_create_bytecode_cache(settings)
         )
+        self.env.globals.update(_TEMPLATE_GLOBALS)
+        
+        # Rendered prompts keyed by template name and frozen context
+        self._render_cache: "OrderedDict[Tuple[str, Any], str]" = OrderedDict()
+        
+        # Template variables found by validate_template, keyed by name with the file mtime
+        self._validation_cache: Dict[str, Tuple[float, List[str]]] = {}
+        
+        # Variables each template reads, used to skip enhanced context it would ignore
+        self._template_variables: Dict[str, FrozenSet[str]] = {}
         
-        # Cache for loaded templates
-        self._template_cache: Dict[str, Template] = {}
+        # Template directory listing, refreshed when the directory's mtime changes
+        self._template_names: Optional[List[str]] = None
+        self._template_dir_mtime: Optional[float] = None
+        
+        self.preload_templates()
+    
+    def preload_templates(self) -> int:
+        """
+        Load every available template into the cache up front.
+        
+        Moves the per-template parse (or bytecode load) out of the first request that
+        uses each template and into service construction.
+        
+        Returns:
+            Number of templates loaded
+        """
+        loaded = 0
+        for template_name in self.list_templates():
+            try:
+                self.get_template(template_name)
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Failed to preload template {template_name}: {e}")
+        return loaded
         
     def list_templates(self) -> List[str]:
         """
@@ -62,10 +253,16 @@ class PromptTemplateService:
             List of template filenames
         """
         try:
-            return [
-                f.name for f in self.template_dir.glob("*.j2") 
-                if f.is_file()
-            ]
+            # Adding or removing a file updates the directory mtime, so one stat
+            # decides whether the cached listing is still current
+            dir_mtime = self.template_dir.stat().st_mtime
+            if self._template_names is None or dir_mtime != self._template_dir_mtime:
+                self._template_names = [
+                    f.name for f in self.template_dir.iterdir()
+                    if f.suffix == ".j2" and f.is_file()
+                ]
+                self._template_dir_mtime = dir_mtime
+            return list(self._template_names)
         except Exception as e:
             logger.error(f"Failed to list templates: {e}")
             return []
@@ -76,7 +273,7 @@ class PromptTemplateService:
         
         Args:
             template_name: Name of template file (e.g., "support_request.j2")
-            use_cache: Whether to use cached template
+            use_cache: Whether to use the environment's compiled template cache
             
         Returns:
             Jinja2 Template object
@@ -85,14 +282,11 @@ class PromptTemplateService:
             TemplateNotFound: If template file doesn't exist
             Exception: On template loading errors
         """
-        if use_cache and template_name in self._template_cache:
-            return self._template_cache[template_name]
-        
         try:
-            template = self.env.get_template(template_name)
             if use_cache:
-                self._template_cache[template_name] = template
-            return template
+                # Environment keeps its own LRU of compiled templates
+                return self.env.get_template(template_name)
+            return self.env.loader.load(self.env, template_name, self.env.make_globals(None))
         except TemplateNotFound:
             logger.error(f"Template not found: {template_name}")
             available = self.list_templates()
@@ -124,10 +318,51 @@ class PromptTemplateService:
             TemplateNotFound: If template doesn't exist
             Exception: On rendering errors
         """
+        # Identical renders are served from the LRU; templates can change under
+        # auto_reload, so rendered output is only reused when it is off
+        render_key = None
+        if use_cache and not self.env.auto_reload:
+            render_key = _render_cache_key(template_name, context)
+            cached = self._render_cache.get(render_key) if render_key else None
+            if cached is not None:
+                self._render_cache.move_to_end(render_key)
+                return cached
+        
         try:
             template = self.get_template(template_name, use_cache)
-            rendered = template.render(**context)
-            return rendered.strip()
+            rendered = template.render(**context).strip()
+        except Exception as e:
+            logger.error(f"Failed to render template {template_name}: {e}")
+            raise
+        
+        if render_key:
+            self._render_cache[render_key] = rendered
+            if len(self._render_cache) > _RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        return rendered
+    
+    def render_many(self, template_name: str, contexts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Render one template once per context.
+        
+        The template is looked up a single time and rendered directly, bypassing the
+        per-call render cache, which rarely hits when every row's context differs.
+        
+        Args:
+            template_name: Name of template file
+            contexts: Template variables for each render
+            
+        Returns:
+            Rendered template strings, in context order
+            
+        Raises:
+            TemplateNotFound: If template doesn't exist
+            Exception: On rendering errors
+        """
+        template = self.get_template(template_name)
+        render = template.render
+        try:
+            return [render(context).strip() for context in contexts]
         except Exception as e:
             logger.error(f"Failed to render template {template_name}: {e}")
             raise
@@ -149,15 +384,20 @@ class PromptTemplateService:
         }
         
         try:
-            from jinja2 import meta
-            template = self.get_template(template_name, use_cache=False)
+            try:
+                mtime = (self.template_dir / template_name).stat().st_mtime
+            except FileNotFoundError:
+                raise TemplateNotFound(template_name)
             
-            # Extract template variables using Jinja2 meta API
-            parsed_ast = self.env.parse(template.source)
-            var_names = sorted(list(meta.find_undeclared_variables(parsed_ast)))
+            cached = self._validation_cache.get(template_name)
+            if cached is not None and cached[0] == mtime:
+                var_names = cached[1]
+            else:
+                var_names = sorted(self._parse_template_variables(template_name))
+                self._validation_cache[template_name] = (mtime, var_names)
             
             results["valid"] = True
-            results["variables"] = var_names
+            results["variables"] = list(var_names)
             
         except Exception as e:
             results["error"] = str(e)
@@ -165,6 +405,29 @@ class PromptTemplateService:
         
         return results
     
+    def _parse_template_variables(self, template_name: str) -> FrozenSet[str]:
+        """Extract a template's undeclared variables using the Jinja2 meta API."""
+        source, _, _ = self.env.loader.get_source(self.env, template_name)
+        return frozenset(meta.find_undeclared_variables(self.env.parse(source)))
+    
+    def _get_template_variables(self, template_name: str) -> Optional[FrozenSet[str]]:
+        """
+        Get the variables a template reads, or None if they can't be relied on.
+        
+        Under auto_reload the template may change between renders, so nothing is cached.
+        """
+        if self.env.auto_reload:
+            return None
+        variables = self._template_variables.get(template_name)
+        if variables is None:
+            try:
+                variables = self._parse_template_variables(template_name)
+            except Exception:
+                # Leave the error to the render itself
+                return None
+            self._template_variables[template_name] = variables
+        return variables
+    
     def create_template_from_string(self, template_string: str) -> Template:
         """
         Create template from string (for dynamic templates).
@@ -178,8 +441,12 @@ class PromptTemplateService:
         return self.env.from_string(template_string)
     
     def clear_cache(self) -> None:
-        """Clear template cache."""
-        self._template_cache.clear()
+        """Clear template and rendered prompt caches."""
+        if self.env.cache is not None:
+            self.env.cache.clear()
+        self._render_cache.clear()
+        self._validation_cache.clear()
+        self._template_variables.clear()
         logger.info("Template cache cleared")
     
     def render_enhanced_prompt(self, config: PromptConfig) -> str:
@@ -192,23 +459,32 @@ class PromptTemplateService:
         Returns:
             Enhanced prompt string with examples and constraints
         """
-        # Start with base template context
-        enhanced_context = config.context.copy()
+        # Only build the enhanced features the template actually reads (all of them when
+        # its variables are unknown); unused keys would also split the render cache
+        variables = self._get_template_variables(config.template_name)
         
-        # Add enhanced features to context
+        def uses(name: str) -> bool:
+            return variables is None or name in variables
+        
+        # Collect enhanced features, then merge them over the base context in one copy
+        overrides = {}
         if config.sentiment_intensity:
-            enhanced_context['sentiment_intensity'] = config.sentiment_intensity
-            enhanced_context['sentiment_scale'] = self._get_sentiment_description(config.sentiment_intensity)
+            if uses('sentiment_intensity'):
+                overrides['sentiment_intensity'] = config.sentiment_intensity
+            if uses('sentiment_scale'):
+                overrides['sentiment_scale'] = self._get_sentiment_description(config.sentiment_intensity)
         
-        if config.tone:
-            enhanced_context['tone'] = config.tone
+        if config.tone and uses('tone'):
+            overrides['tone'] = config.tone
             
-        if config.domain_constraints:
-            enhanced_context['constraints'] = config.domain_constraints
+        if config.domain_constraints and uses('constraints'):
+            overrides['constraints'] = config.domain_constraints
             
-        if config.max_length or config.min_length:
-            length_constraint = self._format_length_constraint(config.min_length, config.max_length)
-            enhanced_context['length_constraint'] = length_constraint
+        min_length, max_length = config.min_length, config.max_length
+        if (max_length or min_length) and uses('length_constraint'):
+            overrides['length_constraint'] = self._format_length_constraint(min_length, max_length)
+        
+        enhanced_context = {**config.context, **overrides} if overrides else config.context
         
         # Render base template
         base_prompt = self.render_template(config.template_name, enhanced_context)
@@ -225,14 +501,7 @@ class PromptTemplateService:
     
     def _get_sentiment_description(self, intensity: int) -> str:
         """Get descriptive text for sentiment intensity scale."""
-        intensity_map = {
-            1: "Very Negative - Highly dissatisfied, angry, or frustrated",
-            2: "Negative - Dissatisfied or disappointed", 
-            3: "Neutral - Balanced or indifferent",
-            4: "Positive - Satisfied or pleased",
-            5: "Very Positive - Extremely satisfied, delighted, or enthusiastic"
-        }
-        return intensity_map.get(intensity, "Neutral")
+        return SENTIMENT_DESCRIPTIONS.get(intensity, "Neutral")
     
     def _format_length_constraint(self, min_length: Optional[int], max_length: Optional[int]) -> str:
         """Format length constraint description."""
@@ -249,105 +518,27 @@ class PromptTemplateService:
         if not examples:
             return ""
             
-        examples_text = "Here are some examples of the expected output:\n\n"
+        parts = ["Here are some examples of the expected output:\n\n"]
         
         for i, example in enumerate(examples, 1):
-            examples_text += f"Example {i}:\n"
-            
             # Format input context
-            context_items = []
-            for key, value in example.input_context.items():
-                context_items.append(f"{key}: {value}")
-            context_str = ", ".join(context_items)
-            examples_text += f"Input: {context_str}\n"
-            
-            # Add expected output
-            examples_text += f"Output: {example.expected_output}\n"
+            context_str = ", ".join(f"{key}: {value}" for key, value in example.input_context.items())
+            parts.append(f"Example {i}:\nInput: {context_str}\nOutput: {example.expected_output}\n")
             
             # Add description if available
             if example.description:
-                examples_text += f"Note: {example.description}\n"
+                parts.append(f"Note: {example.description}\n")
                 
-            examples_text += "\n"
+            parts.append("\n")
         
-        examples_text += "Now generate your own response following the same pattern:"
-        return examples_text
+        parts.append("Now generate your own response following the same pattern:")
+        return "".join(parts)
     
     def get_default_few_shot_examples(self, template_name: str, product: str) -> List[FewShotExample]:
         """Get default few-shot examples for a template type."""
-        examples_map = {
-            "support_request.j2": self._get_support_request_examples(product),
-            "product_review.j2": self._get_product_review_examples(product),
-            "feature_request.j2": self._get_feature_request_examples(product),
-            "chatbot_conversation.j2": self._get_chatbot_examples(product)
-        }
-        
-        return examples_map.get(template_name, [])
-    
-    def _get_support_request_examples(self, product: str) -> List[FewShotExample]:
-        """Get few-shot examples for support requests."""
-        return [
-            FewShotExample(
-                input_context={"product": product, "tone": "frustrated"},
-                expected_output=f"I've been trying to use {product} for the past week, but I keep running into sync issues that are really impacting my workflow. The data doesn't update properly between devices, and I've already tried restarting the app multiple times. Could you please help me resolve this? I need this working for an important project deadline next week.",
-                description="Frustrated but professional tone with specific issue details"
-            ),
-            FewShotExample(
-                input_context={"product": product, "tone": "polite"},
-                expected_output=f"Hi there! I'm having a small issue with {product} where the notifications seem to be delayed by several hours. It's not urgent, but I wanted to report it in case others are experiencing the same thing. The app works great otherwise! Could you let me know if there's a setting I might have missed or if this is a known issue? Thanks for your help!",
-                description="Polite and helpful tone with minor issue"
-            ),
-            FewShotExample(
-                input_context={"product": product, "tone": "urgent"},
-                expected_output=f"URGENT: {product} completely crashed during our live demo with clients this morning and we lost all our presentation data. This is extremely embarrassing and unprofessional. We need immediate assistance to recover the data and ensure this doesn't happen again. Our reputation is on the line here. Please escalate this to your technical team immediately.",
-                description="Urgent tone with business impact emphasis"
-            )
-        ]
-    
-    def _get_product_review_examples(self, product: str) -> List[FewShotExample]:
-        """Get few-shot examples for product reviews."""
-        return [
-            FewShotExample(
-                input_context={"product": product, "sentiment": "positive"},
-                expected_output=f"I've been using {product} for about three months now and I'm really impressed. The interface is intuitive and the features work exactly as advertised. Customer support responded quickly when I had questions during setup. The price point is reasonable for what you get. My only minor complaint is that the mobile app could be a bit faster, but overall this is a solid product that I'd recommend to colleagues.",
-                description="Balanced positive review with minor criticism"
-            ),
-            FewShotExample(
-                input_context={"product": product, "sentiment": "negative"},
-                expected_output=f"Unfortunately, {product} hasn't lived up to my expectations. The setup process was confusing and took much longer than promised. I've encountered several bugs that customer service says are 'known issues' but no timeline for fixes. For the price, I expected better reliability and support. The core functionality works sometimes, but the inconsistency makes it hard to rely on for important tasks.",
-                description="Constructive negative review with specific issues"
-            ),
-            FewShotExample(
-                input_context={"product": product, "sentiment": "neutral"},
-                expected_output=f"{product} does what it's supposed to do, nothing more, nothing less. The features are basic but functional. Setup was straightforward. Price seems fair for a standard solution. It's not exciting or innovative, but it gets the job done reliably. If you need something simple and don't require advanced features, this could work for you.",
-                description="Neutral review focusing on functionality"
-            )
-        ]
-    
-    def _get_feature_request_examples(self, product: str) -> List[FewShotExample]:
-        """Get few-shot examples for feature requests."""
-        return [
-            FewShotExample(
-                input_context={"product": product, "urgency": "high"},
-                expected_output=f"I'd love to see {product} add bulk export functionality. Currently, I have to export files one by one, which takes hours for large projects. A bulk export feature would save enormous amounts of time for users like me who work with lots of data. This would significantly improve workflow efficiency and reduce the tedious manual work. Many competitors already offer this feature, so it would help {product} stay competitive.",
-                description="High-value feature request with business justification"
-            ),
-            FewShotExample(
-                input_context={"product": product, "urgency": "medium"},
-                expected_output=f"It would be great if {product} could add dark mode support. I often work in low-light environments and the current bright interface can be straining. This is becoming a standard feature in most modern apps, and it would improve the user experience for many of us who prefer darker themes. Not critical, but would definitely be appreciated!",
-                description="User experience improvement request"
-            )
-        ]
-    
-    def _get_chatbot_examples(self, product: str) -> List[FewShotExample]:
-        """Get few-shot examples for chatbot conversations.""" 
-        return [
-            FewShotExample(
-                input_context={"product": product, "user_type": "new_user"},
-                expected_output=f"User: Hi, I just signed up for {product} and I'm not sure where to start.\nBot: Welcome to {product}! I'd be happy to help you get started. Let me walk you through the basics. First, have you completed your profile setup? That's usually the best place to begin.\nUser: No, I haven't done that yet. How do I access it?\nBot: Great question! You can find your profile settings by clicking the gear icon in the top right corner, then selecting 'Profile.' Would you like me to guide you through the key sections to fill out?",
-                description="Helpful onboarding conversation for new users"
-            )
-        ]
+        if template_name not in _FEW_SHOT_EXAMPLE_TEMPLATES:
+            return []
+        return list(_default_few_shot_examples(template_name, product))
 
 
 # Global template service instance
@@ -380,10 +571,12 @@ def render_prompt(
     """
     service = get_template_service()
     
-    # Add version to context
-    context_with_version = {**context, "version": version}
+    # The argument always wins over a version in the context; the copy is skipped only
+    # when the context has no version of its own and the environment global already matches
+    if context.get("version", _TEMPLATE_GLOBALS["version"]) != version:
+        context = {**context, "version": version}
     
-    return service.render_template(template_name, context_with_version)
+    return service.render_template(template_name, context)
 
 
 def render_enhanced_prompt(
@@ -442,9 +635,6 @@ def get_default_template_context(product: str) -> Dict[str, Any]:
         product: Product name/description
         
     Returns:
-        Default template context
+        Default template context (version and timestamp are environment globals)
     """
-    return {
-        "product": product,
-        "timestamp": "now",  # Can be enhanced with actual timestamps
-    }
\ No newline at end of file
+    return {"product": product}
\ No newline at end of file
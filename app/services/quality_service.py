@@ -4,19 +4,35 @@ Quality filtering and scoring service for generated text samples.
 Provides deduplication, quality scoring, and validation for synthetic training data.
 """
 import logging
+import math
 import re
 import hashlib
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Any, Optional
 from dataclasses import dataclass, field
-from collections import Counter
+from collections import Counter, OrderedDict
 import asyncio
 from datetime import datetime, timezone
 
+import orjson
+
 from app.models.schemas import GeneratedSample
 from app.utils.llm_client import get_llm_client, LLMException
 
 logger = logging.getLogger(__name__)
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_SENTENCE_END_RE = re.compile(r'[.!?]$')
+_WORD_RE = re.compile(r'\b\w+\b')
+_SCORE_RE = re.compile(r'(\d+\.?\d*)')
+_BATCH_SCORE_RE = re.compile(r'\d+\.\d+')
+
+# LLM coherence scores kept per scorer, keyed by text digest; bump the version when the
+# coherence prompt changes so old scores are not reused
+_COHERENCE_CACHE_SIZE = 4096
+_COHERENCE_PROMPT_VERSION = "v1"
+
 
 @dataclass
 class QualityMetrics:
@@ -42,27 +58,60 @@ class QualityFilterConfig:
     check_grammar: bool = True
     check_coherence: bool = True
     batch_size: int = 50
+    max_scoring_concurrency: int = 8  # Samples scored (LLM coherence calls) at once
+    coherence_batch_size: int = 20  # Samples rated per coherence LLM call in filter_samples
 
 
 class TextDeduplicator:
-    """Handles text deduplication using multiple strategies."""
+    """
+    Handles text deduplication using multiple strategies.
+    
+    Near-duplicates are found through a prefix-filter index over word sets: with words in
+    a fixed global order, two sets with Jaccard similarity >= the threshold must share a
+    word within their first len - ceil(threshold * len) + 1 words. Only texts sharing such
+    a prefix word are compared exactly, instead of every text seen so far.
+    """
     
     def __init__(self, similarity_threshold: float = 0.85):
         self.similarity_threshold = similarity_threshold
-        self._seen_hashes: Set[str] = set()
+        self._seen_hashes: Set[int] = set()
         self._seen_normalized: Set[str] = set()
+        
+        # Hashes of accepted texts as given, checked before any normalization
+        self._seen_raw_hashes: Set[int] = set()
+        
+        # Word sets of accepted texts, and prefix word -> indexes into _seen_word_sets
+        self._seen_word_sets: List[FrozenSet[str]] = []
+        self._prefix_index: Dict[str, List[int]] = {}
+        
+        # Normalized form and hash of the last text looked at; a sample is checked
+        # with is_duplicate and then added with add_text, so this saves a second pass
+        self._last_text: Optional[str] = None
+        self._last_normalized: Tuple[str, int] = ("", 0)
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         # Convert to lowercase, remove extra whitespace, punctuation
-        normalized = re.sub(r'[^\w\s]', '', text.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _PUNCTUATION_RE.sub('', text.lower())
+        normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
         return normalized
     
-    def get_text_hash(self, text: str) -> str:
+    def _hash_text(self, text: str) -> int:
+        """Hash text to a 64-bit int (not for security)."""
+        digest = hashlib.blake2b(text.encode(), digest_size=8, usedforsecurity=False).digest()
+        return int.from_bytes(digest, "little")
+    
+    def get_text_hash(self, text: str) -> int:
         """Get a hash of the text for exact duplicate detection."""
-        normalized = self.normalize_text(text)
-        return hashlib.md5(normalized.encode()).hexdigest()
+        return self._hash_text(self.normalize_text(text))
+    
+    def _normalize_and_hash(self, text: str) -> Tuple[str, int]:
+        """Normalized text and its hash, reusing the result for a repeated text."""
+        if text != self._last_text:
+            normalized = self.normalize_text(text)
+            self._last_normalized = (normalized, self._hash_text(normalized))
+            self._last_text = text
+        return self._last_normalized
     
     def is_duplicate(self, text: str) -> Tuple[bool, str]:
         """
@@ -71,13 +120,17 @@ class TextDeduplicator:
         Returns:
             (is_duplicate, reason)
         """
+        # Byte-identical repeats are common in generated output and skip normalization
+        if self._hash_text(text) in self._seen_raw_hashes:
+            return True, "exact_duplicate"
+        
+        normalized, text_hash = self._normalize_and_hash(text)
+        
         # Check exact duplicates
-        text_hash = self.get_text_hash(text)
         if text_hash in self._seen_hashes:
             return True, "exact_duplicate"
         
         # Check normalized duplicates
-        normalized = self.normalize_text(text)
         if normalized in self._seen_normalized:
             return True, "normalized_duplicate"
         
@@ -89,30 +142,53 @@ class TextDeduplicator:
     
     def add_text(self, text: str) -> None:
         """Add text to the seen set."""
-        text_hash = self.get_text_hash(text)
-        normalized = self.normalize_text(text)
+        normalized, text_hash = self._normalize_and_hash(text)
         
+        self._seen_raw_hashes.add(self._hash_text(text))
         self._seen_hashes.add(text_hash)
+        if normalized in self._seen_normalized:
+            return
         self._seen_normalized.add(normalized)
+        
+        words = frozenset(normalized.split())
+        if words:
+            text_id = len(self._seen_word_sets)
+            self._seen_word_sets.append(words)
+            for word in self._prefix(words):
+                self._prefix_index.setdefault(word, []).append(text_id)
+    
+    def _prefix(self, words: FrozenSet[str]) -> List[str]:
+        """Words of a set that must overlap any set at least similarity_threshold similar."""
+        # The global order only has to be consistent within this process
+        ordered = sorted(words, key=lambda word: (hash(word), word))
+        # Tolerate float error in threshold * len so the prefix is never too short
+        required = math.ceil(self.similarity_threshold * len(ordered) - 1e-9)
+        return ordered[:len(ordered) - required + 1]
     
     def _check_semantic_similarity(self, normalized_text: str) -> bool:
-        """Simple semantic similarity check using word overlap."""
-        words = set(normalized_text.split())
-        
-        # Check against existing normalized texts
-        for seen_text in self._seen_normalized:
-            seen_words = set(seen_text.split())
-            
-            # Calculate Jaccard similarity
-            intersection = len(words.intersection(seen_words))
-            union = len(words.union(seen_words))
-            
-            if union == 0:
-                continue
+        """Semantic similarity check using word-set Jaccard similarity."""
+        words = frozenset(normalized_text.split())
+        if not words:
+            return False
+        
+        threshold = self.similarity_threshold
+        checked = set()
+        for word in self._prefix(words):
+            for text_id in self._prefix_index.get(word, ()):
+                if text_id in checked:
+                    continue
+                checked.add(text_id)
+                seen_words = self._seen_word_sets[text_id]
                 
-            jaccard_similarity = intersection / union
-            if jaccard_similarity >= self.similarity_threshold:
-                return True
+                # Sets of very different size can't reach the threshold
+                if min(len(words), len(seen_words)) < threshold * max(len(words), len(seen_words)) - 1e-9:
+                    continue
+                
+                # Calculate Jaccard similarity
+                intersection = len(words & seen_words)
+                union = len(words) + len(seen_words) - intersection
+                if intersection / union >= threshold:
+                    return True
         
         return False
     
@@ -129,27 +205,37 @@ class QualityScorer:
     
     def __init__(self):
         self.deduplicator = TextDeduplicator()
+        self._coherence_cache: "OrderedDict[bytes, float]" = OrderedDict()
     
     async def score_sample(self, sample: GeneratedSample, 
-                          context: Optional[Dict[str, Any]] = None) -> QualityMetrics:
+                          context: Optional[Dict[str, Any]] = None,
+                          coherence_score: Optional[float] = None) -> QualityMetrics:
         """
         Calculate comprehensive quality scores for a sample.
         
         Args:
             sample: Generated sample to score
             context: Additional context for scoring
+            coherence_score: Coherence already rated (e.g. by score_coherence_batch);
+                rated with its own LLM call if omitted
             
         Returns:
             Quality metrics
         """
         text = sample.text
         
+        # Tokenize once; the individual scores share these
+        text_lower = text.lower()
+        word_count = len(text.split())
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        
         # Calculate individual scores
-        length_score = self._score_length(text)
-        coherence_score = await self._score_coherence(text)
-        relevance_score = self._score_relevance(text, sample.product, context)
-        grammar_score = self._score_grammar(text)
-        diversity_score = self._score_diversity(text)
+        length_score = self._score_length(word_count)
+        if coherence_score is None:
+            coherence_score = await self._score_coherence(text)
+        relevance_score = self._score_relevance(text_lower, sample.product, context)
+        grammar_score = self._score_grammar(text, sentences, text_lower)
+        diversity_score = self._score_diversity(text_lower)
         uniqueness_score = self._score_uniqueness(text)
         
         # Calculate weighted overall score
@@ -180,17 +266,15 @@ class QualityScorer:
             diversity_score=diversity_score,
             uniqueness_score=uniqueness_score,
             metadata={
-                "word_count": len(text.split()),
+                "word_count": word_count,
                 "char_count": len(text),
-                "sentence_count": len(re.split(r'[.!?]+', text)),
+                "sentence_count": len(sentences),
                 "weights_used": weights
             }
         )
     
-    def _score_length(self, text: str) -> float:
+    def _score_length(self, word_count: int) -> float:
         """Score based on text length appropriateness."""
-        word_count = len(text.split())
-        
         # Optimal range varies by type, but generally 50-200 words
         if 50 <= word_count <= 200:
             return 1.0
@@ -209,8 +293,26 @@ class QualityScorer:
         else:
             return 0.2  # Too short or too long
     
+    def _coherence_cache_key(self, text: str) -> bytes:
+        """Cache key for a text's coherence score."""
+        return hashlib.sha256(f"{_COHERENCE_PROMPT_VERSION}:{text}".encode(), usedforsecurity=False).digest()
+    
+    def _remember_coherence(self, key: bytes, score: float) -> float:
+        """Record a coherence score, evicting the least recently used beyond the cache size."""
+        self._coherence_cache[key] = score
+        if len(self._coherence_cache) > _COHERENCE_CACHE_SIZE:
+            self._coherence_cache.popitem(last=False)
+        return score
+    
     async def _score_coherence(self, text: str) -> float:
         """Score text coherence using LLM evaluation."""
+        # The evaluation runs at temperature 0, so a repeated text gets the cached score
+        key = self._coherence_cache_key(text)
+        cached = self._coherence_cache.get(key)
+        if cached is not None:
+            self._coherence_cache.move_to_end(key)
+            return cached
+        
         try:
             llm_client = get_llm_client()
             
@@ -231,24 +333,84 @@ class QualityScorer:
             response = await llm_client.generate(prompt, temperature=0.0, max_tokens=10)
             
             # Extract numeric score
-            score_match = re.search(r'(\d+\.?\d*)', response.strip())
+            score_match = _SCORE_RE.search(response.strip())
             if score_match:
                 score = float(score_match.group(1))
-                return min(max(score, 0.0), 1.0)
+                return self._remember_coherence(key, min(max(score, 0.0), 1.0))
             
-            return 0.7  # Default if parsing fails
+            return self._remember_coherence(key, 0.7)  # Default if parsing fails
             
         except Exception as e:
             logger.warning(f"Coherence scoring failed: {e}")
             return 0.7  # Default score
     
-    def _score_relevance(self, text: str, product: str, 
+    async def score_coherence_batch(self, texts: List[str]) -> List[float]:
+        """
+        Score the coherence of several texts with a single LLM call.
+        
+        Cached texts are answered from the cache; the rest are rated together in one
+        numbered prompt. Texts without a parsable score get the 0.7 default, which is
+        not cached.
+        
+        Args:
+            texts: Texts to score
+            
+        Returns:
+            Coherence score per text, in input order
+        """
+        keys = [self._coherence_cache_key(text) for text in texts]
+        pending: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in self._coherence_cache:
+                pending.setdefault(key, text)
+        
+        if len(pending) == 1:
+            await self._score_coherence(next(iter(pending.values())))
+        elif pending:
+            numbered = "\n".join(f'{i}. "{text}"' for i, text in enumerate(pending.values(), 1))
+            prompt = f"""
+            Rate the coherence of each numbered text on a scale of 0.0 to 1.0.
+            
+            Consider:
+            - Logical flow of ideas
+            - Sentence structure and clarity
+            - Overall readability
+            - Consistency of tone
+            
+            {numbered}
+            
+            Respond with only a JSON array of {len(pending)} numbers between 0.0 and 1.0, one per text in order:
+            """
+            try:
+                llm_client = get_llm_client()
+                response = await llm_client.generate(prompt, temperature=0.0, max_tokens=8 * len(pending) + 10)
+                # Texts the reply has no score for keep the default and are not cached
+                scores = self._parse_batch_scores(response, len(pending))
+                for key, score in zip(pending, scores):
+                    self._remember_coherence(key, score)
+            except Exception as e:
+                logger.warning(f"Batch coherence scoring failed: {e}")
+        
+        return [self._coherence_cache.get(key, 0.7) for key in keys]
+    
+    def _parse_batch_scores(self, response: str, count: int) -> List[float]:
+        """Parse a batch coherence reply into at most count clamped scores, in text order."""
+        try:
+            values = orjson.loads(response.strip())
+            if not isinstance(values, list):
+                raise ValueError("not a list")
+            scores = [float(value) for value in values]
+        except (orjson.JSONDecodeError, TypeError, ValueError):
+            scores = [float(value) for value in _BATCH_SCORE_RE.findall(response)]
+        
+        return [min(max(score, 0.0), 1.0) for score in scores[:count]]
+    
+    def _score_relevance(self, text_lower: str, product: str, 
                         context: Optional[Dict[str, Any]] = None) -> float:
-        """Score relevance to the product/context."""
+        """Score relevance to the product/context, given lowercased text."""
         if not product:
             return 0.5
         
-        text_lower = text.lower()
         product_lower = product.lower()
         
         # Check if product is mentioned
@@ -274,13 +436,12 @@ class QualityScorer:
         else:
             return keyword_score * 0.6  # Lower score if product not mentioned
     
-    def _score_grammar(self, text: str) -> float:
-        """Basic grammar scoring using heuristics."""
+    def _score_grammar(self, text: str, sentences: List[str], text_lower: str) -> float:
+        """Basic grammar scoring using heuristics, given the text's sentence split and lowercased form."""
         issues = 0
         total_checks = 0
         
         # Check capitalization
-        sentences = re.split(r'[.!?]+', text)
         for sentence in sentences:
             sentence = sentence.strip()
             if sentence:
@@ -290,11 +451,11 @@ class QualityScorer:
         
         # Check for basic punctuation
         total_checks += 1
-        if not re.search(r'[.!?]$', text.strip()):
+        if not _SENTENCE_END_RE.search(text.strip()):
             issues += 1
         
         # Check for excessive repetition
-        words = text.lower().split()
+        words = text_lower.split()
         word_counts = Counter(words)
         for count in word_counts.values():
             if count > 5:  # Word repeated more than 5 times
@@ -308,9 +469,9 @@ class QualityScorer:
         error_rate = issues / total_checks
         return max(1.0 - error_rate, 0.0)
     
-    def _score_diversity(self, text: str) -> float:
-        """Score lexical diversity."""
-        words = re.findall(r'\b\w+\b', text.lower())
+    def _score_diversity(self, text_lower: str) -> float:
+        """Score lexical diversity of lowercased text."""
+        words = _WORD_RE.findall(text_lower)
         if len(words) <= 1:
             return 0.0
         
@@ -356,13 +517,16 @@ class QualityFilterService:
         }
     
     async def filter_samples(self, samples: List[GeneratedSample],
-                           context: Optional[Dict[str, Any]] = None) -> Tuple[List[GeneratedSample], List[QualityMetrics]]:
+                           context: Optional[Dict[str, Any]] = None,
+                           scoring_slots: Optional[asyncio.Semaphore] = None) -> Tuple[List[GeneratedSample], List[QualityMetrics]]:
         """
         Filter samples based on quality criteria.
         
         Args:
             samples: List of samples to filter
             context: Additional context for filtering
+            scoring_slots: Semaphore bounding concurrent coherence calls, shared by callers
+                that filter several chunks at once (one of max_scoring_concurrency if omitted)
             
         Returns:
             (filtered_samples, quality_metrics_for_passed_samples)
@@ -370,49 +534,88 @@ class QualityFilterService:
         filtered_samples = []
         quality_metrics = []
         
+        candidates = []
         for sample in samples:
             self.stats["total_processed"] += 1
-            
-            # Check length first (quick filter)
-            word_count = len(sample.text.split())
-            if word_count < self.config.min_length_words or word_count > self.config.max_length_words:
-                self.stats["failed_length"] += 1
-                logger.debug(f"Sample failed length check: {word_count} words")
-                continue
-            
-            # Check for duplicates
-            if self.config.enable_deduplication:
+            if self._passes_prefilter(sample):
+                candidates.append(sample)
+        # Samples accepted from here on (by this or an overlapping call) were not part of
+        # the duplicate prefilter
+        accepted_before = self.stats["passed_filter"]
+        
+        # Scoring waits on the LLM, so coherence is rated several samples per call and
+        # the calls run concurrently
+        if scoring_slots is None:
+            scoring_slots = asyncio.Semaphore(self.config.max_scoring_concurrency)
+        batch_size = max(self.config.coherence_batch_size, 1)
+        
+        async def score_coherence(texts: List[str]) -> List[float]:
+            async with scoring_slots:
+                return await self.scorer.score_coherence_batch(texts)
+        
+        texts = [sample.text for sample in candidates]
+        coherence_batches = await asyncio.gather(*(
+            score_coherence(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)
+        ))
+        coherence_scores = [score for batch in coherence_batches for score in batch]
+        
+        # Accept in input order, giving the same outcome as filtering one by one
+        for sample, coherence_score in zip(candidates, coherence_scores):
+            if self.config.enable_deduplication and self.stats["passed_filter"] != accepted_before:
+                # A sample accepted since the prefilter may duplicate this one
                 is_duplicate, reason = self.deduplicator.is_duplicate(sample.text)
                 if is_duplicate:
                     self.stats["failed_duplicate"] += 1
                     logger.debug(f"Sample failed duplicate check: {reason}")
                     continue
             
-            # Score quality
             try:
-                metrics = await self.scorer.score_sample(sample, context)
-                
-                # Check if meets minimum quality threshold
-                if metrics.overall_score >= self.config.min_overall_score:
-                    filtered_samples.append(sample)
-                    quality_metrics.append(metrics)
-                    self.stats["passed_filter"] += 1
-                    
-                    # Add to deduplicator for future checks
-                    if self.config.enable_deduplication:
-                        self.deduplicator.add_text(sample.text)
-                else:
-                    self.stats["failed_quality"] += 1
-                    logger.debug(f"Sample failed quality check: {metrics.overall_score:.3f} < {self.config.min_overall_score}")
-                    
+                metrics = await self.scorer.score_sample(sample, context, coherence_score)
             except Exception as e:
                 logger.warning(f"Quality scoring failed for sample: {e}")
                 self.stats["failed_quality"] += 1
                 continue
+            
+            if self._accept(sample, metrics):
+                filtered_samples.append(sample)
+                quality_metrics.append(metrics)
         
         logger.info(f"Quality filtering complete: {len(filtered_samples)}/{len(samples)} samples passed")
         return filtered_samples, quality_metrics
     
+    def _passes_prefilter(self, sample: GeneratedSample) -> bool:
+        """Run the cheap length and duplicate checks that precede scoring."""
+        # Check length first (quick filter)
+        word_count = len(sample.text.split())
+        if word_count < self.config.min_length_words or word_count > self.config.max_length_words:
+            self.stats["failed_length"] += 1
+            logger.debug(f"Sample failed length check: {word_count} words")
+            return False
+        
+        # Check for duplicates
+        if self.config.enable_deduplication:
+            is_duplicate, reason = self.deduplicator.is_duplicate(sample.text)
+            if is_duplicate:
+                self.stats["failed_duplicate"] += 1
+                logger.debug(f"Sample failed duplicate check: {reason}")
+                return False
+        return True
+    
+    def _accept(self, sample: GeneratedSample, metrics: QualityMetrics) -> bool:
+        """Apply the quality threshold to a scored sample, recording it if it passes."""
+        # Check if meets minimum quality threshold
+        if metrics.overall_score < self.config.min_overall_score:
+            self.stats["failed_quality"] += 1
+            logger.debug(f"Sample failed quality check: {metrics.overall_score:.3f} < {self.config.min_overall_score}")
+            return False
+        
+        self.stats["passed_filter"] += 1
+        
+        # Add to deduplicator for future checks
+        if self.config.enable_deduplication:
+            self.deduplicator.add_text(sample.text)
+        return True
+    
     async def filter_batch(self, samples: List[GeneratedSample],
                           context: Optional[Dict[str, Any]] = None) -> Tuple[List[GeneratedSample], List[QualityMetrics]]:
         """Filter samples in batches for better performance."""
@@ -446,6 +649,11 @@ class QualityFilterService:
             "deduplication_stats": self.deduplicator.get_stats()
         }
     
+    def reset(self) -> None:
+        """Start a new batch: forget previously accepted samples and reset statistics."""
+        self.deduplicator = TextDeduplicator(self.config.similarity_threshold)
+        self.reset_stats()
+    
     def reset_stats(self) -> None:
         """Reset filtering statistics."""
         self.stats = {
@@ -462,9 +670,14 @@ _quality_service: Optional[QualityFilterService] = None
 
 
 def get_quality_service(config: Optional[QualityFilterConfig] = None) -> QualityFilterService:
-    """Get or create global quality service instance."""
+    """
+    Get or create global quality service instance.
+    
+    When a config is given that differs from the current instance's config,
+    the instance is rebuilt; an equal config reuses the existing instance.
+    """
     global _quality_service
-    if _quality_service is None:
+    if _quality_service is None or (config is not None and config != _quality_service.config):
         _quality_service = QualityFilterService(config)
     return _quality_service
 
@@ -143,19 +143,14 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate  # tokens per second
         self.tokens = capacity
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
     
     async def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens, return True if successful"""
         async with self._lock:
-            now = time.time()
-            
             # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            new_tokens = elapsed * self.refill_rate
-            self.tokens = min(self.capacity, self.tokens + new_tokens)
-            self.last_refill = now
+            self._refill()
             
             # Check if we have enough tokens
             if self.tokens >= tokens:
@@ -163,6 +158,29 @@ class TokenBucket:
                 return True
             return False
     
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until tokens are available, then consume them.
+        
+        Sleeps exactly as long as the refill needs instead of polling. Waiters hold the
+        lock while they sleep, so they are served in arrival order and a large request
+        is not starved by a stream of small ones.
+        """
+        # A request larger than the bucket could never be satisfied; let it drain the bucket
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= tokens
+    
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
     async def wait_for_tokens(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
         """Wait until tokens are available"""
         start_time = time.time()
@@ -420,19 +438,10 @@ class RateLimitManager:
                             await self.backoff.sleep(attempt)
                             continue
                         
-                        # Wait for token bucket availability
-                        request_allowed = await self.request_bucket.consume(1)
-                        tokens_allowed = await self.token_bucket.consume(estimated_tokens)
-                        
-                        if not request_allowed:
-                            logger.warning("Request bucket rate limit reached")
-                            await self.backoff.sleep(attempt)
-                            continue
-                        
-                        if not tokens_allowed:
-                            logger.warning(f"Token bucket rate limit reached for {estimated_tokens} tokens")
-                            await self.backoff.sleep(attempt)
-                            continue
+                        # Pace requests to the RPM/TPM budget instead of backing off after
+                        # the fact; waiting exactly for the refill keeps us just under the limit
+                        await self.request_bucket.acquire(1)
+                        await self.token_bucket.acquire(estimated_tokens)
                         
                         # Track request timing
                         self._request_times.append(time.time())
@@ -7,6 +7,7 @@ from .llm_client import (
     OpenAIClient,
     AnthropicClient,
     MockLLMClient,
+    close_llm_clients,
     get_llm_client,
     test_llm_client
 )
@@ -17,6 +18,7 @@ __all__ = [
     "OpenAIClient",
     "AnthropicClient",
     "MockLLMClient",
+    "close_llm_clients",
     "get_llm_client",
     "test_llm_client"
 ]
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Adaptive concurrency control for outbound LLM requests.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def is_overload_status(status: Optional[int]) -> bool:
+    """Whether an HTTP status signals provider overload (rate limited or server error)."""
+    return status is not None and (status == 429 or status >= 500)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit, used as an async context manager around each request.
+
+    The limit grows by one after every `increase_every` successes and is cut by
+    `decrease_factor` on a 429 or 5xx response, so it settles just under the
+    provider's real capacity without per-tier tuning.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        increase_every: int = 10,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Concurrency to start at
+            max_limit: Upper bound for the limit
+            min_limit: Lower bound for the limit
+            increase_every: Successes required before the limit grows by one
+            decrease_factor: Multiplier applied to the limit on overload
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = min(self.max_limit, max(min_limit, initial_limit))
+        self.increase_every = increase_every
+        self.decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    async def report(self, success: bool, status: Optional[int] = None) -> None:
+        """
+        Feed back the outcome of a request.
+
+        Args:
+            success: Whether the request succeeded
+            status: HTTP status of a failed request, if known
+        """
+        async with self._condition:
+            if success:
+                self._successes += 1
+                if self._successes >= self.increase_every and self.limit < self.max_limit:
+                    self._successes = 0
+                    self.limit += 1
+                    self._condition.notify()
+            elif is_overload_status(status):
+                self._successes = 0
+                previous = self.limit
+                self.limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+                if self.limit != previous:
+                    logger.warning(f"Provider overloaded (status {status}); concurrency {previous} -> {self.limit}")
@@ -0,0 +1,74 @@
+"""
+Local sentence-embedding utilities.
+Uses sentence-transformers if available; callers fall back when it is not installed.
+"""
+import logging
+from typing import List, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Loaded lazily; False records a failed load so it is not retried on every call
+_embedding_model = None
+
+
+def get_embedding_model():
+    """
+    Get the shared sentence-embedding model, loading it on first use.
+
+    Returns:
+        SentenceTransformer instance, or None if sentence-transformers is unavailable
+    """
+    global _embedding_model
+    if _embedding_model is None:
+        try:
+            from sentence_transformers import SentenceTransformer  # type: ignore
+            _embedding_model = SentenceTransformer(get_settings().embedding_model)
+        except Exception as e:
+            logger.info(f"Sentence embeddings unavailable, using fallbacks: {e}")
+            _embedding_model = False
+    return _embedding_model or None
+
+
+def embed_texts(texts: List[str]):
+    """
+    Embed texts in a single forward pass.
+
+    Encoding is CPU-bound and blocking; async callers should run it via asyncio.to_thread.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        Array of L2-normalized embeddings (one row per text), or None if no model is available
+    """
+    model = get_embedding_model()
+    if model is None:
+        return None
+    return model.encode(texts, batch_size=32, normalize_embeddings=True, show_progress_bar=False)
+
+
+def pairwise_cosine(texts_a: List[str], texts_b: List[str]) -> Optional[List[float]]:
+    """
+    Cosine similarity of each (texts_a[i], texts_b[i]) pair.
+
+    All texts are embedded in one forward pass and the row-wise dot products
+    computed in a single einsum.
+
+    Returns:
+        Similarity per pair, or None if no model is available
+    """
+    if len(texts_a) != len(texts_b):
+        raise ValueError("texts_a and texts_b must have the same length")
+    if not texts_a:
+        return []
+
+    embeddings = embed_texts(list(texts_a) + list(texts_b))
+    if embeddings is None:
+        return None
+
+    import numpy as np
+
+    n = len(texts_a)
+    return np.einsum('ij,ij->i', embeddings[:n], embeddings[n:]).tolist()
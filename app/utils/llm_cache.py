@@ -0,0 +1,163 @@
+"""
+Semantic response cache in front of the LLM client.
+
+Prompts built from near-identical inputs (e.g. rating the similarity of overlapping texts)
+are answered from memory instead of a new LLM round trip. Lookups are exact first, then by
+embedding cosine similarity when sentence embeddings are available and the caller allows it.
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+from app.config import get_settings
+from app.utils.embeddings import embed_texts
+from app.utils.llm_client import get_llm_client
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticLLMCache:
+    """
+    LRU cache of LLM responses keyed by namespace and input text.
+
+    The namespace holds everything that must match exactly for a response to be reused
+    (prompt kind, generation parameters, constraints); the key text is the free-form input
+    that is compared semantically. Embedding only the key text keeps long shared prompt
+    templates from making unrelated requests look similar.
+
+    Semantic lookups are a linear scan, so each one compares against at most
+    ``semantic_scan_limit`` of the most recently used entries rather than the whole cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        similarity_threshold: float = 0.87,
+        semantic_scan_limit: int = 512
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses before least recently used entries are evicted
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            semantic_scan_limit: Most recently used entries compared per semantic lookup
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.semantic_scan_limit = semantic_scan_limit
+        # (namespace, key_text) -> (response, embedding or None)
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    async def _lookup(self, namespace: Hashable, key_text: str, semantic: bool = True) -> Tuple[Optional[str], Any]:
+        """Find a cached response, returning it with the query embedding computed on the way."""
+        key = (namespace, key_text)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            return cached[0], cached[1]
+        if not semantic:
+            return None, None
+
+        # Encoding is CPU-bound; keep it off the event loop
+        embedding = await asyncio.to_thread(embed_texts, [key_text])
+        if embedding is None:
+            return None, None
+        query = embedding[0]
+
+        best_key, best_score = None, self.similarity_threshold
+        scanned = 0
+        for entry_key in reversed(self._entries):
+            if scanned >= self.semantic_scan_limit:
+                break
+            entry_embedding = self._entries[entry_key][1]
+            if entry_key[0] != namespace or entry_embedding is None:
+                continue
+            scanned += 1
+            score = float(entry_embedding @ query)
+            if score >= best_score:
+                best_key, best_score = entry_key, score
+
+        if best_key is None:
+            return None, query
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][0], query
+
+    def _store(self, namespace: Hashable, key_text: str, response: str, embedding: Any) -> None:
+        """Insert a response, evicting the least recently used entries when full."""
+        self._entries[(namespace, key_text)] = (response, embedding)
+        self._entries.move_to_end((namespace, key_text))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        *,
+        namespace: Hashable = None,
+        key_text: Optional[str] = None,
+        producer: Optional[Callable[[], Awaitable[str]]] = None,
+        semantic: bool = True
+    ) -> str:
+        """
+        Generate text, reusing a cached response for an equivalent request.
+
+        Args:
+            prompt: Full prompt sent to the LLM on a miss
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            namespace: Values that must match exactly for a cached response to be reused
+            key_text: Text compared semantically against cached entries (defaults to the prompt)
+            producer: Coroutine factory used on a miss instead of a plain generate() call
+            semantic: Whether a similar key text may reuse a response; disable when inputs
+                that embed closely can still need different responses
+
+        Returns:
+            Generated (or cached) text
+        """
+        namespace = (namespace, temperature, max_tokens)
+        key_text = prompt if key_text is None else key_text
+
+        response, embedding = await self._lookup(namespace, key_text, semantic)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        self.misses += 1
+        if producer is not None:
+            response = await producer()
+        else:
+            response = await get_llm_client().generate(prompt, temperature=temperature, max_tokens=max_tokens)
+        # Empty responses (e.g. abandoned generations) are not worth reusing
+        if response:
+            self._store(namespace, key_text, response, embedding)
+        return response
+
+
+# Global cache instance
+_semantic_llm_cache: Optional[SemanticLLMCache] = None
+
+
+def get_semantic_llm_cache() -> SemanticLLMCache:
+    """Get global semantic LLM cache instance."""
+    global _semantic_llm_cache
+    if _semantic_llm_cache is None:
+        settings = get_settings()
+        _semantic_llm_cache = SemanticLLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            similarity_threshold=settings.llm_cache_similarity_threshold,
+            semantic_scan_limit=settings.llm_cache_semantic_scan_limit
+        )
+    return _semantic_llm_cache
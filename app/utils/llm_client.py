@@ -4,11 +4,14 @@ Pluggable async LLM client interface and implementations.
 import asyncio
 import json
 import logging
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Optional
 import aiohttp
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from app.config import get_settings
+from app.utils.token_utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,29 @@ class LLMClientInterface(ABC):
         """
         pass
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate text as a stream of chunks.
+        
+        Closing the iterator early (aclose()) stops the generation. The default yields
+        the full generate() result as a single chunk; clients with a streaming API
+        override this so callers can abandon a generation part-way.
+        
+        Args:
+            prompt: Input prompt text
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate
+            
+        Yields:
+            Generated text chunks
+        """
+        yield await self.generate(prompt, temperature=temperature, max_tokens=max_tokens)
+    
     @abstractmethod
     async def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model."""
@@ -52,13 +78,28 @@ class LLMClientInterface(ABC):
 
 class LLMException(Exception):
     """Exception raised by LLM clients."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failed provider call, when known (e.g. 429)
+        self.status_code = status_code
 
 
+# Shared OpenAI client per event loop (see _get_shared_openai_client)
+_shared_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OpenAIClient]" = weakref.WeakKeyDictionary()
+# Client handed out when no event loop is running (see _get_shared_openai_client)
+_fallback_openai_client: Optional["OpenAIClient"] = None
+
 class OpenAIClient(LLMClientInterface):
     """OpenAI GPT client implementation."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4", timeout: int = 60):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        timeout: int = 60,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize OpenAI client.
         
@@ -66,11 +107,16 @@ class OpenAIClient(LLMClientInterface):
             api_key: OpenAI API key
             model: Model name (e.g., "gpt-4", "gpt-3.5-turbo")
             timeout: Request timeout in seconds
+            http_client: Pooled HTTP client to send requests through (SDK default if omitted)
         """
-        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout, http_client=http_client)
         self.model = model
         self.timeout = timeout
     
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+    
     async def generate(
         self, 
         prompt: str, 
@@ -90,8 +136,8 @@ class OpenAIClient(LLMClientInterface):
             logger.warning("Rate limiting service not available, proceeding without rate limiting")
             use_rate_limiting = False
         
-        # Estimate tokens for rate limiting (rough approximation)
-        estimated_tokens = len(prompt) // 4 + (max_tokens or 0)
+        # Reserve prompt tokens plus the completion budget against the TPM bucket
+        estimated_tokens = estimate_tokens(prompt, self.model) + (max_tokens or 0)
         
         try:
             if use_rate_limiting:
@@ -114,15 +160,64 @@ class OpenAIClient(LLMClientInterface):
         except Exception as e:
             if use_rate_limiting and "RateLimitError" in str(type(e)):
                 logger.error(f"Rate limit error: {e}")
-                raise LLMException(f"OpenAI rate limit exceeded: {e}")
+                raise LLMException(f"OpenAI rate limit exceeded: {e}", status_code=429)
             
             logger.error(f"OpenAI generation failed: {e}")
+            status_code = getattr(e, "status_code", None)
             if "rate limit" in str(e).lower() or "429" in str(e):
-                raise LLMException(f"OpenAI rate limit exceeded: {e}")
+                raise LLMException(f"OpenAI rate limit exceeded: {e}", status_code=429)
             elif "timeout" in str(e).lower():
-                raise LLMException(f"OpenAI request timeout: {e}")
+                raise LLMException(f"OpenAI request timeout: {e}", status_code=status_code)
             else:
+                raise LLMException(f"OpenAI generation failed: {e}", status_code=status_code)
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream text from the OpenAI API; closing the iterator closes the HTTP stream."""
+        settings = get_settings()
+        max_tokens = max_tokens or settings.openai_max_tokens
+        
+        try:
+            from app.services.rate_limiting_service import get_rate_limit_manager
+            rate_limit_manager = get_rate_limit_manager()
+        except ImportError:
+            logger.warning("Rate limiting service not available, proceeding without rate limiting")
+            rate_limit_manager = None
+        
+        estimated_tokens = estimate_tokens(prompt, self.model) + (max_tokens or 0)
+        
+        async def stream_chunks() -> AsyncIterator[str]:
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    stream=True
+                )
+            except Exception as e:
+                logger.error(f"OpenAI streaming generation failed: {e}")
                 raise LLMException(f"OpenAI generation failed: {e}")
+            try:
+                async for event in stream:
+                    if event.choices and event.choices[0].delta.content:
+                        yield event.choices[0].delta.content
+            finally:
+                await stream.close()
+        
+        if rate_limit_manager is None:
+            async for chunk in stream_chunks():
+                yield chunk
+            return
+        
+        async with rate_limit_manager.rate_limited_request(estimated_tokens=estimated_tokens):
+            async for chunk in stream_chunks():
+                yield chunk
     
     async def _make_openai_request(self, prompt: str, temperature: float, max_tokens: int):
         """Make the actual OpenAI API request"""
@@ -278,6 +373,71 @@ class MockLLMClient(LLMClientInterface):
         return True
 
 
+def _create_http_client(timeout: int, max_keepalive_connections: int = 100) -> httpx.AsyncClient:
+    """
+    HTTP client with a large keep-alive pool, using HTTP/2 when h2 is installed.
+    
+    HTTP/2 multiplexes concurrent requests over one connection, so a batch pays for a
+    single TLS handshake instead of one per pooled connection.
+    """
+    try:
+        import h2  # noqa: F401  # type: ignore
+        http2 = True
+    except ImportError:
+        http2 = False
+    return DefaultAsyncHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections, max_connections=200),
+        timeout=httpx.Timeout(timeout)
+    )
+
+
+def _get_shared_openai_client(settings) -> "OpenAIClient":
+    """
+    OpenAI client shared by everything running on the current event loop.
+    
+    Pooled connections belong to the loop that opened them, so there is one client
+    per loop: a single one for the API process and each Celery worker's loop.
+    
+    Outside a running loop the client may later be driven by several short-lived loops
+    (e.g. one asyncio.run per call), so a single fallback client without keep-alive
+    connections is reused; no pooled socket outlives the loop that opened it.
+    """
+    global _fallback_openai_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    if loop is None:
+        if _fallback_openai_client is None or _fallback_openai_client.model != settings.openai_model:
+            _fallback_openai_client = OpenAIClient(
+                api_key=settings.openai_api_key,
+                model=settings.openai_model,
+                timeout=settings.openai_timeout_seconds,
+                http_client=_create_http_client(settings.openai_timeout_seconds, max_keepalive_connections=0)
+            )
+        return _fallback_openai_client
+    
+    client = _shared_openai_clients.get(loop)
+    if client is None or client.model != settings.openai_model:
+        client = OpenAIClient(
+            api_key=settings.openai_api_key,
+            model=settings.openai_model,
+            timeout=settings.openai_timeout_seconds,
+            http_client=_create_http_client(settings.openai_timeout_seconds)
+        )
+        _shared_openai_clients[loop] = client
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Close the shared LLM client of the current event loop (call on shutdown)."""
+    client = _shared_openai_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
 def get_llm_client(provider: Optional[str] = None) -> LLMClientInterface:
     """
     Factory function to get LLM client instance.
@@ -299,11 +459,7 @@ def get_llm_client(provider: Optional[str] = None) -> LLMClientInterface:
         if not settings.openai_api_key:
             logger.warning("OpenAI API key not found, falling back to mock client")
             return MockLLMClient()
-        return OpenAIClient(
-            api_key=settings.openai_api_key,
-            model=settings.openai_model,
-            timeout=settings.openai_timeout_seconds
-        )
+        return _get_shared_openai_client(settings)
     
     elif provider == "anthropic":
         if not settings.anthropic_api_key:
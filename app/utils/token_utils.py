@@ -2,18 +2,94 @@
 Token estimation and cost calculation utilities.
 Uses tiktoken if available for accurate tokenization; falls back to heuristic.
 """
-from typing import Tuple
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
 from app.config import get_settings
 
+try:
+    import tiktoken  # type: ignore
+except ImportError:
+    tiktoken = None
 
-def estimate_tokens(text: str, model: str) -> int:
+logger = logging.getLogger(__name__)
+
+
+# Lines encoded per step when checking a token limit
+_LIMIT_CHECK_LINES = 32
+
+# Seconds before retrying an encoding that failed to load (e.g. BPE download while offline)
+_ENCODING_RETRY_SECONDS = 60.0
+
+# Successfully loaded encodings by model; failures are only remembered until the retry time
+_encodings: Dict[str, Any] = {}
+_encoding_retry_at: Dict[str, float] = {}
+
+
+def _load_encoding(model: str):
+    """Load the BPE encoding for a model, falling back to cl100k_base for unknown models."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name; cl100k_base is close enough for estimates
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _get_encoding(model: str):
+    """Get the BPE encoding for a model; None if tiktoken or the encoding is unavailable."""
+    enc = _encodings.get(model)
+    if enc is not None or tiktoken is None:
+        return enc
+    if time.monotonic() < _encoding_retry_at.get(model, 0.0):
+        return None
     try:
-        import tiktoken  # type: ignore
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
-    except Exception:
-        # Fallback heuristic: ~4 chars per token
-        return max(1, len(text) // 4)
+        enc = _load_encoding(model)
+    except Exception as e:
+        logger.warning("Token encoding for %s unavailable, using heuristic estimates: %s", model, e)
+        _encoding_retry_at[model] = time.monotonic() + _ENCODING_RETRY_SECONDS
+        return None
+    _encodings[model] = enc
+    _encoding_retry_at.pop(model, None)
+    return enc
+
+
+def estimate_tokens(text: str, model: str) -> int:
+    enc = _get_encoding(model)
+    if enc is not None:
+        try:
+            # Treat special-token text literally instead of raising on it
+            return len(enc.encode(text, disallowed_special=()))
+        except Exception:
+            pass
+    # Fallback heuristic: ~4 chars per token
+    return max(1, len(text) // 4)
+
+
+def tokens_within_limit(text: str, limit: int, model: str) -> Optional[int]:
+    """
+    Count tokens only as far as needed to check an upper bound.
+
+    Lines are encoded a group at a time and counting stops as soon as the running
+    total exceeds the limit, so oversized prompts are rejected without tokenizing
+    them fully. Counts can differ from a whole-text encode by the odd token where a
+    merge would span a line break.
+
+    Returns:
+        Token count if it is at most the limit, otherwise None
+    """
+    enc = _get_encoding(model)
+    if enc is None:
+        count = max(1, len(text) // 4)
+        return count if count <= limit else None
+
+    lines = text.splitlines(keepends=True)
+    count = 0
+    for start in range(0, len(lines), _LIMIT_CHECK_LINES):
+        group = lines[start:start + _LIMIT_CHECK_LINES]
+        count += sum(len(tokens) for tokens in enc.encode_ordinary_batch(group))
+        if count > limit:
+            return None
+    return count
 
 
 def estimate_completion_cost(prompt_tokens: int, completion_tokens: int, model: str) -> float:
@@ -45,6 +45,7 @@ echo -e "${BLUE}Starting Celery services...${NC}"
 # Start generation worker
 echo -e "${YELLOW}Starting generation worker...${NC}"
 celery -A app.celery_app worker \
+    -E \
     --loglevel=info \
     --queues=generation \
     --concurrency=2 \
@@ -56,6 +57,7 @@ celery -A app.celery_app worker \
 # Start augmentation worker  
 echo -e "${YELLOW}Starting augmentation worker...${NC}"
 celery -A app.celery_app worker \
+    -E \
     --loglevel=info \
     --queues=augmentation \
     --concurrency=1 \
@@ -67,6 +69,7 @@ celery -A app.celery_app worker \
 # Start maintenance worker
 echo -e "${YELLOW}Starting maintenance worker...${NC}"
 celery -A app.celery_app worker \
+    -E \
     --loglevel=info \
     --queues=maintenance \
     --concurrency=1 \
@@ -50,6 +50,7 @@ echo "Press Ctrl+C to stop the worker"
 echo ""
 
 celery -A app.celery_app worker \
+    -E \
     --loglevel=$LOGLEVEL \
     --queues=$QUEUE \
     --concurrency=$CONCURRENCY \
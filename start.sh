@@ -32,6 +32,7 @@ else:
 
 # Start Celery worker
 celery -A app.celery_app worker \
+    -E \
     --loglevel=info \
     --concurrency=2 \
     --queues=generation,augmentation,maintenance,default \
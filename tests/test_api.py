@@ -4,6 +4,7 @@ Basic tests for the DataForge API.
 import pytest
 import pytest_asyncio
 import httpx
+import json
 from app.main import app
 from app.config import get_settings
 
@@ -116,4 +117,114 @@ async def test_nonexistent_job():
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
         response = await ac.get("/api/result/nonexistent-job-id")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_generation_endpoint():
+    """Samples are streamed back as one JSON object per line."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/generate/stream", json={
+            "product": "test product",
+            "count": 2
+        })
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 2
+    assert all(json.loads(line)["product"] == "test product" for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_completed_job_result_serialization(monkeypatch):
+    """Completed results are returned as JSON with UTC timestamps."""
+    from datetime import datetime, timezone
+    from app.models.schemas import GeneratedSample, GenerationResponse, JobStatusResponse
+    from app.routers import generation
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    sample = GeneratedSample(
+        id="s1", product="widget", prompt_version="v1", generated_at=now,
+        text="hello", tokens_estimated=1, temperature=0.7
+    )
+    status = JobStatusResponse(
+        job_id="job-1", status="completed", created_at=now, updated_at=now,
+        result=GenerationResponse(samples=[sample], total_samples=1, total_tokens_estimated=1)
+    )
+
+    class StubStore:
+        def get_status(self, job_id):
+            return status
+
+    monkeypatch.setattr(generation, "get_job_store", lambda: StubStore())
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/result/job-1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["result"]["samples"][0]["generated_at"] == "2024-01-01T00:00:00Z"
+    assert JobStatusResponse.model_validate(data) == status
+
+
+@pytest.mark.asyncio
+async def test_stream_job_status_until_finished(monkeypatch):
+    """Status updates are streamed as NDJSON; unknown jobs are 404."""
+    from datetime import datetime, timezone
+    from app.models.schemas import JobStatusResponse
+    from app.routers import generation
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = [
+        JobStatusResponse(job_id="job-1", status="running", progress=50, created_at=now, updated_at=now),
+        JobStatusResponse(job_id="job-1", status="error", error_message="boom", created_at=now, updated_at=now),
+    ]
+
+    class StubStore:
+        async def watch_status(self, job_id):
+            if job_id != "job-1":
+                return
+            for status in statuses:
+                yield status
+
+    monkeypatch.setattr(generation, "get_job_store", lambda: StubStore())
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/result/job-1/stream")
+        missing = await ac.get("/api/result/job-2/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["status"] for line in lines] == ["running", "error"]
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_job_results_batch(monkeypatch):
+    """Several job statuses are returned in one response keyed by job id."""
+    from datetime import datetime, timezone
+    from app.models.schemas import JobStatusResponse
+    from app.routers import generation
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    status = JobStatusResponse(job_id="job-1", status="running", progress=10, created_at=now, updated_at=now)
+
+    class StubStore:
+        def get_statuses(self, job_ids):
+            return {job_id: status if job_id == "job-1" else None for job_id in job_ids}
+
+    monkeypatch.setattr(generation, "get_job_store", lambda: StubStore())
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/results", params=[("job_ids", "job-1"), ("job_ids", "job-2")])
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["job-2"] is None
+    assert JobStatusResponse.model_validate(data["job-1"]) == status
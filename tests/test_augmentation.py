@@ -6,6 +6,7 @@ from app.services.data_augmentation_service import (
     DataAugmentationService,
     AugmentationStrategy,
 )
+from app.utils.token_utils import estimate_tokens
 
 
 @pytest.mark.asyncio
@@ -35,3 +36,244 @@ async def test_augmentation_service_with_mock_llm(monkeypatch):
     for s in augmented:
         assert s.product == original.product
         assert "augmentation_strategy" in (s.metadata or {})
+        assert s.tokens_estimated == estimate_tokens(s.text, settings.openai_model)
+
+
+@pytest.mark.asyncio
+async def test_semantic_similarity_uses_local_embeddings(monkeypatch):
+    from app.services import data_augmentation_service as das
+
+    monkeypatch.setattr(das, "pairwise_cosine", lambda a, b: [0.92])
+
+    async def fail_llm(*args, **kwargs):
+        raise AssertionError("LLM similarity should not be called")
+
+    strategy = das.ContextFocusedAugmentation()
+    monkeypatch.setattr(strategy, "_calculate_llm_similarity", fail_llm)
+
+    assert await strategy._calculate_semantic_similarity("a b", "a c") == pytest.approx(0.92)
+
+
+@pytest.mark.asyncio
+async def test_gather_variants_keeps_order_and_drops_failures():
+    from app.services.data_augmentation_service import ContextFocusedAugmentation
+
+    async def ok(value):
+        return value
+
+    async def boom():
+        raise RuntimeError("variant failed")
+
+    strategy = ContextFocusedAugmentation()
+    outcomes = await strategy._gather_variants("CDA", [ok(1), boom(), ok(3)])
+
+    assert outcomes == [1, None, 3]
+
+
+def test_extract_aspects_matches_every_keyword_substring():
+    from app.services.data_augmentation_service import AspectFocusedAugmentation
+
+    strategy = AspectFocusedAugmentation()
+    text = "The battery and display quality are great, but customer service was slow."
+
+    aspects = strategy._extract_aspects(text)
+
+    expected_keywords = {k for k in strategy._aspect_keywords if k in text.lower()}
+    assert expected_keywords <= set(aspects)
+    assert {"battery", "display", "quality", "service"} <= set(aspects)
+
+
+def test_extract_aspects_keeps_product_pattern_baseline():
+    from app.services.data_augmentation_service import AspectFocusedAugmentation
+
+    strategy = AspectFocusedAugmentation()
+    aspects = strategy._extract_aspects("I love the battery. It is a great device and a fine app.")
+
+    # Single-letter words ("I", "a") never took part in proper-noun matches
+    assert sorted(aspects) == [
+        "app", "battery", "device", "fine app", "great device and", "it is", "love the battery"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_preservation_batch_falls_back_without_embeddings(monkeypatch):
+    from app.services import data_augmentation_service as das
+
+    monkeypatch.setattr(das, "embed_texts", lambda texts: None)
+    strategy = das.ContextFocusedAugmentation()
+
+    async def fake_validate(original, variant, aspects):
+        return True, 0.9 if "keep" in variant else 0.1
+
+    monkeypatch.setattr(strategy, "_validate_preservation", fake_validate)
+
+    context = das._RequestContext.build("orig", [])
+    results = await strategy._validate_preservation_batch(context, ["keep a", "drop b"])
+
+    assert results == [(True, 0.9), (True, 0.1)]
+
+
+def test_replace_aspect_in_text_is_whole_word_and_literal():
+    from app.services.data_augmentation_service import AspectFocusedAugmentation
+
+    strategy = AspectFocusedAugmentation()
+    text = "Price matters; the pricey price tag hurt."
+
+    assert strategy._replace_aspect_in_text(text, "price", "cost") == "cost matters; the pricey cost tag hurt."
+    assert strategy._replace_aspect_in_text("the price", "price", r"c\1st") == r"the c\1st"
+
+
+def test_aspect_preservation_counts_each_aspect_once():
+    from app.services.data_augmentation_service import ContextFocusedAugmentation
+
+    strategy = ContextFocusedAugmentation()
+    aspects = ["battery", "display", "price"]
+
+    assert strategy._aspect_preservation("Battery life and battery display", aspects) == pytest.approx(2 / 3)
+    assert strategy._aspect_preservation("anything", []) == 1.0
+
+
+def test_aspect_preservation_counts_prefix_aspects():
+    from app.services.data_augmentation_service import ContextFocusedAugmentation
+
+    strategy = ContextFocusedAugmentation()
+    text = "Battery works, price is fair."
+    aspects = strategy._extract_aspects(text)
+
+    assert {"battery", "battery works", "price", "price is fair"} <= set(aspects)
+    assert strategy._aspect_preservation(text, aspects) == 1.0
+    assert strategy._aspect_preservation("The battery is fine.", ["battery", "battery works"]) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_aspect_alternatives_are_fetched_once_per_aspect_and_product(monkeypatch):
+    from app.services import data_augmentation_service as das
+
+    calls = []
+
+    class FakeClient:
+        async def generate(self, prompt, temperature=0.7, max_tokens=None):
+            calls.append(prompt)
+            return '"cost", Price, value, pricing'
+
+    monkeypatch.setattr(das, "get_llm_client", lambda: FakeClient())
+    strategy = das.AspectFocusedAugmentation()
+
+    picks = [
+        await strategy._generate_aspect_alternative("price", f"context {i}", "widget")
+        for i in range(4)
+    ]
+
+    assert picks == ["cost", "value", "pricing", "cost"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_validation_skips_similarity_when_aspects_rule_out_variant(monkeypatch):
+    from app.services.data_augmentation_service import ContextFocusedAugmentation
+
+    strategy = ContextFocusedAugmentation()
+
+    async def fail_similarity(*args):
+        raise AssertionError("similarity should not be computed")
+
+    monkeypatch.setattr(strategy, "_calculate_semantic_similarity", fail_similarity)
+
+    is_valid, score = await strategy._validate_preservation(
+        "battery and display and price", "something else entirely", ["battery", "display", "price"]
+    )
+
+    assert is_valid is False
+    assert score == 0.0
+
+
+def test_cada_shares_service_strategy_instances():
+    svc = DataAugmentationService()
+    cada = svc.strategies[AugmentationStrategy.CADA]
+
+    assert cada.cda_strategy is svc.strategies[AugmentationStrategy.CDA]
+    assert cada.ada_strategy is svc.strategies[AugmentationStrategy.ADA]
+
+
+@pytest.mark.asyncio
+async def test_strategies_share_one_concurrency_bound(monkeypatch):
+    import asyncio
+    from app.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "augmentation_concurrency_limit", 2)
+    svc = DataAugmentationService()
+    in_flight = 0
+    peak = 0
+
+    async def variant():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    await asyncio.gather(*(
+        strategy._gather_variants(strategy_name.value, [variant() for _ in range(3)])
+        for strategy_name, strategy in svc.strategies.items()
+    ))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_alternative_requests_share_one_fetch(monkeypatch):
+    import asyncio
+    from app.services import data_augmentation_service as das
+
+    calls = []
+
+    class SlowClient:
+        async def generate(self, prompt, temperature=0.7, max_tokens=None):
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return "cost, value"
+
+    monkeypatch.setattr(das, "get_llm_client", lambda: SlowClient())
+    strategy = das.AspectFocusedAugmentation()
+
+    prefetch = asyncio.ensure_future(strategy.prefetch_alternatives(["price"], "ctx", "widget"))
+    await asyncio.sleep(0.001)  # let the prefetch start its fetch
+    assert strategy.has_alternatives("price", "widget")
+
+    alternative = await strategy._generate_aspect_alternative("price", "other ctx", "widget")
+    await prefetch
+
+    assert alternative == "cost"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_paraphrase_abandons_output_missing_aspects(monkeypatch):
+    from app.services import data_augmentation_service as das
+
+    closed = []
+
+    class StreamingClient:
+        def __init__(self):
+            self.attempts = 0
+
+        async def generate_stream(self, prompt, temperature=0.7, max_tokens=None):
+            self.attempts += 1
+            chunks = ["a very long answer ", "that never mentions ", "the key term at all"]
+            if self.attempts > 1:
+                chunks = ["battery is ", "fine"]
+            try:
+                for chunk in chunks:
+                    yield chunk
+            finally:
+                closed.append(self.attempts)
+
+    client = StreamingClient()
+    monkeypatch.setattr(das, "get_llm_client", lambda: client)
+    strategy = das.ContextFocusedAugmentation()
+
+    result = await strategy._stream_paraphrase("prompt", "battery ok", ["battery"])
+
+    assert result == "battery is fine"
+    assert client.attempts == 2
+    assert closed == [1, 2]
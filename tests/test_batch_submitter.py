@@ -0,0 +1,69 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.batch_submitter import _build_batch_jsonl, _parse_batch_output, submit_batch
+from app.utils.llm_client import LLMException
+
+
+def test_batch_jsonl_round_trip_keeps_prompt_order():
+    lines = _build_batch_jsonl(["first", "second"], model="gpt-4o", temperature=0.5, max_tokens=50)
+    requests = [json.loads(line) for line in lines.decode().splitlines()]
+    assert [r["custom_id"] for r in requests] == ["0", "1"]
+    assert requests[1]["body"]["messages"][0]["content"] == "second"
+
+    def ok(custom_id, content):
+        return json.dumps({
+            "custom_id": custom_id,
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+            "error": None,
+        })
+
+    failed = json.dumps({"custom_id": "1", "response": None, "error": {"message": "boom"}})
+    output = "\n".join([failed, ok("2", " third "), ok("0", "one")])
+
+    assert _parse_batch_output(output, 3) == ["one", None, "third"]
+
+
+class PendingBatchClient:
+    """Fake OpenAI client whose batch never finishes."""
+
+    def __init__(self):
+        self.cancelled = []
+
+        async def create_file(**kwargs):
+            return SimpleNamespace(id="file-1")
+
+        async def create_batch(**kwargs):
+            return SimpleNamespace(id="batch-1", status="in_progress")
+
+        async def retrieve(batch_id):
+            return SimpleNamespace(id=batch_id, status="in_progress")
+
+        async def cancel(batch_id):
+            self.cancelled.append(batch_id)
+
+        self.files = SimpleNamespace(create=create_file)
+        self.batches = SimpleNamespace(create=create_batch, retrieve=retrieve, cancel=cancel)
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_cancels_batch_it_stops_waiting_for(monkeypatch):
+    from app.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "openai_batch_poll_interval_seconds", 0.01)
+    client = PendingBatchClient()
+
+    with pytest.raises(LLMException):
+        await submit_batch(["p"], model="gpt-4o", client=client, max_wait_seconds=0.05)
+    assert client.cancelled == ["batch-1"]
+
+    client = PendingBatchClient()
+    task = asyncio.ensure_future(submit_batch(["p"], model="gpt-4o", client=client))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client.cancelled == ["batch-1"]
@@ -0,0 +1,192 @@
+import pytest
+
+from app.celery_app import celery_app
+from app.services.celery_service import WorkerHeartbeatMonitor
+
+
+def test_heartbeat_monitor_tracks_workers():
+    monitor = WorkerHeartbeatMonitor(celery_app, ttl_seconds=30)
+    assert monitor.has_alive_worker() is False
+
+    monitor.on_heartbeat({"hostname": "worker-a@host", "active": 1, "processed": 10})
+    monitor.on_heartbeat({"hostname": "worker-b@host", "active": 0, "processed": 3})
+    assert monitor.has_alive_worker() is True
+    assert set(monitor.alive_workers()) == {"worker-a@host", "worker-b@host"}
+
+    monitor.on_offline({"hostname": "worker-a@host"})
+    assert set(monitor.alive_workers()) == {"worker-b@host"}
+
+
+def test_heartbeat_monitor_expires_stale_workers():
+    monitor = WorkerHeartbeatMonitor(celery_app, ttl_seconds=30)
+    monitor.on_heartbeat({"hostname": "worker-a@host"})
+
+    # Simulate a heartbeat older than the TTL
+    monitor._workers["worker-a@host"]["last_seen"] -= 60
+
+    assert monitor.has_alive_worker() is False
+    assert monitor.alive_workers() == {}
+
+
+def test_get_job_status_rejects_malformed_ids_without_backend(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    service = CeleryJobService()
+
+    def fail_lookup(job_id):
+        raise AssertionError("backend should not be queried")
+
+    monkeypatch.setattr(service.celery_app, "AsyncResult", fail_lookup)
+    monkeypatch.setattr(service.celery_app.backend, "get_task_meta", fail_lookup)
+
+    assert service.get_job_status("nonexistent-job-id") is None
+    assert service.cancel_job("nonexistent-job-id") is False
+
+
+def test_submitted_job_reports_pending_before_backend_record(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    service = CeleryJobService()
+    job_id = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+    monkeypatch.setattr(
+        service.celery_app.backend, "get_task_meta",
+        lambda _id: {"status": "PENDING", "result": None}
+    )
+
+    assert service.get_job_status(job_id) is None
+
+    # Another API process may create the job right after a miss
+    monkeypatch.setattr(
+        service.celery_app.backend, "get_task_meta",
+        lambda _id: {"status": "STARTED", "result": {"started_at": 0}}
+    )
+    assert service.get_job_status(job_id).status == "running"
+
+    monkeypatch.setattr(
+        service.celery_app.backend, "get_task_meta",
+        lambda _id: {"status": "PENDING", "result": None}
+    )
+    service._remember_submitted(job_id)
+    status = service.get_job_status(job_id)
+    assert status is not None
+    assert status.status == "pending"
+    assert status.created_at == service.pending_status(job_id).created_at
+
+
+def test_get_job_status_reads_task_meta_once(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    service = CeleryJobService()
+    lookups = []
+
+    def get_task_meta(job_id):
+        lookups.append(job_id)
+        return {"status": "PROGRESS", "result": {"current": 40, "started_at": 1704067200000}}
+
+    monkeypatch.setattr(service.celery_app.backend, "get_task_meta", get_task_meta)
+
+    status = service.get_job_status("1b4e28ba-2fa1-11d2-883f-0016d3cca427")
+    assert status.status == "running"
+    assert status.progress == 40
+    assert status.created_at.isoformat() == "2024-01-01T00:00:00+00:00"
+    assert len(lookups) == 1
+
+
+def test_get_job_stats_counts_inspected_tasks(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    class StubInspect:
+        def active(self):
+            return {"w1": [{"id": "a"}, {"id": "b"}]}
+
+        def scheduled(self):
+            return {"w1": []}
+
+        def reserved(self):
+            return {"w1": [{"id": "c"}]}
+
+        def stats(self):
+            return {"w1": {}}
+
+    service = CeleryJobService()
+    monkeypatch.setattr(service.celery_app.control, "inspect", lambda: StubInspect())
+
+    stats = service.get_job_stats()
+    assert stats["active_jobs"] == 2
+    assert stats["reserved_jobs"] == 1
+    assert stats["total_pending_jobs"] == 3
+
+
+@pytest.mark.parametrize("encode", [lambda r: r.model_dump(mode="json"), lambda r: r.model_dump_json()])
+def test_get_job_status_parses_stored_result(monkeypatch, encode):
+    from datetime import datetime, timezone
+    from app.models.schemas import GeneratedSample, GenerationResponse
+    from app.services.celery_service import CeleryJobService
+
+    sample = GeneratedSample(
+        id="s1", product="widget", prompt_version="v1", generated_at=datetime.now(timezone.utc),
+        text="hello", tokens_estimated=1, temperature=0.7
+    )
+    result = GenerationResponse(samples=[sample], total_samples=1, total_tokens_estimated=1)
+    service = CeleryJobService()
+    monkeypatch.setattr(
+        service.celery_app.backend, "get_task_meta",
+        lambda _id: {"status": "SUCCESS", "result": {"status": "SUCCESS", "result": encode(result)}}
+    )
+
+    status = service.get_job_status("1b4e28ba-2fa1-11d2-883f-0016d3cca427")
+    assert status.status == "completed"
+    assert status.result == result
+
+
+def test_get_job_status_caches_finished_jobs(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    service = CeleryJobService()
+    lookups = []
+
+    def get_task_meta(job_id):
+        lookups.append(job_id)
+        return {"status": "FAILURE", "result": ValueError("boom")}
+
+    monkeypatch.setattr(service.celery_app.backend, "get_task_meta", get_task_meta)
+
+    job_id = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+    first = service.get_job_status(job_id)
+    second = service.get_job_status(job_id)
+    assert first.status == "error"
+    assert first.error_message == "boom"
+    assert second is first
+    assert len(lookups) == 1
+
+
+def test_heartbeat_monitor_prunes_stale_workers_on_new_worker():
+    monitor = WorkerHeartbeatMonitor(celery_app, ttl_seconds=30)
+    monitor.on_heartbeat({"hostname": "worker-a@host"})
+    monitor._workers["worker-a@host"]["last_seen"] -= 60
+
+    monitor.on_heartbeat({"hostname": "worker-b@host"})
+    assert set(monitor._workers) == {"worker-b@host"}
+
+
+def test_get_job_statuses_uses_one_mget(monkeypatch):
+    from app.services.celery_service import CeleryJobService
+
+    service = CeleryJobService()
+    backend = service.celery_app.backend
+    running_id = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+    missing_id = "2c5f39cb-3fb2-11d2-883f-0016d3cca427"
+    mget_calls = []
+
+    def mget(keys):
+        mget_calls.append(keys)
+        return [backend.encode({"status": "PROGRESS", "result": {"current": 25}}), None]
+
+    monkeypatch.setattr(backend, "mget", mget)
+
+    statuses = service.get_job_statuses([running_id, missing_id, "not-a-uuid"])
+    assert statuses[running_id].progress == 25
+    assert statuses[missing_id] is None
+    assert statuses["not-a-uuid"] is None
+    assert len(mget_calls) == 1
+    assert len(mget_calls[0]) == 2
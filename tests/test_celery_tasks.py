@@ -0,0 +1,38 @@
+import threading
+import types
+
+from app.services.celery_tasks import ProgressReporter
+
+
+class StubTask:
+    def __init__(self):
+        self.request = types.SimpleNamespace(id="task-1")
+        self.updates = []
+        self.threads = set()
+
+    def update_state(self, task_id=None, state=None, meta=None):
+        self.threads.add(threading.current_thread().name)
+        self.updates.append((task_id, state, meta["current"]))
+
+
+def test_progress_reporter_writes_in_background_and_flushes_in_order():
+    task = StubTask()
+    reporter = ProgressReporter(task, min_interval=0)
+
+    for current in (10, 20, 30):
+        reporter.report({"current": current})
+    reporter.flush()
+
+    assert task.updates == [("task-1", "PROGRESS", 10), ("task-1", "PROGRESS", 20), ("task-1", "PROGRESS", 30)]
+    assert threading.current_thread().name not in task.threads
+
+
+def test_progress_reporter_coalesces_rapid_updates():
+    task = StubTask()
+    reporter = ProgressReporter(task, min_interval=60)
+
+    for current in (10, 10, 20, 30, 100):
+        reporter.report({"current": current, "total": 100})
+    reporter.flush()
+
+    assert [current for _, _, current in task.updates] == [10, 100]
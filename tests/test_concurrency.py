@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from app.utils.concurrency import AdaptiveConcurrency
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_grows_on_success_and_halves_on_429():
+    controller = AdaptiveConcurrency(initial_limit=4, max_limit=8, increase_every=2)
+
+    for _ in range(4):
+        await controller.report(True)
+    assert controller.limit == 6
+
+    await controller.report(False, 400)
+    assert controller.limit == 6
+
+    await controller.report(False, 429)
+    assert controller.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_caps_requests_in_flight():
+    controller = AdaptiveConcurrency(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with controller:
+            peak = max(peak, controller.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    assert peak == 2
+    assert controller.in_flight == 0
@@ -0,0 +1,86 @@
+import pytest
+
+from app.utils import llm_cache
+from app.utils.llm_cache import SemanticLLMCache
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_response_for_same_request(monkeypatch):
+    client = CountingClient()
+    monkeypatch.setattr(llm_cache, "get_llm_client", lambda: client)
+    cache = SemanticLLMCache(max_entries=10)
+
+    first = await cache.generate("prompt", namespace="paraphrase", key_text="seed")
+    second = await cache.generate("prompt", namespace="paraphrase", key_text="seed")
+    other = await cache.generate("prompt", namespace="alternative", key_text="seed")
+
+    assert first == second
+    assert other != first
+    assert client.calls == 2
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(monkeypatch):
+    client = CountingClient()
+    monkeypatch.setattr(llm_cache, "get_llm_client", lambda: client)
+    cache = SemanticLLMCache(max_entries=2)
+
+    await cache.generate("a", key_text="a")
+    await cache.generate("b", key_text="b")
+    await cache.generate("a", key_text="a")
+    await cache.generate("c", key_text="c")
+
+    assert len(cache) == 2
+    await cache.generate("b", key_text="b")
+    assert client.calls == 4
+
+
+class Vector:
+    def __init__(self, value):
+        self.value = value
+
+    def __matmul__(self, other):
+        return 1.0 if self.value == other.value else 0.0
+
+
+@pytest.mark.asyncio
+async def test_semantic_lookup_scans_only_recent_entries(monkeypatch):
+    client = CountingClient()
+    monkeypatch.setattr(llm_cache, "get_llm_client", lambda: client)
+    monkeypatch.setattr(llm_cache, "embed_texts", lambda texts: [Vector(texts[0].split()[0])])
+    cache = SemanticLLMCache(max_entries=10, semantic_scan_limit=2)
+
+    await cache.generate("x", key_text="old one")
+    await cache.generate("x", key_text="new one")
+    await cache.generate("x", key_text="other one")
+
+    await cache.generate("x", key_text="new two")
+    assert cache.hits == 1
+    await cache.generate("x", key_text="old two")
+    assert cache.hits == 1
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_non_semantic_lookup_only_reuses_exact_key(monkeypatch):
+    client = CountingClient()
+    monkeypatch.setattr(llm_cache, "get_llm_client", lambda: client)
+    monkeypatch.setattr(llm_cache, "embed_texts", lambda texts: [Vector("same")])
+    cache = SemanticLLMCache(max_entries=10)
+
+    await cache.generate("x", key_text="battery life is great", semantic=False)
+    await cache.generate("x", key_text="battery life is terrible", semantic=False)
+    await cache.generate("x", key_text="battery life is great", semantic=False)
+
+    assert client.calls == 2
+    assert cache.hits == 1
@@ -0,0 +1,31 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_openai_client_is_shared_per_event_loop(monkeypatch):
+    from app.config import get_settings
+    from app.utils.llm_client import OpenAIClient, close_llm_clients, get_llm_client
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+
+    client = get_llm_client("openai")
+    assert isinstance(client, OpenAIClient)
+    assert get_llm_client("openai") is client
+
+    await close_llm_clients()
+    assert get_llm_client("openai") is not client
+    await close_llm_clients()
+
+
+def test_openai_client_outside_event_loop_is_reused(monkeypatch):
+    from app.config import get_settings
+    from app.utils import llm_client
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    monkeypatch.setattr(llm_client, "_fallback_openai_client", None)
+
+    client = llm_client.get_llm_client("openai")
+    assert llm_client.get_llm_client("openai") is client
+    assert client not in llm_client._shared_openai_clients.values()
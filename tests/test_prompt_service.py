@@ -0,0 +1,134 @@
+import os
+
+from app.services.prompt_service import PromptConfig, PromptTemplateService
+
+
+def test_list_templates_refreshes_when_directory_changes(tmp_path):
+    (tmp_path / "a.j2").write_text("A {{ product }}")
+    (tmp_path / "notes.txt").write_text("ignored")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+
+    assert service.list_templates() == ["a.j2"]
+
+    (tmp_path / "b.j2").write_text("B {{ product }}")
+    # Force a visible mtime change on filesystems with coarse timestamps
+    stat = tmp_path.stat()
+    os.utime(tmp_path, (stat.st_atime, stat.st_mtime + 1))
+
+    assert sorted(service.list_templates()) == ["a.j2", "b.j2"]
+
+
+def test_default_few_shot_examples_are_built_once_per_product():
+    service = PromptTemplateService()
+
+    first = service.get_default_few_shot_examples("support_request.j2", "widget")
+    second = service.get_default_few_shot_examples("support_request.j2", "widget")
+
+    assert len(first) == 3
+    assert all(a is b for a, b in zip(first, second))
+    assert "widget" in first[0].expected_output
+    assert service.get_default_few_shot_examples("unknown.j2", "widget") == []
+    for template_name in service.list_templates():
+        assert all(
+            "widget" in example.expected_output
+            for example in service.get_default_few_shot_examples(template_name, "widget")
+        )
+
+
+def test_render_template_reuses_identical_renders(tmp_path):
+    (tmp_path / "a.j2").write_text("{{ product }}: {{ tags|join(', ') }}")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+    service.env.auto_reload = False
+
+    first = service.render_template("a.j2", {"product": "widget", "tags": ["x", "y"]})
+    assert first == "widget: x, y"
+    assert len(service._render_cache) == 1
+
+    assert service.render_template("a.j2", {"product": "widget", "tags": ["x", "y"]}) == first
+    assert len(service._render_cache) == 1
+
+    service.render_template("a.j2", {"product": "gadget", "tags": ["x"], "extra": {"nested": {1, 2}}})
+    assert len(service._render_cache) == 2
+
+    class Opaque:
+        __hash__ = None
+
+        def __str__(self):
+            return "opaque"
+
+    assert service.render_template("a.j2", {"product": Opaque(), "tags": []}) == "opaque:"
+    assert len(service._render_cache) == 2
+
+
+def test_render_cache_keeps_equal_values_of_different_types_apart(tmp_path):
+    (tmp_path / "items.j2").write_text("{{ items }}")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+    service.env.auto_reload = False
+
+    assert service.render_template("items.j2", {"items": 1}) == "1"
+    assert service.render_template("items.j2", {"items": True}) == "True"
+    assert service.render_template("items.j2", {"items": 1.0}) == "1.0"
+    assert service.render_template("items.j2", {"items": [1, 2]}) == "[1, 2]"
+    assert service.render_template("items.j2", {"items": (1, 2)}) == "(1, 2)"
+    assert service.render_template("items.j2", {"items": {"a": 1}}) == "{'a': 1}"
+    assert service.render_template("items.j2", {"items": [("a", 1)]}) == "[('a', 1)]"
+
+
+def test_validate_template_reparses_only_after_the_file_changes(tmp_path, monkeypatch):
+    template = tmp_path / "a.j2"
+    template.write_text("{{ product }} {{ tone }}")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+
+    parses = []
+    original_parse = service.env.parse
+    monkeypatch.setattr(service.env, "parse", lambda source: parses.append(source) or original_parse(source))
+
+    assert service.validate_template("a.j2") == {"valid": True, "variables": ["product", "tone"], "error": None}
+    assert service.validate_template("a.j2")["variables"] == ["product", "tone"]
+    assert len(parses) == 1
+
+    template.write_text("{{ product }}")
+    stat = template.stat()
+    os.utime(template, (stat.st_atime, stat.st_mtime + 1))
+
+    assert service.validate_template("a.j2")["variables"] == ["product"]
+    assert len(parses) == 2
+    assert service.validate_template("missing.j2")["valid"] is False
+
+
+def test_render_many_matches_individual_renders(tmp_path):
+    (tmp_path / "a.j2").write_text("{{ product }} {{ version }}\n")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+    contexts = [{"product": "widget"}, {"product": "gadget", "version": "v2"}]
+
+    assert service.render_many("a.j2", contexts) == ["widget v1", "gadget v2"]
+    assert service.render_many("a.j2", contexts) == [
+        service.render_template("a.j2", context, use_cache=False) for context in contexts
+    ]
+    assert service.render_many("a.j2", []) == []
+
+
+def test_enhanced_prompt_skips_features_the_template_does_not_read(tmp_path):
+    (tmp_path / "plain.j2").write_text("About {{ product }}")
+    (tmp_path / "toned.j2").write_text("About {{ product }} in a {{ tone }} tone")
+    service = PromptTemplateService(template_dir=str(tmp_path))
+    service.env.auto_reload = False
+
+    for tone in ("polite", "urgent"):
+        config = PromptConfig(template_name="plain.j2", context={"product": "widget"}, tone=tone, sentiment_intensity=2)
+        assert service.render_enhanced_prompt(config) == "About widget"
+    assert len(service._render_cache) == 1
+
+    config = PromptConfig(template_name="toned.j2", context={"product": "widget"}, tone="urgent")
+    assert service.render_enhanced_prompt(config) == "About widget in a urgent tone"
+
+
+def test_render_prompt_version_argument_overrides_context(tmp_path, monkeypatch):
+    from app.services import prompt_service
+
+    (tmp_path / "v.j2").write_text("{{ version }}")
+    monkeypatch.setattr(prompt_service, "_template_service", PromptTemplateService(template_dir=str(tmp_path)))
+
+    assert prompt_service.render_prompt("v.j2", {}) == "v1"
+    assert prompt_service.render_prompt("v.j2", {"version": "v0"}) == "v1"
+    assert prompt_service.render_prompt("v.j2", {"version": "v0"}, version="v2") == "v2"
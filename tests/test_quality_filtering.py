@@ -3,7 +3,7 @@ import pytest
 from datetime import datetime, timezone
 
 from app.models.schemas import GeneratedSample
-from app.services.quality_service import QualityFilterService, QualityFilterConfig
+from app.services.quality_service import QualityFilterService, QualityFilterConfig, TextDeduplicator
 
 
 @pytest.mark.asyncio
@@ -40,3 +40,208 @@ async def test_quality_filtering_pass_and_fail(monkeypatch):
     stats = service.get_filter_stats()
     assert stats["total_processed"] == 2
     assert stats["passed_filter"] >= 1
+
+
+def test_deduplicator_semantic_check_matches_full_jaccard_scan():
+    dedup = TextDeduplicator(similarity_threshold=0.8)
+    base = " ".join(f"word{i}" for i in range(20))
+    dedup.add_text(base)
+    dedup.add_text("completely unrelated text about something else entirely")
+
+    # 19 of 20 words shared with one extra: Jaccard 19/21 ~= 0.905
+    near = base.replace("word7", "other")
+    assert dedup.is_duplicate(near) == (True, "semantic_similarity")
+
+    # 15 of 20 words shared: Jaccard 15/25 = 0.6
+    far = " ".join(f"word{i}" for i in range(15)) + " a b c d e"
+    assert dedup.is_duplicate(far) == (False, "")
+    assert dedup.is_duplicate("") == (False, "")
+
+
+@pytest.mark.asyncio
+async def test_filter_samples_scores_concurrently_and_keeps_sequential_outcome(monkeypatch):
+    text = "This is a sufficiently long and coherent sample text about the widget product that should pass basic length checks."
+    texts = [text, f"{text} Extra", text, "Another entirely different but still long enough sample text about the widget today."]
+    samples = [
+        GeneratedSample(
+            id=f"s{i}",
+            product="widget",
+            prompt_version="v1",
+            generated_at=datetime.now(timezone.utc),
+            text=sample_text,
+            tokens_estimated=100,
+            temperature=0.7,
+        )
+        for i, sample_text in enumerate(texts)
+    ]
+    service = QualityFilterService(QualityFilterConfig(min_overall_score=0.3, max_scoring_concurrency=2, coherence_batch_size=1))
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_coherence(text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 0.9
+
+    monkeypatch.setattr(service.scorer, "_score_coherence", slow_coherence)
+
+    filtered, metrics = await service.filter_samples(samples)
+
+    assert [s.id for s in filtered] == ["s0", "s3"]
+    assert len(metrics) == 2
+    assert peak == 2
+    stats = service.get_filter_stats()
+    assert stats["passed_filter"] == 2
+    assert stats["failed_duplicate"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coherence_score_is_cached_per_text(monkeypatch):
+    import app.services.quality_service as quality_service
+
+    calls = []
+
+    class FakeClient:
+        async def generate(self, prompt, **kwargs):
+            calls.append(prompt)
+            return "0.9"
+
+    monkeypatch.setattr(quality_service, "get_llm_client", lambda: FakeClient())
+    scorer = quality_service.QualityScorer()
+
+    assert await scorer._score_coherence("Some text.") == 0.9
+    assert await scorer._score_coherence("Some text.") == 0.9
+    assert len(calls) == 1
+
+    assert await scorer._score_coherence("Other text.") == 0.9
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_coherence_batch_rates_uncached_texts_in_one_call(monkeypatch):
+    import app.services.quality_service as quality_service
+
+    prompts = []
+
+    class FakeClient:
+        async def generate(self, prompt, **kwargs):
+            prompts.append(prompt)
+            return "[0.9, 1.5]" if len(prompts) == 1 else "Scores: 0.4"
+
+    monkeypatch.setattr(quality_service, "get_llm_client", lambda: FakeClient())
+    scorer = quality_service.QualityScorer()
+
+    assert await scorer.score_coherence_batch(["One.", "Two.", "One."]) == [0.9, 1.0, 0.9]
+    assert len(prompts) == 1
+
+    # Cached texts are not re-sent; a short reply is padded with the default
+    assert await scorer.score_coherence_batch(["Two.", "Three.", "Four."]) == [1.0, 0.4, 0.7]
+    assert len(prompts) == 2
+    assert '"Two."' not in prompts[1]
+
+    # A padded default is not cached, so the text is rated again next time
+    assert await scorer.score_coherence_batch(["Four."]) == [0.4]
+    assert len(prompts) == 3
+
+
+def test_deduplicator_rejects_identical_text_without_normalizing(monkeypatch):
+    dedup = TextDeduplicator()
+    text = "The Widget works, mostly."
+    dedup.add_text(text)
+    dedup.add_text("Something else entirely.")
+
+    def fail_normalize(text):
+        raise AssertionError("normalized an identical text")
+
+    monkeypatch.setattr(dedup, "normalize_text", fail_normalize)
+    assert dedup.is_duplicate(text) == (True, "exact_duplicate")
+
+    monkeypatch.undo()
+    assert dedup.is_duplicate("the widget works mostly") == (True, "exact_duplicate")
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_resets_quality_state_per_batch(monkeypatch):
+    from app.models.schemas import GenerationRequest
+    from app.services.generation_service import GenerationService
+    from app.services.quality_service import get_quality_service, reset_quality_service
+
+    text = "This is a sufficiently long and coherent sample text about the widget product that should pass basic length checks."
+
+    async def fake_stream(self, request, *args, **kwargs):
+        for i in range(request.count):
+            yield GeneratedSample(
+                id=f"s{i}",
+                product=request.product,
+                prompt_version="v1",
+                generated_at=datetime.now(timezone.utc),
+                text=text,
+                tokens_estimated=100,
+                temperature=0.7,
+            )
+
+    async def coherence(self, text):
+        return 0.9
+
+    reset_quality_service()
+    get_quality_service(QualityFilterConfig(min_overall_score=0.3))
+    monkeypatch.setattr(GenerationService, "stream_batch", fake_stream)
+    monkeypatch.setattr("app.services.quality_service.QualityScorer._score_coherence", coherence)
+    service = GenerationService()
+    request = GenerationRequest(product="widget", count=2)
+
+    try:
+        for _ in range(2):
+            response = await service.generate_batch(request)
+            # The repeat within a batch is a duplicate; the earlier batch's sample is not
+            assert [s.id for s in response.samples] == ["s0"]
+            assert get_quality_service().get_filter_stats()["total_processed"] == 2
+    finally:
+        reset_quality_service()
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_rates_coherence_in_chunks(monkeypatch):
+    from app.models.schemas import GenerationRequest
+    from app.services.generation_service import GenerationService
+    from app.services.quality_service import get_quality_service, reset_quality_service
+
+    async def fake_stream(self, request, *args, **kwargs):
+        for i in range(request.count):
+            yield GeneratedSample(
+                id=f"s{i}",
+                product=request.product,
+                prompt_version="v1",
+                generated_at=datetime.now(timezone.utc),
+                text=f"Sample number {i} is a sufficiently long and coherent text about the widget product {'x' * i}.",
+                tokens_estimated=100,
+                temperature=0.7,
+            )
+
+    batches = []
+
+    async def coherence_batch(self, texts):
+        batches.append(len(texts))
+        return [0.9] * len(texts)
+
+    async def single_coherence(self, text):
+        raise AssertionError("coherence should be rated in batches")
+
+    reset_quality_service()
+    get_quality_service(QualityFilterConfig(min_overall_score=0.3, coherence_batch_size=3))
+    monkeypatch.setattr(GenerationService, "stream_batch", fake_stream)
+    monkeypatch.setattr("app.services.quality_service.QualityScorer.score_coherence_batch", coherence_batch)
+    monkeypatch.setattr("app.services.quality_service.QualityScorer._score_coherence", single_coherence)
+
+    try:
+        response = await GenerationService().generate_batch(GenerationRequest(product="widget", count=7))
+    finally:
+        reset_quality_service()
+
+    assert sorted(batches) == [1, 3, 3]
+    assert sorted(s.id for s in response.samples) == [f"s{i}" for i in range(7)]
+    assert response.total_tokens_estimated == 700
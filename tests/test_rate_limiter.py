@@ -1,7 +1,7 @@
 import asyncio
 import pytest
 
-from app.services.rate_limiting_service import RateLimitManager, RateLimitType
+from app.services.rate_limiting_service import RateLimitManager, RateLimitType, TokenBucket
 
 
 @pytest.mark.asyncio
@@ -32,3 +32,17 @@ def test_update_rate_limits_from_headers():
     info_tpm = rlm.get_rate_limit_info(RateLimitType.TOKENS_PER_MINUTE)
     assert info_rpm is not None and info_rpm.limit == 60
     assert info_tpm is not None and info_tpm.limit == 40000
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire_waits_for_refill():
+    bucket = TokenBucket(capacity=2, refill_rate=100.0)
+
+    await bucket.acquire(2)
+    start = asyncio.get_running_loop().time()
+    await bucket.acquire(1)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # One token refills in ~10ms; acquire sleeps for it rather than failing
+    assert 0.005 <= elapsed < 0.5
+    assert bucket.tokens < 1
@@ -1,4 +1,6 @@
-from app.utils.token_utils import estimate_tokens, estimate_completion_cost, estimate_request_cost
+import pytest
+
+from app.utils.token_utils import estimate_tokens, estimate_completion_cost, estimate_request_cost, tokens_within_limit
 from app.config import get_settings
 
 
@@ -25,3 +27,32 @@ def test_estimate_completion_cost_and_request_cost(monkeypatch):
     pt, total_cost = estimate_request_cost("some prompt text", expected_completion_tokens=50)
     assert isinstance(pt, int)
     assert total_cost >= 0.0
+
+
+def test_tokens_within_limit_stops_at_bound():
+    text = "\n".join(["some words on a line"] * 100)
+
+    within = tokens_within_limit(text, 100000, model="gpt-4")
+    assert within is not None and within >= 100
+
+    assert tokens_within_limit(text, 10, model="gpt-4") is None
+
+
+def test_estimate_tokens_falls_back_when_encoding_cannot_load(monkeypatch):
+    pytest.importorskip("tiktoken")
+    from app.utils import token_utils
+
+    def offline(name):
+        raise ConnectionError("no network")
+
+    monkeypatch.setattr(token_utils, "_encodings", {})
+    monkeypatch.setattr(token_utils, "_encoding_retry_at", {})
+    monkeypatch.setattr(token_utils.tiktoken, "get_encoding", offline)
+
+    assert estimate_tokens("hello world", model="my-custom-model") == len("hello world") // 4
+    assert "my-custom-model" not in token_utils._encodings
+
+    # A failed load is retried once the backoff has passed
+    monkeypatch.setitem(token_utils._encoding_retry_at, "my-custom-model", 0.0)
+    monkeypatch.setattr(token_utils.tiktoken, "get_encoding", lambda name: "encoding")
+    assert token_utils._get_encoding("my-custom-model") == "encoding"